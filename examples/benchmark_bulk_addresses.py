@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Compare bulk address conversion with per-row Address objects.
+
+Parses a synthetic lease column with `Address(str)` per line and with
+`parse_many()`, then formats it back with `str(Address(int))` and
+`format_many()`.
+
+Usage:
+    python examples/benchmark_bulk_addresses.py [rows]
+"""
+
+import sys
+import timeit
+
+from typing import List
+
+from jsktoolbox.netaddresstool import Address, format_many, parse_many
+
+
+def main() -> None:
+    """Run the benchmark and print per-row timings."""
+    rows: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    lines: List[str] = [
+        f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}\n" for i in range(rows)
+    ]
+    values = parse_many(lines).values
+    cases = (
+        (
+            "parse",
+            lambda: [int(Address(x.strip())) for x in lines],
+            lambda: parse_many(lines),
+        ),
+        (
+            "format",
+            lambda: [str(Address(x)) for x in values],
+            lambda: format_many(values),
+        ),
+    )
+    print(f"{'operation':<12}{'Address [us]':>14}{'bulk [us]':>14}")
+    for label, before, after in cases:
+        t_before = min(timeit.repeat(before, number=1, repeat=3))
+        t_after = min(timeit.repeat(after, number=1, repeat=3))
+        print(f"{label:<12}{t_before / rows * 1e6:>14.3f}{t_after / rows * 1e6:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
+
+# #[EOF]#######################################################################
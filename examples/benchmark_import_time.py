@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Measure import cost of jsktoolbox public entry points.
+
+Each entry point is imported in fresh interpreters started with
+`python -X importtime`, once bare and once with every name in `__all__`
+resolved; the fastest of five runs is kept. The summed cost of the top-level imports (interpreter startup
+excluded) and the most expensive third-party/stdlib imports are printed.
+Entry points that fail because an optional dependency is missing are
+reported as such.
+
+Usage:
+    python examples/benchmark_import_time.py [module ...]
+"""
+
+import os
+import subprocess
+import sys
+
+from typing import Dict, List, Optional, Set, Tuple
+
+MODULES: Tuple[str, ...] = (
+    "jsktoolbox",
+    "jsktoolbox.attribtool",
+    "jsktoolbox.raisetool",
+    "jsktoolbox.basetool",
+    "jsktoolbox.configtool",
+    "jsktoolbox.datetool",
+    "jsktoolbox.devices",
+    "jsktoolbox.edmctool",
+    "jsktoolbox.libs.interfaces",
+    "jsktoolbox.logstool",
+    "jsktoolbox.netaddresstool",
+    "jsktoolbox.nettool",
+    "jsktoolbox.stringtool",
+    "jsktoolbox.systemtool",
+    "jsktoolbox.tktool",
+)
+
+
+def import_time(code: str) -> Tuple[bool, List[Tuple[int, int, str]]]:
+    """Run code in a child interpreter started with `-X importtime`.
+
+    ### Arguments:
+    * code: str - Python source passed to `-c`.
+
+    ### Returns:
+    [Tuple[bool, List[Tuple[int, int, str]]]] - Success flag and every
+    import as `(cumulative_us, depth, name)`; depth 0 is top-level.
+    """
+    env: Dict[str, str] = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (os.getcwd(), env.get("PYTHONPATH")))
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    rows: List[Tuple[int, int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts: List[str] = line[len("import time:") :].split("|")
+        if not parts[1].strip().isdigit():
+            continue
+        name: str = parts[2].rstrip()
+        depth: int = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(parts[1]), depth, name.strip()))
+    return proc.returncode == 0, rows
+
+
+def measure(
+    code: str, startup: Set[str], repeat: int = 5
+) -> Tuple[Optional[int], List[str]]:
+    """Return the import cost of code, excluding interpreter startup.
+
+    ### Arguments:
+    * code: str - Python source passed to `-c`.
+    * startup: Set[str] - Modules imported by a bare interpreter.
+    * repeat: int - Number of runs; the fastest one is reported.
+
+    ### Returns:
+    [Tuple[Optional[int], List[str]]] - Total microseconds (None when the
+    code failed) and the three most expensive non-jsktoolbox imports.
+    """
+    runs: List[Tuple[int, bool, List[Tuple[int, int, str]]]] = []
+    for _ in range(repeat):
+        ok, rows = import_time(code)
+        rows = [row for row in rows if row[2] not in startup]
+        runs.append((sum(us for us, depth, _ in rows if depth == 0), ok, rows))
+    total, ok, rows = min(runs)
+    heavy: List[str] = []
+    for us, _, name in sorted(rows, reverse=True):
+        if name.startswith("jsktoolbox") or name.split(".")[0] in {
+            item.split()[0].split(".")[0] for item in heavy
+        }:
+            continue
+        heavy.append(f"{name} {us / 1000:.1f}")
+        if len(heavy) == 3:
+            break
+    if not ok:
+        return None, heavy
+    return total, heavy
+
+
+def main() -> None:
+    """Print import time per entry point with its heaviest dependencies.
+
+    `module` rows import the module only; `module[*]` rows also resolve
+    every name listed in its `__all__`, loading lazy exports.
+    """
+    modules: List[str] = sys.argv[1:] or list(MODULES)
+    startup: Set[str] = {name for _, _, name in import_time("pass")[1]}
+    print(f"{'entry point':<32}{'import [ms]':>12}  heaviest imports [ms]")
+    for module in modules:
+        for label, code in (
+            (module, f"import {module}"),
+            (
+                f"{module}[*]",
+                f"import {module} as m\n"
+                "for n in getattr(m, '__all__', ()): getattr(m, n)",
+            ),
+        ):
+            total, heavy = measure(code, startup)
+            shown: str = "failed" if total is None else f"{total / 1000:.1f}"
+            print(f"{label:<32}{shown:>12}  {', '.join(heavy)}")
+
+
+if __name__ == "__main__":
+    main()
+
+# #[EOF]#######################################################################
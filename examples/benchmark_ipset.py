@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Measure `IPSet` aggregation and membership on a firewall-sized list.
+
+Aggregation is checked against `ipaddress.collapse_addresses()`; membership
+is compared with testing the address against every network of the list.
+
+Usage:
+    python examples/benchmark_ipset.py [networks] [lookups]
+"""
+
+import ipaddress
+import random
+import sys
+import time
+
+from typing import List
+
+from jsktoolbox.netaddresstool import Address, IPSet, Network
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    lookups: int = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rnd = random.Random(0)
+    networks: List[Network] = [
+        Network([Address(rnd.getrandbits(32)), rnd.randint(8, 32)])
+        for _ in range(count)
+    ]
+    addresses: List[int] = [rnd.getrandbits(32) for _ in range(lookups)]
+
+    start: float = time.perf_counter()
+    ipset = IPSet(networks)
+    collapsed: List[Network] = ipset.collapse()
+    own: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = list(
+        ipaddress.collapse_addresses(
+            ipaddress.IPv4Network(str(net), strict=False) for net in networks
+        )
+    )
+    stdlib: float = time.perf_counter() - start
+    assert [str(net) for net in collapsed] == [str(net) for net in expected]
+
+    start = time.perf_counter()
+    linear_hits = [
+        any(int(net.network) <= addr <= int(net.broadcast) for net in networks)
+        for addr in addresses
+    ]
+    linear: float = (time.perf_counter() - start) / lookups
+
+    start = time.perf_counter()
+    set_hits = [addr in ipset for addr in addresses]
+    bisect: float = (time.perf_counter() - start) / lookups
+    assert linear_hits == set_hits
+
+    print(
+        f"networks: {count}, intervals: {len(ipset.intervals)}, cidrs: {len(collapsed)}"
+    )
+    print(f"{'IPSet collapse [ms]':<24}{own * 1e3:>12.1f}")
+    print(f"{'ipaddress collapse [ms]':<24}{stdlib * 1e3:>12.1f}")
+    print(f"{'linear lookup [us]':<24}{linear * 1e6:>12.1f}")
+    print(f"{'IPSet lookup [us]':<24}{bisect * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
+
+# #[EOF]#######################################################################
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Measure per-record formatting cost of logstool formatters.
+
+Compares the compiled `BLogFormatter.format()` against the previous
+implementation, which walked the forms list for every record and called
+`strftime` on each message.
+
+Usage:
+    python examples/benchmark_log_formatters.py [records]
+"""
+
+import sys
+import timeit
+
+from datetime import datetime
+from typing import Any, List, Optional
+
+from jsktoolbox.logstool import (
+    LogFormatterDateTime,
+    LogFormatterNull,
+    LogFormatterTime,
+)
+
+
+def legacy_format(forms: List[Any], message: str, name: Optional[str] = None) -> str:
+    """Render a record the way `BLogFormatter.format()` did before compilation."""
+    out: str = ""
+    for item in forms:
+        if callable(item):
+            out += f"{item()} "
+        elif isinstance(item, str):
+            if name is None:
+                if item.find("name") == -1:
+                    out += item.format(message=f"{message}")
+            else:
+                if item.find("name") > 0:
+                    out += item.format(name=f"{name}", message=f"{message}")
+    return out
+
+
+def legacy_forms(formatter_cls: type) -> List[Any]:
+    """Return forms equivalent to the legacy formatter definition."""
+    forms: List[Any] = []
+    if formatter_cls is LogFormatterDateTime:
+        forms.append(lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    elif formatter_cls is LogFormatterTime:
+        forms.append(lambda: datetime.now().strftime("%H:%M:%S"))
+    forms.append("{message}")
+    forms.append("[{name}]: {message}")
+    return forms
+
+
+def main() -> None:
+    """Run the benchmark and print per-record timings."""
+    records: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{'formatter':<24}{'name':<8}{'before [us]':>14}{'after [us]':>14}")
+    for formatter_cls in (LogFormatterNull, LogFormatterTime, LogFormatterDateTime):
+        formatter = formatter_cls()
+        forms = legacy_forms(formatter_cls)
+        for name in (None, "app"):
+            before = min(
+                timeit.repeat(
+                    lambda: legacy_format(forms, "payload", name),
+                    number=records,
+                    repeat=3,
+                )
+            )
+            after = min(
+                timeit.repeat(
+                    lambda: formatter.format("payload", name),
+                    number=records,
+                    repeat=3,
+                )
+            )
+            print(
+                f"{formatter_cls.__name__:<24}{str(name):<8}"
+                f"{before / records * 1e6:>14.3f}{after / records * 1e6:>14.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
+
+# #[EOF]#######################################################################
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Compare `PrefixTrie.longest_match()` with a linear prefix scan.
+
+The scan mirrors the previous approach: compare the address with the
+range of every prefix, building `Address` objects on each call, and keep
+the longest match.
+
+Usage:
+    python examples/benchmark_prefix_trie.py [prefixes] [lookups]
+"""
+
+import random
+import sys
+import time
+
+from typing import List, Optional
+
+from jsktoolbox.netaddresstool import Address, Network
+from jsktoolbox.netaddresstool.trie import PrefixTrie
+
+
+def linear_match(networks: List[Network], address: Address) -> Optional[Network]:
+    """Return the longest prefix containing the address by scanning all prefixes."""
+    best: Optional[Network] = None
+    for net in networks:
+        if net.network <= address <= net.broadcast:
+            if best is None or int(net.mask) > int(best.mask):
+                best = net
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print per-lookup timings."""
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    lookups: int = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rnd = random.Random(0)
+    networks: List[Network] = [
+        Network([Address(rnd.getrandbits(32)), rnd.randint(8, 30)])
+        for _ in range(count)
+    ]
+    addresses: List[Address] = [
+        Address(int(rnd.choice(networks).network) + rnd.getrandbits(2))
+        for _ in range(lookups)
+    ]
+
+    start: float = time.perf_counter()
+    trie = PrefixTrie()
+    for idx, net in enumerate(networks):
+        trie[net] = idx
+    build: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [linear_match(networks, addr) for addr in addresses]
+    linear: float = (time.perf_counter() - start) / lookups
+
+    start = time.perf_counter()
+    found = [trie.longest_match(addr) for addr in addresses]
+    radix: float = (time.perf_counter() - start) / lookups
+
+    assert [str(x) for x in expected] == [str(x[0]) if x else "None" for x in found]
+    print(f"prefixes: {count}, stored: {len(trie)}, build: {build:.2f} s")
+    print(f"{'linear scan [us]':<20}{linear * 1e6:>12.1f}")
+    print(f"{'PrefixTrie [us]':<20}{radix * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
+
+# #[EOF]#######################################################################
@@ -10,7 +10,22 @@ new attributes at runtime. Inspired by recipes from *Python Cookbook*
 (2004, Martelli et al.).
 """
 
-from typing import Any, Callable
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+
+def _declared_names(cls: type) -> FrozenSet[str]:
+    """Collect attribute names declared on a class and its bases.
+
+    Class attributes, properties and `__slots__` descriptors all appear in the
+    class namespaces, so one pass over the MRO finds every declaration.
+
+    ### Arguments:
+    * cls: type - Class to inspect.
+
+    ### Returns:
+    [FrozenSet[str]] - Names (mangled where applicable) known at call time.
+    """
+    return frozenset(name for klass in cls.__mro__ for name in vars(klass))
 
 
 def _no_new_attributes(
@@ -25,6 +40,8 @@ def _no_new_attributes(
     [Callable[[Any, str, Any], None]] - Closure enforcing attribute existence before assignment.
     """
 
+    declared: Dict[type, FrozenSet[str]] = {}
+
     def __setattr__(self, name: str, value: Any) -> None:
         """Delegate to the original setter when the attribute exists.
 
@@ -34,7 +51,11 @@ def _no_new_attributes(
         * name: str - Attribute name to assign.
         * value: Any - Value destined for the attribute.
         """
-        if hasattr(self, name):
+        cls: type = type(self)
+        names: Optional[FrozenSet[str]] = declared.get(cls)
+        if names is None:
+            names = declared[cls] = _declared_names(cls)
+        if name in names or hasattr(self, name):
             wrapped_setattr(self, name, value)
         else:
             raise AttributeError(
@@ -67,16 +88,31 @@ class NoDynamicAttributes:
 
     ### Purpose:
     Ensures all attributes must be declared up-front; runtime additions raise
-    AttributeError.
+    AttributeError. Class attributes and `__slots__` entries both count as
+    declarations. Declared names are collected once per class, so a write is
+    a single set lookup; other names fall back to `hasattr`.
     """
 
+    __slots__ = ()
+
+    __declared: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Cache the names declared by the new class."""
+        super().__init_subclass__(**kwargs)
+        type.__setattr__(cls, "_NoDynamicAttributes__declared", _declared_names(cls))
+
     def __setattr__(self, name: str, value: Any) -> None:
         """Prevent dynamic attribute assignment on instances.
 
         ### Raises:
         * AttributeError: Attribute not previously declared.
         """
-        if not hasattr(self, name):
+        if (
+            name not in self.__declared
+            and not hasattr(type(self), name)
+            and not hasattr(self, name)
+        ):
             raise AttributeError(
                 f"Cannot add new attribute '{name}' to {self.__class__.__name__} object"
             )
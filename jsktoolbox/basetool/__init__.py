@@ -15,27 +15,51 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from .classes import BClasses as BClasses
     from .data import BData as BData
+    from .data import BDataValidationKeys as BDataValidationKeys
     from .logs import BLogFormatter as BLogFormatter
     from .logs import BLoggerEngine as BLoggerEngine
     from .logs import BLoggerQueue as BLoggerQueue
+    from .pool import ThPool as ThPool
+    from .pool import ThPoolStatsKeys as ThPoolStatsKeys
+    from .pool import ThPoolWorker as ThPoolWorker
+    from .scheduler import SchedulerJob as SchedulerJob
+    from .scheduler import ThScheduler as ThScheduler
     from .threads import ThBaseObject as ThBaseObject
+    from .views import DictView as DictView
+    from .views import ListView as ListView
 
 __all__ = [
     "BClasses",
     "BData",
+    "BDataValidationKeys",
     "BLogFormatter",
     "BLoggerEngine",
     "BLoggerQueue",
+    "DictView",
+    "ListView",
+    "SchedulerJob",
     "ThBaseObject",
+    "ThPool",
+    "ThPoolStatsKeys",
+    "ThPoolWorker",
+    "ThScheduler",
 ]
 
 _EXPORT_MAP = {
     "BClasses": ("classes", "BClasses"),
     "BData": ("data", "BData"),
+    "BDataValidationKeys": ("data", "BDataValidationKeys"),
     "BLogFormatter": ("logs", "BLogFormatter"),
     "BLoggerEngine": ("logs", "BLoggerEngine"),
     "BLoggerQueue": ("logs", "BLoggerQueue"),
+    "SchedulerJob": ("scheduler", "SchedulerJob"),
+    "DictView": ("views", "DictView"),
+    "ListView": ("views", "ListView"),
     "ThBaseObject": ("threads", "ThBaseObject"),
+    "ThPool": ("pool", "ThPool"),
+    "ThPoolStatsKeys": ("pool", "ThPoolStatsKeys"),
+    "ThPoolWorker": ("pool", "ThPoolWorker"),
+    "ThScheduler": ("scheduler", "ThScheduler"),
 }
 
 
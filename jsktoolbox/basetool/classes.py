@@ -19,6 +19,8 @@ from ..attribtool import NoDynamicAttributes
 class BClasses(NoDynamicAttributes):
     """Base mixin exposing class and frame metadata helpers."""
 
+    __slots__ = ()
+
     @property
     def _c_name(self) -> str:
         """Return the name of the current class.
@@ -10,127 +10,424 @@ constraints, reliable copying, and lifecycle utilities for managed state.
 """
 
 import copy
+import os
 import warnings
 import sys
 
 from inspect import currentframe
-from typing import Dict, List, Any, Optional, Type, Union, get_origin, get_args
-
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_origin,
+    get_args,
+)
+
+from ..attribtool import ReadOnlyClass
 from ..raisetool import Raise
 
 from .classes import BClasses
+from .views import view
 
 
-class BData(BClasses):
-    """Base mixin that adds typed dictionary semantics."""
+class BDataValidationKeys(object, metaclass=ReadOnlyClass):
+    """Validation policies applied by `BData._set_data`.
 
-    __bdata_storage: Optional[Dict[str, Any]] = None
-    __bdata_types: Optional[Dict[str, Any]] = None
+    The process-wide default is `FULL`; relaxed policies are opt-in through
+    the `JSKTOOLBOX_BDATA_VALIDATION` environment variable or per class/key.
+    """
 
-    @staticmethod
-    def __validate_type(value: Any, expected_type: Any) -> bool:
-        """Validate if value matches expected type including complex generic types.
+    #: Check the value and every element of typed containers.
+    FULL: str = "FULL"
+    #: Check the container type only, elements are not inspected.
+    SHALLOW: str = "SHALLOW"
+    #: Check the container type and its first `_validation_sample_` elements.
+    SAMPLED: str = "SAMPLED"
+    #: Accept every value without checking.
+    OFF: str = "OFF"
 
-        ### Arguments:
-        * value: Any - Value to check.
-        * expected_type: Any - Expected type (can be simple or generic type from typing).
+    #: Contains all supported policies.
+    keys: tuple[str, ...] = (FULL, SHALLOW, SAMPLED, OFF)
 
-        ### Returns:
-        [bool] - True if value matches expected type.
 
-        ### Note:
-        Supports simple types (int, str, list) and complex generic types
-        (Optional[str], Dict[str, int], List[Any], etc.).
+def _default_validation() -> str:
+    """Return the process-wide validation policy.
+
+    ### Returns:
+    [str] - Policy from the environment, else `FULL`.
+    """
+    policy: str = os.environ.get("JSKTOOLBOX_BDATA_VALIDATION", "").upper()
+    if policy in BDataValidationKeys.keys:
+        return policy
+    return BDataValidationKeys.FULL
+
+
+#: Policy used by keys and classes that do not choose one.
+_VALIDATION_DEFAULT: str = _default_validation()
+
+
+class _TypeChecker(object):
+    """Compiled validator of a single type hint.
+
+    Pickles as a reference to the hint and policy, so objects holding
+    checkers stay picklable; the closure is rebuilt (or taken from the
+    cache) on load.
+    """
+
+    __slots__ = ("hint", "sample", "check")
+
+    def __init__(
+        self, hint: Any, sample: Optional[int], check: Callable[[Any], bool]
+    ) -> None:
+        """Store the hint with its compiled check function.
+
+        ### Arguments:
+        * hint: Any - Type hint the checker was compiled from.
+        * sample: Optional[int] - Container elements checked; None means all,
+          negative means the checker accepts every value.
+        * check: Callable[[Any], bool] - Function returning True for matching values.
         """
-        # Handle None for Optional types
-        if value is None:
-            origin = get_origin(expected_type)
-            # Check if it's Optional (Union with None)
-            if origin is Union:
-                args = get_args(expected_type)
-                return type(None) in args
-            # None is only valid for Optional types
-            return False
+        self.hint: Any = hint
+        self.sample: Optional[int] = sample
+        self.check: Callable[[Any], bool] = check
+
+    def __reduce__(self) -> Any:
+        return (_type_checker, (self.hint, self.sample))
+
+
+#: Compiled checkers shared by all instances, keyed by type hint and sample.
+_TYPE_CHECKERS: Dict[Any, _TypeChecker] = {}
+
+
+def _accept(value: Any) -> bool:
+    """Checker used when validation is off."""
+    return True
+
+
+def _reject(value: Any) -> bool:
+    """Checker for hints that no value satisfies."""
+    return False
+
 
-        # Try simple isinstance first (works for simple types and some generics)
+def _type_checker(expected_type: Any, sample: Optional[int] = None) -> _TypeChecker:
+    """Return the compiled checker for a type hint, compiling it once.
+
+    ### Arguments:
+    * expected_type: Any - Simple type or generic type from typing.
+    * sample: Optional[int] - Container elements to check; None checks all,
+      0 checks the container type only, negative disables checking.
+
+    ### Returns:
+    [_TypeChecker] - Checker whose `check` returns True for matching values.
+    """
+    try:
+        return _TYPE_CHECKERS[(expected_type, sample)]
+    except KeyError:
+        checker = _TypeChecker(
+            expected_type, sample, _compile_type_checker(expected_type, sample)
+        )
+        _TYPE_CHECKERS[(expected_type, sample)] = checker
+        return checker
+    except TypeError:
+        # unhashable hint, compile without caching
+        return _TypeChecker(
+            expected_type, sample, _compile_type_checker(expected_type, sample)
+        )
+
+
+def _compile_type_checker(
+    expected_type: Any, sample: Optional[int] = None
+) -> Callable[[Any], bool]:
+    """Build a checker closure for a type hint.
+
+    The hint is analysed with `get_origin`/`get_args` once; the returned
+    closure only runs `isinstance` calls and, for typed containers, the
+    compiled element checkers.
+
+    ### Arguments:
+    * expected_type: Any - Simple type or generic type from typing.
+    * sample: Optional[int] - Container elements to check; None checks all,
+      0 checks the container type only, negative disables checking.
+
+    ### Returns:
+    [Callable[[Any], bool]] - Function returning True for matching values.
+
+    ### Note:
+    None is accepted only by Optional (Union with None) hints. Fixed-length
+    tuples are always checked in full.
+    """
+    if sample is not None and sample < 0:
+        return _accept
+    origin = get_origin(expected_type)
+    args = get_args(expected_type)
+    accepts_none: bool = origin is Union and type(None) in args
+
+    # Plain classes and unions of plain classes reduce to one isinstance call
+    plain: Any = None
+    if origin is None:
+        plain = expected_type
+    elif origin is Union and all(get_origin(arg) is None for arg in args):
+        plain = args
+    if plain is not None:
         try:
-            if isinstance(value, expected_type):
-                return True
+            none_match: bool = isinstance(None, plain)
         except TypeError:
-            # isinstance() doesn't work with some generic types, continue to detailed check
-            pass
-
-        # Get origin and args for generic types
-        origin = get_origin(expected_type)
-        args = get_args(expected_type)
-
-        # No origin means it's a simple type - use isinstance
-        if origin is None:
-            try:
-                return isinstance(value, expected_type)
-            except TypeError:
-                return False
-
-        # Handle Union types (including Optional)
-        if origin is Union:
-            # Check if value matches any of the union types
-            return any(BData.__validate_type(value, arg) for arg in args)
-
-        # Handle List, list
-        if origin in (list, List):
-            if not isinstance(value, list):
-                return False
-            # If no type args or List[Any], any list is valid
-            if not args or args == (Any,):
-                return True
-            # Check all elements match the specified type
-            element_type = args[0]
-            return all(BData.__validate_type(item, element_type) for item in value)
-
-        # Handle Dict, dict
-        if origin in (dict, Dict):
-            if not isinstance(value, dict):
-                return False
-            # If no type args or Dict[Any, Any], any dict is valid
-            if not args or len(args) < 2:
-                return True
-            key_type, value_type = args[0], args[1]
-            # Check all keys and values match specified types
-            return all(
-                BData.__validate_type(k, key_type)
-                and BData.__validate_type(v, value_type)
-                for k, v in value.items()
-            )
+            if origin is None:
+                return _reject
+        else:
+            if none_match == accepts_none:
+                return lambda value: isinstance(value, plain)
+            if accepts_none:
+                return lambda value: value is None or isinstance(value, plain)
+            return lambda value: value is not None and isinstance(value, plain)
+
+    if origin is Union:
+        subs = tuple(_type_checker(arg, sample).check for arg in args)
+
+        def check_union(value: Any) -> bool:
+            if value is None:
+                return accepts_none
+            for sub in subs:
+                if sub(value):
+                    return True
+            return False
 
-        # Handle Tuple
-        if origin is tuple:
-            if not isinstance(value, tuple):
-                return False
-            if not args:
-                return True
-            # Variable length tuple: Tuple[int, ...]
-            if len(args) == 2 and args[1] is Ellipsis:
-                element_type = args[0]
-                return all(BData.__validate_type(item, element_type) for item in value)
-            # Fixed length tuple: Tuple[int, str, bool]
-            if len(value) != len(args):
-                return False
-            return all(BData.__validate_type(v, t) for v, t in zip(value, args))
-
-        # Handle Set, set
-        if origin in (set, frozenset):
-            if not isinstance(value, (set, frozenset)):
-                return False
-            if not args or args == (Any,):
-                return True
-            element_type = args[0]
-            return all(BData.__validate_type(item, element_type) for item in value)
+        return check_union
 
+    def items(value: Any) -> Any:
+        """Return the elements of `value` selected by the sample size."""
+        return value if sample is None else islice(value, sample)
+
+    if origin in (list, List):
+        if not args or args == (Any,) or sample == 0:
+            inner: Callable[[Any], bool] = lambda value: isinstance(value, list)
+        else:
+            item_check = _type_checker(args[0], sample).check
+            inner = lambda value: isinstance(value, list) and all(
+                map(item_check, items(value))
+            )
+    elif origin in (dict, Dict):
+        if not args or len(args) < 2 or sample == 0:
+            inner = lambda value: isinstance(value, dict)
+        else:
+            key_check = _type_checker(args[0], sample).check
+            value_check = _type_checker(args[1], sample).check
+            inner = lambda value: isinstance(value, dict) and all(
+                key_check(k) and value_check(v) for k, v in items(value.items())
+            )
+    elif origin is tuple:
+        if not args:
+            inner = lambda value: isinstance(value, tuple)
+        elif len(args) == 2 and args[1] is Ellipsis:
+            if sample == 0:
+                inner = lambda value: isinstance(value, tuple)
+            else:
+                item_check = _type_checker(args[0], sample).check
+                inner = lambda value: isinstance(value, tuple) and all(
+                    map(item_check, items(value))
+                )
+        else:
+            item_checks = tuple(_type_checker(arg, sample).check for arg in args)
+            size = len(args)
+            inner = lambda value: (
+                isinstance(value, tuple)
+                and len(value) == size
+                and all(check(v) for check, v in zip(item_checks, value))
+            )
+    elif origin in (set, frozenset):
+        if not args or args == (Any,) or sample == 0:
+            inner = lambda value: isinstance(value, (set, frozenset))
+        else:
+            item_check = _type_checker(args[0], sample).check
+            inner = lambda value: isinstance(value, (set, frozenset)) and all(
+                map(item_check, items(value))
+            )
+    else:
         # For other generic types, fall back to origin check
         try:
-            return isinstance(value, origin)
+            isinstance(None, origin)
         except TypeError:
-            return False
+            return _reject
+        inner = lambda value: isinstance(value, origin)
+
+    # bare aliases such as `typing.List` still support a direct isinstance
+    try:
+        isinstance(None, expected_type)
+    except TypeError:
+        return lambda value: value is not None and inner(value)
+    return lambda value: value is not None and (
+        isinstance(value, expected_type) or inner(value)
+    )
+
+
+def _slot_name(cls_name: str, name: str) -> str:
+    """Return the attribute name Python uses for a `__slots__` entry.
+
+    ### Arguments:
+    * cls_name: str - Name of the class declaring the slot.
+    * name: str - Slot name as written in `__slots__`.
+
+    ### Returns:
+    [str] - Name after private name mangling.
+    """
+    owner: str = cls_name.lstrip("_")
+    if name.startswith("__") and not name.endswith("__") and owner:
+        return f"_{owner}{name}"
+    return name
+
+
+def _fields_setattr(self: "BData", name: str, value: Any) -> None:
+    """`__setattr__` installed on classes with declared fields.
+
+    Declared fields are checked and written straight to their slot; other
+    names go through the regular `NoDynamicAttributes` path.
+
+    ### Arguments:
+    * name: str - Attribute name.
+    * value: Any - Value to assign.
+
+    ### Raises:
+    * TypeError: Value violates the declared field type.
+    """
+    field: Optional[Tuple[_TypeChecker, Any]] = self._BData__bdata_fields.get(name)  # type: ignore
+    if field is None:
+        BClasses.__setattr__(self, name, value)
+    elif field[0].check(value):
+        field[1].__set__(self, value)
+    else:
+        raise Raise.error(
+            f"Expected '{field[0].hint}' type, received: '{type(value)}'",
+            TypeError,
+            self._c_name,
+            currentframe(),
+        )
+
+
+class BData(BClasses):
+    """Base mixin that adds typed dictionary semantics.
+
+    Type constraints registered with `set_default_type` are compiled once
+    into checker closures kept next to the registered hints. How deep the
+    checkers look into container values is set by a `BDataValidationKeys`
+    policy: per key through `_set_data(validation=...)`, per class through
+    `_validation_`, or process-wide (see `BDataValidationKeys`).
+
+    Subclasses may declare fields by giving `__slots__` as a mapping of
+    name to type hint. Declared fields are stored in slots, read at plain
+    attribute speed and checked on assignment with the same compiled
+    checkers; entries mapped to None or to a docstring stay untyped. The
+    dictionary storage itself stays in the instance `__dict__`, so `BData`
+    keeps a plain layout and still combines with builtins like `Exception`.
+    """
+
+    #: Validation policy for keys of this class; None uses the process default.
+    _validation_: Optional[str] = None
+    #: Number of container elements checked by the `SAMPLED` policy.
+    _validation_sample_: int = 32
+
+    __bdata_storage: Optional[Dict[str, Any]] = None
+    __bdata_types: Optional[Dict[str, Any]] = None
+    __bdata_checks: Optional[Dict[str, _TypeChecker]] = None
+    __bdata_fields: Dict[str, Tuple[_TypeChecker, Any]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Turn typed `__slots__` declarations into checked fields."""
+        super().__init_subclass__(**kwargs)
+        slots = cls.__dict__.get("__slots__")
+        if not isinstance(slots, dict):
+            return None
+        fields: Dict[str, Tuple[_TypeChecker, Any]] = dict(cls.__bdata_fields)
+        sample: Optional[int] = cls.__sample(None)
+        for name, hint in slots.items():
+            if hint is None or isinstance(hint, str):
+                continue
+            attr: str = _slot_name(cls.__name__, name)
+            fields[attr] = (_type_checker(hint, sample), cls.__dict__[attr])
+        cls.__bdata_fields = fields
+        if fields:
+            cls.__setattr__ = _fields_setattr  # type: ignore
+
+    @classmethod
+    def __sample(cls, validation: Optional[str]) -> Optional[int]:
+        """Translate a validation policy into a checker sample size.
+
+        ### Arguments:
+        * validation: Optional[str] - Policy from `BDataValidationKeys` or None
+          for the class or process default.
+
+        ### Returns:
+        [Optional[int]] - None for full checks, 0 for shallow, a positive
+        size for sampled, -1 when validation is off.
+
+        ### Raises:
+        * ValueError: Unknown validation policy.
+        """
+        if validation is None:
+            validation = cls._validation_ or _VALIDATION_DEFAULT
+        if validation == BDataValidationKeys.FULL:
+            return None
+        if validation == BDataValidationKeys.SHALLOW:
+            return 0
+        if validation == BDataValidationKeys.SAMPLED:
+            return max(1, cls._validation_sample_)
+        if validation == BDataValidationKeys.OFF:
+            return -1
+        raise Raise.error(
+            f"Unknown validation policy: '{validation}'",
+            ValueError,
+            cls.__name__,
+            currentframe(),
+        )
+
+    def __register_type(
+        self, key: str, expected_type: Any, validation: Optional[str] = None
+    ) -> Callable[[Any], bool]:
+        """Register a type constraint with its compiled checker.
+
+        ### Arguments:
+        * key: str - Dictionary key.
+        * expected_type: Any - Type hint to register.
+        * validation: Optional[str] - Policy from `BDataValidationKeys`.
+
+        ### Returns:
+        [Callable[[Any], bool]] - Compiled checker for the hint.
+        """
+        checker = _type_checker(expected_type, self.__sample(validation))
+        self.__bdata_types[key] = expected_type  # type: ignore
+        if self.__bdata_checks is None:
+            self.__bdata_checks = {}
+        self.__bdata_checks[key] = checker
+        return checker.check
+
+    def __unregister_type(self, key: str) -> None:
+        """Remove a type constraint and its compiled checker.
+
+        ### Arguments:
+        * key: str - Dictionary key.
+        """
+        del self.__bdata_types[key]  # type: ignore
+        if self.__bdata_checks is not None:
+            self.__bdata_checks.pop(key, None)
+
+    def __checker(self, key: str) -> Callable[[Any], bool]:
+        """Return the compiled checker of a registered key.
+
+        ### Arguments:
+        * key: str - Dictionary key with a registered type constraint.
+
+        ### Returns:
+        [Callable[[Any], bool]] - Compiled checker.
+        """
+        checks = self.__bdata_checks
+        if checks is not None and key in checks:
+            return checks[key].check
+        return self.__register_type(key, self.__bdata_types[key])  # type: ignore
 
     def __check_keys(self, key: str) -> bool:
         """Check if the key is available in the storage dictionary.
@@ -195,6 +492,25 @@ class BData(BClasses):
             return copy.deepcopy(self._data[key])
         return None
 
+    def _view_data(self, key: str) -> Optional[Any]:
+        """Return a read-only view of data from the internal dictionary.
+
+        Nothing is copied: dictionaries and sequences are wrapped in
+        `DictView`/`ListView` views and sets are frozen. The view is live,
+        in-place changes to the stored value are visible through it, so it
+        is not a snapshot; use `_copy_data()` or `thaw()` on the view for an
+        independent copy.
+
+        ### Arguments:
+        * key: str - Variable name to expose.
+
+        ### Returns:
+        [Optional[Any]] - Read-only view of the stored value or None when missing.
+        """
+        if self.__check_keys(key):
+            return view(self._data[key])
+        return None
+
     def _get_data(
         self,
         key: str,
@@ -233,7 +549,7 @@ class BData(BClasses):
             if (
                 self.__bdata_types
                 and self.__has_type(key)
-                and not self.__validate_type(default_value, self.__bdata_types[key])
+                and not self.__checker(key)(default_value)
             ):
                 raise Raise.error(
                     f"Expected '{self.__bdata_types[key]}' type, received default_value type is: {type(default_value)}",
@@ -249,6 +565,7 @@ class BData(BClasses):
         key: str,
         value: Optional[Any],
         set_default_type: Optional[Any] = None,
+        validation: Optional[str] = None,
     ) -> None:
         """Set data in the internal dictionary.
 
@@ -257,13 +574,35 @@ class BData(BClasses):
         * value: Optional[Any] - Value to assign.
         * set_default_type: Optional[Any] - Optional type restriction for the key.
           If None, no type constraint is registered (existing constraints are preserved).
+        * validation: Optional[str] - Validation policy from `BDataValidationKeys`
+          for the key's type constraint; kept for later assignments.
 
         ### Raises:
         * TypeError: Value violates the registered or provided type constraint.
         * TypeError: Attempting to overwrite an existing type constraint.
           Use _delete_data(key) first to change the type.
         * TypeError: default_value type does not match set_default_type.
+        * ValueError: Unknown validation policy.
         """
+        checks = self.__bdata_checks
+        if (
+            set_default_type is None
+            and validation is None
+            and checks is not None
+            and key in checks
+        ):
+            # Fast path: re-assignment of a key with a compiled checker
+            if checks[key].check(value):
+                self._clear_data(key)
+                self.__bdata_storage[key] = value  # type: ignore
+                return None
+            raise Raise.error(
+                f"Expected '{self.__bdata_types[key]}' type, received: '{type(value)}'",  # type: ignore
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+
         if self.__bdata_types is None:
             self.__bdata_types = {}
 
@@ -283,8 +622,10 @@ class BData(BClasses):
                     currentframe(),
                 )
 
+            if validation is not None:
+                self.__register_type(key, self.__bdata_types[key], validation)
             # Verify value matches existing type
-            if self.__validate_type(value, self.__bdata_types[key]):
+            if self.__checker(key)(value):
                 self._clear_data(key)
                 self._data[key] = value
             else:
@@ -298,12 +639,11 @@ class BData(BClasses):
             # No type registered yet
             if set_default_type is not None:
                 # Register new type and verify value matches
-                self.__bdata_types[key] = set_default_type
-                if self.__validate_type(value, set_default_type):
+                if self.__register_type(key, set_default_type, validation)(value):
                     self._data[key] = value
                 else:
                     # Clean up type registration if value doesn't match
-                    del self.__bdata_types[key]
+                    self.__unregister_type(key)
                     raise Raise.error(
                         f"The type of the value: '{type(value)}' does not match the type passed in the 'set_default_type': '{set_default_type}' variable",
                         TypeError,
@@ -324,20 +664,21 @@ class BData(BClasses):
         if self.__check_keys(key):
             del self._data[key]
         if self.__has_type(key):
-            del self.__bdata_types[key]  # type: ignore
+            self.__unregister_type(key)
 
     def _clear_data(self, key: str) -> None:
         """Clear data from the internal dictionary.
 
         Preserve the key type constraint. If the key is missing, do nothing.
+        The removed value itself is left untouched, so callers still holding
+        a reference to a stored container keep its contents.
 
         ### Arguments:
         * key: str - Variable name to delete.
         """
-        if self.__check_keys(key):
-            if isinstance(self._data[key], (List, Dict)):
-                self._data[key].clear()
-            del self._data[key]
+        storage = self.__bdata_storage
+        if storage and key in storage:
+            del storage[key]
 
     @property
     def _data(self) -> Dict[str, Any]:
@@ -368,6 +709,8 @@ class BData(BClasses):
                 self.__bdata_storage.clear()
             if self.__bdata_types is not None:
                 self.__bdata_types.clear()
+            if self.__bdata_checks is not None:
+                self.__bdata_checks.clear()
             return None
         if isinstance(value, Dict) and self.__bdata_storage is not None:
             for key in value.keys():
@@ -397,6 +740,7 @@ class BData(BClasses):
             self.__bdata_types.clear()
         self.__bdata_storage = None
         self.__bdata_types = None
+        self.__bdata_checks = None
 
 
 #
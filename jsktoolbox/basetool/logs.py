@@ -8,7 +8,9 @@ Purpose: Provide foundational mixins for the logging subsystem.
 Defines base mixins for logger queues, engine metadata, and formatting
 behaviour leveraged by higher-level logging utilities.
 """
-from typing import Optional, List, Any
+
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional
 
 from ..logstool.keys import LogKeys
 from ..logstool.queue import LoggerQueue
@@ -68,12 +70,34 @@ class BLoggerEngine(BData):
         """
         self._set_data(key=LogKeys.NAME, value=value, set_default_type=Optional[str])
 
+    @property
+    def structured(self) -> bool:
+        """Return True when the engine formatter consumes structured records.
+
+        ### Returns:
+        [bool] - Value of the formatter `structured` flag, False without one.
+        """
+        formatter: Optional[BLogFormatter] = self._get_data(
+            key=LogKeys.FORMATTER, default_value=None
+        )
+        return formatter is not None and formatter.structured
+
 
 class BLogFormatter(NoDynamicAttributes):
-    """Base mixin for log formatters leveraging simple templates."""
+    """Base mixin for log formatters leveraging simple templates.
+
+    The forms list is compiled into a single `str.format` template per
+    variant (with and without a name) on first use; the compiled renderer
+    is rebuilt whenever the contents of `_forms_` change.
+    """
+
+    #: When True, engines pass `LogRecord` objects to `format()` unchanged.
+    structured: bool = False
 
     __blf_template: Optional[str] = None
     __blf_forms: Optional[List] = None
+    __blf_compiled: Optional[Dict[bool, Callable[[Any, Optional[str]], str]]] = None
+    __blf_compiled_forms: Optional[List] = None
 
     def format(self, message: str, name: Optional[str] = None) -> str:
         """Render a log message based on the configured forms list.
@@ -85,21 +109,135 @@ class BLogFormatter(NoDynamicAttributes):
         ### Returns:
         [str] - Formatted log payload.
         """
-        out: str = ""
-        for item in self._forms_:
-            if callable(item):
-                out += f"{item()} "
-            elif isinstance(item, str):
-                if name is None:
-                    if item.find("name") == -1:
-                        out += item.format(message=f"{message}")
-                else:
-                    if item.find("name") > 0:
-                        out += item.format(
-                            name=f"{name}",
-                            message=f"{message}",
-                        )
-        return out
+        compiled = self.__blf_compiled
+        if compiled is None or self.__blf_compiled_forms != self._forms_:
+            compiled = self.__compile()
+        return compiled[name is not None](message, name)
+
+    def __compile(self) -> Dict[bool, Callable[[Any, Optional[str]], str]]:
+        """Compile the forms list into render functions.
+
+        Callable components become `{_blf_cN}` fields evaluated once per
+        record; string templates are concatenated following the original
+        selection rules (templates mentioning `name` are used only when a
+        name is given).
+
+        ### Returns:
+        [Dict[bool, Callable[[Any, Optional[str]], str]]] - Renderers keyed by
+        "name given" flag.
+        """
+        forms: List = self._forms_
+        compiled: Dict[bool, Callable[[Any, Optional[str]], str]] = {}
+        for named in (False, True):
+            template: List[str] = []
+            fields: Dict[str, Callable[[], Any]] = {}
+            for item in forms:
+                if callable(item):
+                    key: str = f"_blf_c{len(fields)}"
+                    fields[key] = item
+                    template.append(f"{{{key}}} ")
+                elif isinstance(item, str):
+                    if named:
+                        if item.find("name") > 0:
+                            template.append(item)
+                    elif item.find("name") == -1:
+                        template.append(item)
+            compiled[named] = self.__make_renderer("".join(template), fields)
+        self.__blf_compiled = compiled
+        self.__blf_compiled_forms = list(forms)
+        return compiled
+
+    @staticmethod
+    def __make_renderer(
+        template: str, fields: Dict[str, Callable[[], Any]]
+    ) -> Callable[[Any, Optional[str]], str]:
+        """Return a render function for a compiled template.
+
+        Templates using only plain `message`, `name` and callable fields are
+        split into literal text and one closure per field; anything else
+        (indexing, attribute access, nested format specs) is rendered with
+        `str.format`.
+
+        ### Arguments:
+        * template: str - Combined `str.format` template.
+        * fields: Dict[str, Callable[[], Any]] - Callable components by field name.
+
+        ### Returns:
+        [Callable[[Any, Optional[str]], str]] - Function rendering `(message, name)`.
+        """
+        if not template:
+            return lambda message, name: ""
+        parts: List[Any] = []
+        try:
+            for literal, field, spec, conversion in Formatter().parse(template):
+                if literal:
+                    parts.append(literal)
+                if field is None:
+                    continue
+                if field not in fields and field not in ("message", "name"):
+                    raise ValueError(field)
+                if spec and "{" in spec:
+                    raise ValueError(spec)
+                parts.append(
+                    BLogFormatter.__make_field(
+                        field, fields.get(field), spec, conversion
+                    )
+                )
+        except ValueError:
+            parts = []
+        if parts:
+            render = tuple(parts)
+            return lambda message, name: "".join(
+                [
+                    part if part.__class__ is str else part(message, name)
+                    for part in render
+                ]
+            )
+        fmt = template.format
+        items = tuple(fields.items())
+        return lambda message, name: fmt(
+            message=message, name=name, **{key: call() for key, call in items}
+        )
+
+    @staticmethod
+    def __make_field(
+        field: str,
+        call: Optional[Callable[[], Any]],
+        spec: str,
+        conversion: Optional[str],
+    ) -> Callable[[Any, Optional[str]], str]:
+        """Return a closure rendering one replacement field.
+
+        ### Arguments:
+        * field: str - Field name: `message`, `name` or a callable field key.
+        * call: Optional[Callable[[], Any]] - Callable component for the field.
+        * spec: str - Format specification.
+        * conversion: Optional[str] - Conversion flag: `r`, `s` or `a`.
+
+        ### Returns:
+        [Callable[[Any, Optional[str]], str]] - Function rendering the field.
+
+        ### Raises:
+        * ValueError: Unknown conversion flag.
+        """
+        convert: Optional[Callable[[Any], str]] = None
+        if conversion:
+            if conversion not in "rsa" or len(conversion) != 1:
+                raise ValueError(conversion)
+            convert = {"r": repr, "s": str, "a": ascii}[conversion]
+
+        def render(message: Any, name: Optional[str]) -> str:
+            if call is not None:
+                value: Any = call()
+            elif field == "message":
+                value = message
+            else:
+                value = name
+            if convert is not None:
+                value = convert(value)
+            return format(value, spec)
+
+        return render
 
     @property
     def _forms_(self) -> List:
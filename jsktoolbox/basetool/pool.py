@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Provide a fixed-size worker thread pool built on `ThBaseObject`.
+
+`ThPool` runs submitted callables on a bounded set of `ThPoolWorker`
+threads fed from one shared queue and returns `concurrent.futures.Future`
+objects for the results. Workers block on the queue while idle and keep
+per-worker health and throughput counters.
+"""
+
+import queue
+import threading
+import time
+
+from concurrent.futures import Future
+from inspect import currentframe
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..attribtool import NoDynamicAttributes, ReadOnlyClass
+from ..raisetool import Raise
+from .threads import ThBaseObject
+
+
+class _Keys(object, metaclass=ReadOnlyClass):
+    """Keys definition class.
+
+    For internal purpose only.
+    """
+
+    BUSY_SINCE: str = "__busy_since__"
+    BUSY_TIME: str = "__busy_time__"
+    COMPLETED: str = "__completed__"
+    FAILED: str = "__failed__"
+    LAST_ACTIVE: str = "__last_active__"
+    LOCK: str = "__lock__"
+    QUEUE: str = "__queue__"
+    SIZE: str = "__size__"
+    STARTED_AT: str = "__started_at__"
+    WORKERS: str = "__workers__"
+
+
+class ThPoolStatsKeys(object, metaclass=ReadOnlyClass):
+    """Keys of the dictionaries returned by `ThPool.stats`."""
+
+    #: Number of worker threads alive.
+    ALIVE: str = "alive"
+    #: Seconds spent executing tasks.
+    BUSY_TIME: str = "busy_time"
+    #: Monotonic timestamp of the task start, None when idle.
+    BUSY_SINCE: str = "busy_since"
+    #: Number of tasks finished without exception.
+    COMPLETED: str = "completed"
+    #: Number of tasks finished with an exception.
+    FAILED: str = "failed"
+    #: Monotonic timestamp of the last finished task.
+    LAST_ACTIVE: str = "last_active"
+    #: Worker thread name.
+    NAME: str = "name"
+    #: Tasks waiting in the queue.
+    PENDING: str = "pending"
+    #: Finished tasks per second since the pool started.
+    THROUGHPUT: str = "throughput"
+    #: Per-worker statistics.
+    WORKERS: str = "workers"
+
+
+# Marker put on the queue to make one worker exit.
+_SENTINEL: Any = None
+
+# Seconds `submit()` waits for a free slot before checking the stop flag again.
+_FULL_WAIT: float = 0.05
+# Seconds an idle worker waits for a task before checking the stop flag.
+_IDLE_WAIT: float = 0.1
+
+
+class ThPoolWorker(threading.Thread, ThBaseObject, NoDynamicAttributes):
+    """Worker thread executing tasks taken from a `ThPool` queue."""
+
+    def __init__(
+        self,
+        work_queue: "queue.Queue[Any]",
+        stop_event: threading.Event,
+        name: Optional[str] = None,
+    ) -> None:
+        """Initialise the worker.
+
+        ### Arguments:
+        * work_queue: queue.Queue - Queue shared with the pool.
+        * stop_event: threading.Event - Stop event shared with the pool.
+        * name: Optional[str] - Thread name.
+        """
+        threading.Thread.__init__(self, name=name or self._c_name)
+        self.daemon = True
+        self._stop_event = stop_event
+        self._set_data(key=_Keys.QUEUE, value=work_queue, set_default_type=None)
+        self._set_data(key=_Keys.COMPLETED, value=0, set_default_type=int)
+        self._set_data(key=_Keys.FAILED, value=0, set_default_type=int)
+        self._set_data(key=_Keys.BUSY_TIME, value=0.0, set_default_type=float)
+        self._set_data(
+            key=_Keys.BUSY_SINCE, value=None, set_default_type=Optional[float]
+        )
+        self._set_data(
+            key=_Keys.LAST_ACTIVE, value=None, set_default_type=Optional[float]
+        )
+
+    def run(self) -> None:
+        """Execute tasks until a stop marker is received.
+
+        The worker also exits once the stop event is set and the queue is
+        empty, so a stop marker that did not fit a full queue is not needed.
+        """
+        work_queue: "queue.Queue[Any]" = self._get_data(key=_Keys.QUEUE)  # type: ignore
+        stop_event: threading.Event = self._stop_event  # type: ignore
+        data: Dict[str, Any] = self._data
+        while True:
+            try:
+                task: Optional[Tuple[Future, Callable, Tuple, Dict]] = work_queue.get(
+                    timeout=_IDLE_WAIT
+                )
+            except queue.Empty:
+                if stop_event.is_set():
+                    break
+                continue
+            if task is _SENTINEL:
+                break
+            future, func, args, kwargs = task  # type: ignore
+            if not future.set_running_or_notify_cancel():
+                continue
+            start: float = time.monotonic()
+            data[_Keys.BUSY_SINCE] = start
+            try:
+                result: Any = func(*args, **kwargs)
+            except BaseException as ex:
+                future.set_exception(ex)
+                data[_Keys.FAILED] += 1
+            else:
+                future.set_result(result)
+                data[_Keys.COMPLETED] += 1
+            finally:
+                end: float = time.monotonic()
+                data[_Keys.BUSY_TIME] += end - start
+                data[_Keys.BUSY_SINCE] = None
+                data[_Keys.LAST_ACTIVE] = end
+                del task, future, func, args, kwargs
+
+    @property
+    def busy_since(self) -> Optional[float]:
+        """Return the monotonic start time of the running task.
+
+        ### Returns:
+        [Optional[float]] - Timestamp, or None while the worker is idle.
+        """
+        return self._get_data(key=_Keys.BUSY_SINCE)
+
+    @property
+    def busy_time(self) -> float:
+        """Return the total time spent executing tasks.
+
+        ### Returns:
+        [float] - Seconds.
+        """
+        return self._get_data(key=_Keys.BUSY_TIME)  # type: ignore
+
+    @property
+    def completed(self) -> int:
+        """Return the number of tasks finished without exception.
+
+        ### Returns:
+        [int] - Task count.
+        """
+        return self._get_data(key=_Keys.COMPLETED)  # type: ignore
+
+    @property
+    def failed(self) -> int:
+        """Return the number of tasks that raised an exception.
+
+        ### Returns:
+        [int] - Task count.
+        """
+        return self._get_data(key=_Keys.FAILED)  # type: ignore
+
+    @property
+    def last_active(self) -> Optional[float]:
+        """Return the monotonic time the last task finished.
+
+        ### Returns:
+        [Optional[float]] - Timestamp, or None before the first task.
+        """
+        return self._get_data(key=_Keys.LAST_ACTIVE)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return health and throughput counters of the worker.
+
+        ### Returns:
+        [Dict[str, Any]] - Mapping keyed by `ThPoolStatsKeys`.
+        """
+        return {
+            ThPoolStatsKeys.NAME: self.name,
+            ThPoolStatsKeys.ALIVE: self.is_alive(),
+            ThPoolStatsKeys.BUSY_SINCE: self.busy_since,
+            ThPoolStatsKeys.BUSY_TIME: self.busy_time,
+            ThPoolStatsKeys.COMPLETED: self.completed,
+            ThPoolStatsKeys.FAILED: self.failed,
+            ThPoolStatsKeys.LAST_ACTIVE: self.last_active,
+        }
+
+
+class ThPool(ThBaseObject, NoDynamicAttributes):
+    """Fixed-size thread pool sharing one work queue.
+
+    Workers are started on the first `submit()` (or `start()`). `stop()`
+    uses the inherited `_stop_event` to refuse new work, lets queued tasks
+    finish unless `cancel_pending` is set, and joins the workers.
+    """
+
+    def __init__(
+        self, workers: int = 4, name: Optional[str] = None, maxsize: int = 0
+    ) -> None:
+        """Initialise the pool.
+
+        ### Arguments:
+        * workers: int - Number of worker threads, at least 1.
+        * name: Optional[str] - Prefix for worker thread names.
+        * maxsize: int - Queue capacity; `submit()` blocks when full, 0 means unbounded.
+
+        ### Raises:
+        * ValueError: Invalid number of workers or queue size.
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise Raise.error(
+                f"Expected positive number of workers, received: '{workers}'.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        if not isinstance(maxsize, int) or maxsize < 0:
+            raise Raise.error(
+                f"Expected non-negative queue size, received: '{maxsize}'.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        self._name = name or self._c_name
+        self._stop_event = threading.Event()
+        self._set_data(key=_Keys.SIZE, value=workers, set_default_type=int)
+        self._set_data(
+            key=_Keys.QUEUE,
+            value=queue.SimpleQueue() if maxsize == 0 else queue.Queue(maxsize),
+            set_default_type=None,
+        )
+        self._set_data(key=_Keys.WORKERS, value=[], set_default_type=List)
+        self._set_data(key=_Keys.LOCK, value=threading.Lock(), set_default_type=None)
+        self._set_data(
+            key=_Keys.STARTED_AT, value=None, set_default_type=Optional[float]
+        )
+
+    def __enter__(self) -> "ThPool":
+        """Start the pool for use in a `with` block."""
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the pool and wait for queued tasks."""
+        self.stop()
+
+    @property
+    def __queue(self) -> Any:
+        return self._get_data(key=_Keys.QUEUE)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of queued tasks not yet taken by a worker.
+
+        ### Returns:
+        [int] - Approximate queue size.
+        """
+        return self.__queue.qsize()
+
+    @property
+    def size(self) -> int:
+        """Return the configured number of workers.
+
+        ### Returns:
+        [int] - Worker count.
+        """
+        return self._get_data(key=_Keys.SIZE)  # type: ignore
+
+    @property
+    def workers(self) -> Tuple[ThPoolWorker, ...]:
+        """Return the worker threads.
+
+        ### Returns:
+        [Tuple[ThPoolWorker, ...]] - Started workers, empty before `start()`.
+        """
+        return tuple(self._get_data(key=_Keys.WORKERS))  # type: ignore
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Return aggregated pool statistics.
+
+        ### Returns:
+        [Dict[str, Any]] - Mapping keyed by `ThPoolStatsKeys`; the `WORKERS`
+        entry holds the per-worker dictionaries.
+        """
+        workers: List[Dict[str, Any]] = [item.stats for item in self.workers]
+        completed: int = sum(item[ThPoolStatsKeys.COMPLETED] for item in workers)
+        failed: int = sum(item[ThPoolStatsKeys.FAILED] for item in workers)
+        started_at: Optional[float] = self._get_data(key=_Keys.STARTED_AT)
+        uptime: float = 0.0 if started_at is None else time.monotonic() - started_at
+        return {
+            ThPoolStatsKeys.ALIVE: sum(
+                1 for item in workers if item[ThPoolStatsKeys.ALIVE]
+            ),
+            ThPoolStatsKeys.PENDING: self.pending,
+            ThPoolStatsKeys.COMPLETED: completed,
+            ThPoolStatsKeys.FAILED: failed,
+            ThPoolStatsKeys.BUSY_TIME: sum(
+                item[ThPoolStatsKeys.BUSY_TIME] for item in workers
+            ),
+            ThPoolStatsKeys.THROUGHPUT: (
+                (completed + failed) / uptime if uptime > 0 else 0.0
+            ),
+            ThPoolStatsKeys.WORKERS: workers,
+        }
+
+    def start(self) -> None:
+        """Start the worker threads; calling it again has no effect.
+
+        ### Raises:
+        * RuntimeError: The pool has been stopped.
+        """
+        with self._get_data(key=_Keys.LOCK):  # type: ignore
+            if self.stopped:
+                raise Raise.error(
+                    "Cannot start a stopped pool.",
+                    RuntimeError,
+                    self._c_name,
+                    currentframe(),
+                )
+            workers: List[ThPoolWorker] = self._get_data(key=_Keys.WORKERS)  # type: ignore
+            if workers:
+                return
+            for idx in range(self.size):
+                worker = ThPoolWorker(
+                    self.__queue, self._stop_event, f"{self._name}-{idx}"  # type: ignore
+                )
+                workers.append(worker)
+                worker.start()
+            self._set_data(key=_Keys.STARTED_AT, value=time.monotonic())
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Schedule `func(*args, **kwargs)` on the pool.
+
+        ### Arguments:
+        * func: Callable[..., Any] - Callable to execute.
+        * *args: Any - Positional arguments for the callable.
+        * **kwargs: Any - Keyword arguments for the callable.
+
+        ### Returns:
+        [Future] - Future resolved with the result or exception.
+
+        ### Raises:
+        * RuntimeError: The pool has been stopped, also while waiting for a
+          free slot of a bounded queue.
+        """
+        if not self._get_data(key=_Keys.WORKERS):
+            self.start()
+        future: Future = Future()
+        task: Tuple[Future, Callable, Tuple, Dict] = (future, func, args, kwargs)
+        work_queue: Any = self.__queue
+        lock: threading.Lock = self._get_data(key=_Keys.LOCK)  # type: ignore
+        while True:
+            with lock:
+                if self.stopped:
+                    raise Raise.error(
+                        "Cannot submit tasks to a stopped pool.",
+                        RuntimeError,
+                        self._c_name,
+                        currentframe(),
+                    )
+                try:
+                    work_queue.put_nowait(task)
+                    return future
+                except queue.Full:
+                    pass
+            # wait for a free slot without the lock, so `stop()` is not blocked
+            with work_queue.not_full:
+                work_queue.not_full.wait(_FULL_WAIT)
+
+    def map(
+        self,
+        func: Callable[..., Any],
+        iterable: Iterable[Any],
+        timeout: Optional[float] = None,
+    ) -> Iterator[Any]:
+        """Apply `func` to every item on the pool, yielding results in order.
+
+        ### Arguments:
+        * func: Callable[..., Any] - Callable taking one item.
+        * iterable: Iterable[Any] - Items to process.
+        * timeout: Optional[float] - Seconds to wait for each result.
+
+        ### Returns:
+        [Iterator[Any]] - Results in input order; task exceptions are re-raised.
+        """
+        futures: List[Future] = [self.submit(func, item) for item in iterable]
+
+        def results() -> Iterator[Any]:
+            for future in futures:
+                yield future.result(timeout)
+
+        return results()
+
+    def stop(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Stop accepting tasks and shut the workers down.
+
+        ### Arguments:
+        * wait: bool - Join the worker threads before returning.
+        * cancel_pending: bool - Cancel queued tasks instead of running them.
+        """
+        with self._get_data(key=_Keys.LOCK):  # type: ignore
+            if self._stop_event:
+                self._stop_event.set()
+        work_queue: Any = self.__queue
+        if cancel_pending:
+            while True:
+                try:
+                    task: Any = work_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if task is not _SENTINEL:
+                    task[0].cancel()
+        workers: List[ThPoolWorker] = self._get_data(key=_Keys.WORKERS)  # type: ignore
+        for _ in workers:
+            try:
+                work_queue.put_nowait(_SENTINEL)
+            except queue.Full:
+                # workers left without a marker exit on the stop event
+                break
+        if wait:
+            current: threading.Thread = threading.current_thread()
+            for worker in workers:
+                if worker is not current:
+                    worker.join()
+
+
+# #[EOF]#######################################################################
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Run periodic and one-shot jobs from a single scheduler thread.
+
+`ThScheduler` keeps the jobs in a heap ordered by their next run time and
+sleeps on its work event until the earliest one is due, so one thread
+replaces many threads each sleeping in its own loop. Jobs run inline or are
+dispatched to a `ThPool`; periodic jobs support start-time jitter and
+coalescing of runs missed while the scheduler or the job was late.
+"""
+
+import heapq
+import random
+import threading
+import time
+
+from concurrent.futures import Future
+from inspect import currentframe
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..attribtool import NoDynamicAttributes, ReadOnlyClass
+from ..raisetool import Raise
+from .pool import ThPool
+from .threads import ThBaseObject
+
+
+class _Keys(object, metaclass=ReadOnlyClass):
+    """Keys definition class.
+
+    For internal purpose only.
+    """
+
+    HEAP: str = "__heap__"
+    LOCK: str = "__lock__"
+    POOL: str = "__pool__"
+    SEQ: str = "__seq__"
+
+
+class SchedulerJob(object):
+    """Job registered in `ThScheduler`.
+
+    Instances are returned by `ThScheduler.schedule()`; the public counters
+    may be read at any time, `cancel()` removes the job from the schedule.
+    """
+
+    __slots__ = (
+        "func",
+        "args",
+        "kwargs",
+        "interval",
+        "jitter",
+        "coalesce",
+        "due",
+        "runs",
+        "missed",
+        "failed",
+        "last_error",
+        "cancelled",
+        "future",
+    )
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        interval: Optional[float],
+        jitter: float,
+        coalesce: bool,
+        due: float,
+    ) -> None:
+        """Initialise the job.
+
+        ### Arguments:
+        * func: Callable[..., Any] - Callable to run.
+        * args: Tuple[Any, ...] - Positional arguments for the callable.
+        * kwargs: Dict[str, Any] - Keyword arguments for the callable.
+        * interval: Optional[float] - Period in seconds, None for one-shot jobs.
+        * jitter: float - Upper bound of the random start delay in seconds.
+        * coalesce: bool - Collapse missed periodic runs into one.
+        * due: float - Monotonic time of the first run.
+        """
+        self.func: Callable[..., Any] = func
+        self.args: Tuple[Any, ...] = args
+        self.kwargs: Dict[str, Any] = kwargs
+        self.interval: Optional[float] = interval
+        self.jitter: float = jitter
+        self.coalesce: bool = coalesce
+        self.due: float = due
+        self.runs: int = 0
+        self.missed: int = 0
+        self.failed: int = 0
+        self.last_error: Optional[BaseException] = None
+        self.cancelled: bool = False
+        self.future: Optional[Future] = None
+
+    def __repr__(self) -> str:
+        """Return a debugging representation of the job."""
+        return (
+            f"{self.__class__.__name__}(func={self.func!r}, "
+            f"interval={self.interval!r}, runs={self.runs}, "
+            f"missed={self.missed}, cancelled={self.cancelled})"
+        )
+
+    def cancel(self) -> None:
+        """Remove the job from the schedule; a running call is not interrupted."""
+        self.cancelled = True
+
+
+class ThScheduler(threading.Thread, ThBaseObject, NoDynamicAttributes):
+    """Single-threaded scheduler for periodic and one-shot jobs.
+
+    Jobs are run inline on the scheduler thread unless a `ThPool` is given,
+    in which case they are submitted to the pool and a periodic job whose
+    previous run is still in progress counts the slot as missed instead of
+    overlapping. The pool is not stopped together with the scheduler; when
+    the pool is stopped first, the failed submission is recorded on the job
+    and the scheduler stops. Job exceptions are recorded in `failed` and
+    `last_error` of the job.
+    """
+
+    def __init__(
+        self, pool: Optional[ThPool] = None, name: Optional[str] = None
+    ) -> None:
+        """Initialise the scheduler thread.
+
+        ### Arguments:
+        * pool: Optional[ThPool] - Pool executing the jobs; None runs them inline.
+        * name: Optional[str] - Thread name.
+        """
+        threading.Thread.__init__(self, name=name or self._c_name)
+        self._stop_event = threading.Event()
+        self._work_event = threading.Event()
+        self.daemon = True
+        self._set_data(key=_Keys.HEAP, value=[], set_default_type=List)
+        self._set_data(key=_Keys.LOCK, value=threading.Lock(), set_default_type=None)
+        self._set_data(key=_Keys.POOL, value=pool, set_default_type=Optional[ThPool])
+        self._set_data(key=_Keys.SEQ, value=0, set_default_type=int)
+
+    @property
+    def jobs(self) -> List[SchedulerJob]:
+        """Return the scheduled jobs ordered by their next run.
+
+        ### Returns:
+        [List[SchedulerJob]] - Jobs not yet cancelled or finished.
+        """
+        with self._get_data(key=_Keys.LOCK):  # type: ignore
+            heap: List[Tuple[float, int, SchedulerJob]] = self._get_data(key=_Keys.HEAP)  # type: ignore
+            return [item[2] for item in sorted(heap) if not item[2].cancelled]
+
+    def schedule(
+        self,
+        func: Callable[..., Any],
+        interval: Optional[float] = None,
+        delay: float = 0.0,
+        jitter: float = 0.0,
+        coalesce: bool = True,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> SchedulerJob:
+        """Register a job.
+
+        ### Arguments:
+        * func: Callable[..., Any] - Callable to run.
+        * interval: Optional[float] - Period in seconds; None runs the job once.
+        * delay: float - Seconds until the first run.
+        * jitter: float - Random delay in seconds added to every run, spreading
+          jobs with the same period.
+        * coalesce: bool - When runs were missed, run once and skip to the next
+          future slot; False runs every missed slot back to back.
+        * args: Tuple[Any, ...] - Positional arguments for the callable.
+        * kwargs: Optional[Dict[str, Any]] - Keyword arguments for the callable.
+
+        ### Returns:
+        [SchedulerJob] - Handle used to inspect or cancel the job.
+
+        ### Raises:
+        * ValueError: Non-positive interval or negative delay or jitter.
+        """
+        if interval is not None and interval <= 0:
+            raise Raise.error(
+                f"Expected positive interval, received: '{interval}'.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        if delay < 0 or jitter < 0:
+            raise Raise.error(
+                f"Expected non-negative delay and jitter, received: '{delay}', '{jitter}'.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        job = SchedulerJob(
+            func,
+            args,
+            kwargs or {},
+            interval,
+            jitter,
+            coalesce,
+            time.monotonic() + delay,
+        )
+        self.__push(job)
+        self.notify_work()
+        return job
+
+    def __push(self, job: SchedulerJob) -> None:
+        """Put the job on the heap at its due time plus jitter.
+
+        ### Arguments:
+        * job: SchedulerJob - Job to schedule.
+        """
+        when: float = job.due
+        if job.jitter:
+            when += random.uniform(0.0, job.jitter)
+        with self._get_data(key=_Keys.LOCK):  # type: ignore
+            seq: int = self._get_data(key=_Keys.SEQ)  # type: ignore
+            self._set_data(key=_Keys.SEQ, value=seq + 1)
+            heapq.heappush(self._get_data(key=_Keys.HEAP), (when, seq, job))  # type: ignore
+
+    def __pop_due(self) -> Tuple[Optional[SchedulerJob], Optional[float]]:
+        """Take the earliest job if it is due.
+
+        ### Returns:
+        [Tuple[Optional[SchedulerJob], Optional[float]]] - Due job or None, and
+        the seconds to wait for the next one (None when the heap is empty).
+        """
+        with self._get_data(key=_Keys.LOCK):  # type: ignore
+            heap: List[Tuple[float, int, SchedulerJob]] = self._get_data(key=_Keys.HEAP)  # type: ignore
+            while heap and heap[0][2].cancelled:
+                heapq.heappop(heap)
+            if not heap:
+                return None, None
+            timeout: float = heap[0][0] - time.monotonic()
+            if timeout > 0:
+                return None, timeout
+            return heapq.heappop(heap)[2], None
+
+    def __dispatch(self, job: SchedulerJob) -> None:
+        """Run the job inline or submit it to the pool.
+
+        ### Arguments:
+        * job: SchedulerJob - Due job.
+        """
+        pool: Optional[ThPool] = self._get_data(key=_Keys.POOL)
+        if pool is None:
+            job.runs += 1
+            try:
+                job.func(*job.args, **job.kwargs)
+            except Exception as ex:
+                job.failed += 1
+                job.last_error = ex
+            return
+        if job.future is not None and not job.future.done():
+            job.missed += 1
+            return
+        try:
+            job.future = pool.submit(job.func, *job.args, **job.kwargs)
+        except RuntimeError as ex:
+            # the pool has been stopped and will not accept any further job
+            job.failed += 1
+            job.last_error = ex
+            self.stop()
+            return
+        job.runs += 1
+        job.future.add_done_callback(lambda future: self.__job_done(job, future))
+
+    @staticmethod
+    def __job_done(job: SchedulerJob, future: Future) -> None:
+        """Record the outcome of a job run on the pool.
+
+        ### Arguments:
+        * job: SchedulerJob - Finished job.
+        * future: Future - Future of the run.
+        """
+        if not future.cancelled() and future.exception() is not None:
+            job.failed += 1
+            job.last_error = future.exception()
+
+    def __reschedule(self, job: SchedulerJob) -> None:
+        """Put a periodic job back on the heap for its next slot.
+
+        ### Arguments:
+        * job: SchedulerJob - Job that has just been dispatched.
+        """
+        if job.interval is None or job.cancelled:
+            return
+        job.due += job.interval
+        late: float = time.monotonic() - job.due
+        if late >= job.interval and job.coalesce:
+            skipped: int = int(late // job.interval)
+            job.missed += skipped
+            job.due += skipped * job.interval
+        self.__push(job)
+
+    def run(self) -> None:
+        """Dispatch due jobs until stopped."""
+        while not self.stopped:
+            job, timeout = self.__pop_due()
+            if job is None:
+                self._wait_for_work(timeout)
+                continue
+            self.__dispatch(job)
+            self.__reschedule(job)
+
+
+# #[EOF]#######################################################################
@@ -57,6 +57,7 @@ class _Keys(object, metaclass=ReadOnlyClass):
     TARGET: str = "_target"
     TSTATE_LOCK: str = "_tstate_lock"
     THREAD: str = "_thread"
+    WORK_EVENT: str = "_work_event"
 
 
 class ThBaseObject(BData):
@@ -275,15 +276,45 @@ class ThBaseObject(BData):
         """
         self._set_data(key=_Keys.OS_THREAD_HANDLE, value=value, set_default_type=None)
 
-    def _sleep(self, sleep_period: Optional[float] = None) -> None:
-        """Pause execution for the configured period.
+    def _sleep(self, sleep_period: Optional[float] = None) -> bool:
+        """Pause execution for the configured period or until stop is requested.
 
         ### Arguments:
         * sleep_period: Optional[float] - Custom sleep duration override.
+
+        ### Returns:
+        [bool] - True when the pause was interrupted by the stop event.
         """
         if sleep_period is None:
             sleep_period = self.sleep_period
-        sleep(sleep_period)
+        stop_event: Optional[Event] = self._stop_event
+        if stop_event is None:
+            sleep(sleep_period)
+            return False
+        return stop_event.wait(sleep_period)
+
+    def _wait_for_work(self, timeout: Optional[float] = None) -> bool:
+        """Block until work is announced, stop is requested or timeout expires.
+
+        Without `_work_event` the call falls back to `_sleep(timeout)`. The
+        event is cleared before returning, so the caller should check its work
+        source after every call.
+
+        ### Arguments:
+        * timeout: Optional[float] - Maximum wait time in seconds; None waits
+          until `notify_work()` or `stop()` is called.
+
+        ### Returns:
+        [bool] - True when woken by `notify_work()` or `stop()`.
+        """
+        work_event: Optional[Event] = self._work_event
+        if work_event is None:
+            return self._sleep(timeout)
+        woken: bool = work_event.wait(timeout)
+        stop_event: Optional[Event] = self._stop_event
+        if stop_event is None or not stop_event.is_set():
+            work_event.clear()
+        return woken
 
     @property
     def _started(self) -> Optional[Event]:
@@ -342,6 +373,24 @@ class ThBaseObject(BData):
         """
         self._set_data(key=_Keys.STOP_EVENT, value=obj, set_default_type=Event)
 
+    @property
+    def _work_event(self) -> Optional[Event]:
+        """Return the event announcing available work, if set.
+
+        ### Returns:
+        [Optional[Event]] - Work event instance or None.
+        """
+        return self._get_data(key=_Keys.WORK_EVENT, default_value=None)
+
+    @_work_event.setter
+    def _work_event(self, obj: Event) -> None:
+        """Set the event announcing available work.
+
+        ### Arguments:
+        * obj: Event - Event set by producers through `notify_work()`.
+        """
+        self._set_data(key=_Keys.WORK_EVENT, value=obj, set_default_type=Event)
+
     @property
     def _target(self) -> Optional[Callable]:
         """Return the thread target callable.
@@ -431,10 +480,20 @@ class ThBaseObject(BData):
             return self._started.is_set()
         return False
 
+    def notify_work(self) -> None:
+        """Wake up the thread waiting in `_wait_for_work()`."""
+        if self._work_event:
+            self._work_event.set()
+
     def stop(self) -> None:
-        """Signal the stop event to request thread termination."""
+        """Signal the stop event to request thread termination.
+
+        The work event is set as well, so a thread blocked in
+        `_wait_for_work()` notices the request immediately.
+        """
         if self._stop_event:
             self._stop_event.set()
+        self.notify_work()
 
     @property
     def stopped(self) -> bool:
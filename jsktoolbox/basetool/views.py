@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Provide read-only views over `BData` values.
+
+A view wraps the stored object without copying it. Nested dictionaries and
+sequences are wrapped on access, so readers pay only for the elements they
+touch. Views are live: in-place changes to the wrapped object are visible
+through them, so they are not isolated from a concurrent writer. A private,
+mutable copy is produced by `thaw()` when a consumer needs a stable or
+modifiable copy of the data.
+"""
+
+import copy
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Union
+
+
+def view(value: Any) -> Any:
+    """Return a read-only view of the value.
+
+    ### Arguments:
+    * value: Any - Object to wrap.
+
+    ### Returns:
+    [Any] - `DictView` for dictionaries, `ListView` for lists and tuples,
+    a `frozenset` copy for sets, the value itself otherwise.
+    """
+    if isinstance(value, dict):
+        return DictView(value)
+    if isinstance(value, (list, tuple)):
+        return ListView(value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+class DictView(Mapping):
+    """Read-only, lazily wrapped view of a dictionary."""
+
+    __slots__ = ("__source",)
+
+    def __init__(self, source: Dict[Any, Any]) -> None:
+        """Initialise the view.
+
+        ### Arguments:
+        * source: Dict[Any, Any] - Dictionary to expose.
+        """
+        self.__source: Dict[Any, Any] = source
+
+    def __getitem__(self, key: Any) -> Any:
+        """Return the read-only view of the item."""
+        return view(self.__source[key])
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys."""
+        return iter(self.__source)
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self.__source)
+
+    def __contains__(self, key: Any) -> bool:
+        """Check the key without wrapping the value."""
+        return key in self.__source
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare with mappings by content."""
+        if isinstance(other, DictView):
+            other = other.__source
+        return self.__source == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """Return the debugging representation."""
+        return f"{self.__class__.__name__}({self.__source!r})"
+
+    def __copy__(self) -> "DictView":
+        """Return the view itself, it cannot be modified."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "DictView":
+        """Return a view over an independent copy of the data."""
+        return DictView(copy.deepcopy(self.__source, memo))
+
+    def __reduce__(self) -> Any:
+        """Pickle as a view over the pickled data."""
+        return (DictView, (self.__source,))
+
+    def thaw(self) -> Dict[Any, Any]:
+        """Return a mutable deep copy of the data.
+
+        ### Returns:
+        [Dict[Any, Any]] - Independent dictionary.
+        """
+        return copy.deepcopy(self.__source)
+
+
+class ListView(Sequence):
+    """Read-only, lazily wrapped view of a list or tuple."""
+
+    __slots__ = ("__source",)
+
+    def __init__(self, source: Union[List[Any], tuple]) -> None:
+        """Initialise the view.
+
+        ### Arguments:
+        * source: Union[List[Any], tuple] - Sequence to expose.
+        """
+        self.__source: Union[List[Any], tuple] = source
+
+    def __getitem__(self, index: Any) -> Any:
+        """Return the read-only view of the item or slice."""
+        if isinstance(index, slice):
+            return ListView(self.__source[index])
+        return view(self.__source[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over read-only views of the items."""
+        for item in self.__source:
+            yield view(item)
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self.__source)
+
+    def __contains__(self, item: Any) -> bool:
+        """Check membership without wrapping the items."""
+        return item in self.__source
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare with lists, tuples and other views by content."""
+        if isinstance(other, ListView):
+            other = other.__source
+        if isinstance(other, (list, tuple)):
+            return len(self.__source) == len(other) and all(
+                a == b for a, b in zip(self.__source, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        """Return the debugging representation."""
+        return f"{self.__class__.__name__}({self.__source!r})"
+
+    def __copy__(self) -> "ListView":
+        """Return the view itself, it cannot be modified."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ListView":
+        """Return a view over an independent copy of the data."""
+        return ListView(copy.deepcopy(self.__source, memo))
+
+    def __reduce__(self) -> Any:
+        """Pickle as a view over the pickled data."""
+        return (ListView, (self.__source,))
+
+    def thaw(self) -> List[Any]:
+        """Return a mutable deep copy of the data.
+
+        ### Returns:
+        [List[Any]] - Independent list, also for tuple sources.
+        """
+        return list(copy.deepcopy(self.__source))
+
+
+# #[EOF]#######################################################################
@@ -34,6 +34,8 @@ class _Keys(object, metaclass=ReadOnlyClass):
 class IModel(ABC):
     """Model class interface."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def dump(self) -> Union[List[str], "VariableModel"]:
@@ -74,9 +76,16 @@ class VariableModel(BData, IModel, NoDynamicAttributes):
     """Representation of a configuration variable entry.
 
     ### Purpose:
-    Stores name, value, and description for a single configuration variable.
+    Stores name, value, and description for a single configuration variable
+    in typed slots declared in `__slots__`.
     """
 
+    __slots__ = {
+        "__desc": Optional[str],
+        "__name": Optional[str],
+        "__value": Optional[Union[str, int, float, bool, List]],
+    }
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -90,9 +99,9 @@ class VariableModel(BData, IModel, NoDynamicAttributes):
         * value: Optional[Union[str, int, float, bool, List]] - Payload to store.
         * desc: Optional[str] - Optional human-friendly description.
         """
-        self._data[_Keys.NAME] = name
-        self._data[_Keys.VALUE] = value
-        self._data[_Keys.DESC] = desc
+        self.__name = name
+        self.__value = value
+        self.__desc = desc
 
     def __repr__(self) -> str:
         """Return representation class string.
@@ -140,7 +149,7 @@ class VariableModel(BData, IModel, NoDynamicAttributes):
         ### Returns:
         [Optional[str]] - Description string or None.
         """
-        return self._get_data(key=_Keys.DESC)
+        return self.__desc
 
     @desc.setter
     def desc(self, desc: Optional[str]) -> None:
@@ -149,7 +158,7 @@ class VariableModel(BData, IModel, NoDynamicAttributes):
         ### Arguments:
         * desc: Optional[str] - Description text.
         """
-        self._set_data(key=_Keys.DESC, value=desc, set_default_type=Optional[str])
+        self.__desc = desc
 
     @property
     def dump(self) -> "VariableModel":
@@ -167,7 +176,7 @@ class VariableModel(BData, IModel, NoDynamicAttributes):
         ### Returns:
         [Optional[str]] - Section name.
         """
-        return self._get_data(key=_Keys.NAME)
+        return self.__name
 
     @name.setter
     def name(self, name: Optional[str]) -> None:
@@ -180,7 +189,7 @@ class VariableModel(BData, IModel, NoDynamicAttributes):
         * ValueError: Raised when the trimmed name becomes empty.
         """
         if name is None:
-            self._set_data(key=_Keys.NAME, value=None, set_default_type=Optional[str])
+            self.__name = None
         else:
             cleaned = name.strip()
             if not cleaned:
@@ -190,9 +199,7 @@ class VariableModel(BData, IModel, NoDynamicAttributes):
                     self._c_name,
                     currentframe(),
                 )
-            self._set_data(
-                key=_Keys.NAME, value=cleaned, set_default_type=Optional[str]
-            )
+            self.__name = cleaned
 
     def parser(self, value: str) -> None:
         """Parse raw string input ensuring valid state.
@@ -231,7 +238,7 @@ class VariableModel(BData, IModel, NoDynamicAttributes):
         ### Returns:
         [Optional[Union[str, int, float, bool, List]]] - Stored value.
         """
-        return self._get_data(key=_Keys.VALUE)
+        return self.__value
 
     @value.setter
     def value(self, value: Optional[Union[str, int, float, bool, List]]) -> None:
@@ -240,11 +247,7 @@ class VariableModel(BData, IModel, NoDynamicAttributes):
         ### Arguments:
         * value: Optional[Union[str, int, float, bool, List]] - Payload.
         """
-        self._set_data(
-            key=_Keys.VALUE,
-            value=value,
-            set_default_type=Optional[Union[str, int, float, bool, List]],
-        )
+        self.__value = value
 
 
 class SectionModel(BData, IModel, NoDynamicAttributes):
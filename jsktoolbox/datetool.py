@@ -6,7 +6,6 @@ Created: 02.12.2023
 Purpose: Sets of classes for various date/time operations.
 """
 
-import calendar
 from time import time
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Tuple, Union
@@ -257,7 +256,9 @@ class Timestamp(NoNewAttributes):
         start_dt = datetime(year, month, 1, 0, 0, 0, tzinfo=tz)
 
         # Find the number of days in the month
-        _, num_days = calendar.monthrange(year, month)
+        from calendar import monthrange
+
+        _, num_days = monthrange(year, month)
 
         # The very last moment of the month in UTC
         end_dt = datetime(year, month, num_days, 23, 59, 59, 999999, tzinfo=tz)
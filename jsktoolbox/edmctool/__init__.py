@@ -0,0 +1,120 @@
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2024-10-08
+
+Purpose: Provide Elite Dangerous route planning helpers for EDMC plugins.
+
+Exports are resolved lazily, so optional dependencies (`requests`, `numpy`,
+`scipy`) and the algorithm module are loaded only when requested.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BLogClient as BLogClient
+    from .base import BLogProcessor as BLogProcessor
+    from .data import RscanData as RscanData
+    from .ed_keys import EDKeys as EDKeys
+    from .edsm import Url as Url
+    from .edsm_keys import EdsmKeys as EdsmKeys
+    from .logs import LogClient as LogClient
+    from .logs import LogLevels as LogLevels
+    from .logs import LogProcessor as LogProcessor
+    from .logs2 import LoggerEngineConfig as LoggerEngineConfig
+    from .logs2 import LoggingComponentMixin as LoggingComponentMixin
+    from .logs2 import LoggingServer as LoggingServer
+    from .math import AlgAStar as AlgAStar
+    from .math import AlgGeneric as AlgGeneric
+    from .math import AlgGenetic as AlgGenetic
+    from .math import AlgGenetic2 as AlgGenetic2
+    from .math import AlgSimulatedAnnealing as AlgSimulatedAnnealing
+    from .math import AlgTsp as AlgTsp
+    from .math import Euclid as Euclid
+    from .stars import StarsSystem as StarsSystem
+    from .system import Directory as Directory
+    from .system import EnvLocal as EnvLocal
+
+__all__ = [
+    "AlgAStar",
+    "AlgGeneric",
+    "AlgGenetic",
+    "AlgGenetic2",
+    "AlgSimulatedAnnealing",
+    "AlgTsp",
+    "BLogClient",
+    "BLogProcessor",
+    "Directory",
+    "EDKeys",
+    "EdsmKeys",
+    "EnvLocal",
+    "Euclid",
+    "LogClient",
+    "LogLevels",
+    "LogProcessor",
+    "LoggerEngineConfig",
+    "LoggingComponentMixin",
+    "LoggingServer",
+    "RscanData",
+    "StarsSystem",
+    "Url",
+]
+
+_EXPORT_MAP = {
+    "AlgAStar": ("math", "AlgAStar"),
+    "AlgGeneric": ("math", "AlgGeneric"),
+    "AlgGenetic": ("math", "AlgGenetic"),
+    "AlgGenetic2": ("math", "AlgGenetic2"),
+    "AlgSimulatedAnnealing": ("math", "AlgSimulatedAnnealing"),
+    "AlgTsp": ("math", "AlgTsp"),
+    "BLogClient": ("base", "BLogClient"),
+    "BLogProcessor": ("base", "BLogProcessor"),
+    "Directory": ("system", "Directory"),
+    "EDKeys": ("ed_keys", "EDKeys"),
+    "EdsmKeys": ("edsm_keys", "EdsmKeys"),
+    "EnvLocal": ("system", "EnvLocal"),
+    "Euclid": ("math", "Euclid"),
+    "LogClient": ("logs", "LogClient"),
+    "LogLevels": ("logs", "LogLevels"),
+    "LogProcessor": ("logs", "LogProcessor"),
+    "LoggerEngineConfig": ("logs2", "LoggerEngineConfig"),
+    "LoggingComponentMixin": ("logs2", "LoggingComponentMixin"),
+    "LoggingServer": ("logs2", "LoggingServer"),
+    "RscanData": ("data", "RscanData"),
+    "StarsSystem": ("stars", "StarsSystem"),
+    "Url": ("edsm", "Url"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve configured edmctool exports on demand.
+
+    ### Arguments:
+    * name: str - Requested attribute name.
+
+    ### Returns:
+    [Any] - Resolved attribute from the target submodule.
+
+    ### Raises:
+    * AttributeError: Raised when the attribute is not registered.
+    """
+    if name not in _EXPORT_MAP:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module_name, attr_name = _EXPORT_MAP[name]
+    module = import_module(f"{__name__}.{module_name}")
+    value = getattr(module, attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Expose lazy exports in `dir()` calls.
+
+    ### Returns:
+    [list[str]] - Sorted list of exported symbols.
+    """
+    return sorted(__all__)
+
+
+# #[EOF]#######################################################################
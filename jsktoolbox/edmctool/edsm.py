@@ -6,11 +6,9 @@ Created: 2024-10-08
 Purpose: EDSM API client classes.
 """
 
-import requests  # type: ignore
 import json
 
 from typing import Dict, List, Optional, Any, Union
-from requests.utils import requote_uri  # type: ignore
 from inspect import currentframe
 
 from .edsm_keys import EdsmKeys
@@ -22,6 +20,20 @@ from ..raisetool import Raise
 from ..edmctool.stars import StarsSystem
 
 
+def requote_uri(uri: str) -> str:
+    """Re-quote the URI with `requests`, imported on first use.
+
+    ### Arguments:
+    * uri: str - URI to normalise.
+
+    ### Returns:
+    str - Quoted URI.
+    """
+    from requests.utils import requote_uri as _requote_uri  # type: ignore
+
+    return _requote_uri(uri)
+
+
 class _Keys(object, metaclass=ReadOnlyClass):
     """Internal  keys container class."""
 
@@ -252,6 +264,8 @@ class Url(BData):
             return None
 
         try:
+            import requests  # type: ignore
+
             response: requests.Response = requests.get(url, timeout=30)
             if response.status_code != 200:
                 print(f"Error calling API for system data: {response.status_code}")
@@ -275,6 +289,8 @@ class Url(BData):
             return out
 
         try:
+            import requests  # type: ignore
+
             response: requests.Response = requests.get(url, timeout=60)
             if response.status_code != 200:
                 print(f"Error calling API for EDSM data: {response.status_code}")
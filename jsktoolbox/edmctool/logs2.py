@@ -13,12 +13,10 @@ Description:
 from __future__ import annotations
 from inspect import currentframe
 
-from re import DEBUG, L
 import threading
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterable, List, Optional, cast, Union
-from venv import logger
 
 from ..attribtool import ReadOnlyClass
 from ..basetool.data import BData
@@ -34,7 +32,6 @@ from ..logstool import (
 from ..basetool import BLoggerQueue
 from ..raisetool import Raise
 
-
 if TYPE_CHECKING:
     from ..logstool import LoggerQueue
 
@@ -32,15 +32,30 @@ from .data import RscanData
 from .stars import StarsSystem
 from .edsm_keys import EdsmKeys
 
-try:
-    import numpy as np  # pyright: ignore[reportMissingImports]
-except ModuleNotFoundError:
-    np = None  # type: ignore[assignment]
+# Optional numeric backends, imported by `_load_backends()` on first use.
+np: Any = None
+distance: Any = None
+_BACKENDS_LOADED: bool = False
 
-try:
-    from scipy.spatial import distance  # pyright: ignore[reportMissingImports]
-except ModuleNotFoundError:
-    distance = None  # type: ignore[assignment]
+
+def _load_backends() -> None:
+    """Import the optional numpy and scipy backends once.
+
+    Deferring the imports keeps `import jsktoolbox.edmctool.math` cheap;
+    the cost is paid by the first `Euclid` instance.
+    """
+    global np, distance, _BACKENDS_LOADED
+    if _BACKENDS_LOADED:
+        return
+    _BACKENDS_LOADED = True
+    try:
+        import numpy as np  # pyright: ignore[reportMissingImports]
+    except ModuleNotFoundError:
+        np = None
+    try:
+        from scipy.spatial import distance  # pyright: ignore[reportMissingImports]
+    except ModuleNotFoundError:
+        distance = None
 
 
 class IAlg(ABC):
@@ -121,6 +136,7 @@ class Euclid(BLogClient):
 
         methods: List[MethodType] = []
 
+        _load_backends()
         if np is not None:
             methods.extend(
                 [
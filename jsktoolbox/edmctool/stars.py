@@ -9,27 +9,26 @@ Purpose: StarsSystem container.
 from inspect import currentframe
 from typing import Optional, List, Dict, Union, Any
 
-from ..attribtool import ReadOnlyClass
 from ..raisetool import Raise
 from ..basetool.data import BData
 from .edsm_keys import EdsmKeys
 
 
-class _Keys(object, metaclass=ReadOnlyClass):
-    """Internal Keys container class."""
-
-    # StarsSystem
-    SS_ADDRESS: str = "__ss_address__"
-    SS_DATA: str = "__ss_data__"
-    SS_NAME: str = "__ss_name__"
-    SS_POS_X: str = "__ss_pos_x__"
-    SS_POS_Y: str = "__ss_pos_y__"
-    SS_POS_Z: str = "__ss_pos_z__"
-    SS_STAR_CLASS: str = "__ss_star_class__"
+class StarsSystem(BData):
+    """StarsSystem container class.
 
+    Attributes are kept in typed slots declared in `__slots__`.
+    """
 
-class StarsSystem(BData):
-    """StarsSystem container class."""
+    __slots__ = {
+        "__address": Optional[int],
+        "__data": Optional[Dict],
+        "__name": Optional[str],
+        "__pos_x": Optional[Union[float, int]],
+        "__pos_y": Optional[Union[float, int]],
+        "__pos_z": Optional[Union[float, int]],
+        "__star_class": str,
+    }
 
     def __init__(
         self,
@@ -44,6 +43,8 @@ class StarsSystem(BData):
         * address: Optional[int] - System address identifier.
         * star_pos: Optional[List] - Position coordinates of the star.
         """
+        self.__data = None
+        self.__star_class = ""
         self.name = name
         self.address = address
         self.star_pos = star_pos
@@ -64,7 +65,7 @@ class StarsSystem(BData):
         ### Returns:
         Optional[int] - The system address, or None if not set.
         """
-        return self._get_data(key=_Keys.SS_ADDRESS, default_value=None)
+        return self.__address
 
     @address.setter
     def address(self, arg: Optional[Union[int, str]]) -> None:
@@ -74,15 +75,9 @@ class StarsSystem(BData):
         * arg: Optional[Union[int, str]] - System address as integer or string representation.
         """
         if isinstance(arg, str):
-            self._set_data(
-                key=_Keys.SS_ADDRESS,
-                value=int(arg),
-                set_default_type=Optional[int],
-            )
+            self.__address = int(arg)
         else:
-            self._set_data(
-                key=_Keys.SS_ADDRESS, value=arg, set_default_type=Optional[int]
-            )
+            self.__address = arg
 
     @property
     def data(self) -> Dict:
@@ -93,9 +88,9 @@ class StarsSystem(BData):
         ### Returns:
         Dict - Dictionary containing system data.
         """
-        if self._get_data(key=_Keys.SS_DATA, default_value=None) is None:
-            self._set_data(key=_Keys.SS_DATA, value={}, set_default_type=Dict)
-        return self._get_data(key=_Keys.SS_DATA)  # type: ignore
+        if self.__data is None:
+            self.__data = {}
+        return self.__data  # type: ignore
 
     @data.setter
     def data(self, value: Optional[Dict]) -> None:
@@ -105,9 +100,9 @@ class StarsSystem(BData):
         * value: Optional[Dict] - Dictionary for storing system data or None to initialize empty.
         """
         if value is None:
-            self._set_data(key=_Keys.SS_DATA, value={}, set_default_type=Dict)
+            self.__data = {}
         else:
-            self._set_data(key=_Keys.SS_DATA, value=value, set_default_type=Dict)
+            self.__data = value
 
     @property
     def name(self) -> Optional[str]:
@@ -116,7 +111,7 @@ class StarsSystem(BData):
         ### Returns:
         Optional[str] - The system name, or None if not set.
         """
-        return self._get_data(key=_Keys.SS_NAME, default_value=None)
+        return self.__name
 
     @name.setter
     def name(self, arg: Optional[str]) -> None:
@@ -125,7 +120,7 @@ class StarsSystem(BData):
         ### Arguments:
         * arg: Optional[str] - Name of the star system.
         """
-        self._set_data(key=_Keys.SS_NAME, value=arg, set_default_type=Optional[str])
+        self.__name = arg
 
     @property
     def pos_x(self) -> Optional[Union[float, int]]:
@@ -134,7 +129,7 @@ class StarsSystem(BData):
         ### Returns:
         Optional[Union[float, int]] - X coordinate value, or None if not set.
         """
-        return self._get_data(key=_Keys.SS_POS_X, default_value=None)
+        return self.__pos_x
 
     @pos_x.setter
     def pos_x(self, arg: Optional[Union[float, int]]) -> None:
@@ -143,9 +138,7 @@ class StarsSystem(BData):
         ### Arguments:
         * arg: Optional[Union[float, int]] - X coordinate value.
         """
-        self._set_data(
-            key=_Keys.SS_POS_X, value=arg, set_default_type=Optional[Union[float, int]]
-        )
+        self.__pos_x = arg
 
     @property
     def pos_y(self) -> Optional[Union[float, int]]:
@@ -154,7 +147,7 @@ class StarsSystem(BData):
         ### Returns:
         Optional[Union[float, int]] - Y coordinate value, or None if not set.
         """
-        return self._get_data(key=_Keys.SS_POS_Y, default_value=None)
+        return self.__pos_y
 
     @pos_y.setter
     def pos_y(self, arg: Optional[Union[float, int]]) -> None:
@@ -163,9 +156,7 @@ class StarsSystem(BData):
         ### Arguments:
         * arg: Optional[Union[float, int]] - Y coordinate value.
         """
-        self._set_data(
-            key=_Keys.SS_POS_Y, value=arg, set_default_type=Optional[Union[float, int]]
-        )
+        self.__pos_y = arg
 
     @property
     def pos_z(self) -> Optional[Union[float, int]]:
@@ -174,7 +165,7 @@ class StarsSystem(BData):
         ### Returns:
         Optional[Union[float, int]] - Z coordinate value, or None if not set.
         """
-        return self._get_data(key=_Keys.SS_POS_Z, default_value=None)
+        return self.__pos_z
 
     @pos_z.setter
     def pos_z(self, arg: Optional[Union[float, int]]) -> None:
@@ -183,9 +174,7 @@ class StarsSystem(BData):
         ### Arguments:
         * arg: Optional[Union[float, int]] - Z coordinate value.
         """
-        self._set_data(
-            key=_Keys.SS_POS_Z, value=arg, set_default_type=Optional[Union[float, int]]
-        )
+        self.__pos_z = arg
 
     @property
     def star_class(self) -> str:
@@ -194,7 +183,7 @@ class StarsSystem(BData):
         ### Returns:
         str - Star classification identifier.
         """
-        return self._get_data(key=_Keys.SS_STAR_CLASS, default_value="")  # type: ignore
+        return self.__star_class
 
     @star_class.setter
     def star_class(self, value: str) -> None:
@@ -203,7 +192,7 @@ class StarsSystem(BData):
         ### Arguments:
         * value: str - Star classification identifier.
         """
-        self._set_data(key=_Keys.SS_STAR_CLASS, value=value, set_default_type=str)
+        self.__star_class = value
 
     @property
     def star_pos(self) -> List:
@@ -225,9 +214,9 @@ class StarsSystem(BData):
         * TypeError: Argument is not a List or has incorrect length.
         """
         if arg is None:
-            (self.pos_x, self.pos_y, self.pos_z) = (None, None, None)
+            self.pos_x, self.pos_y, self.pos_z = (None, None, None)
         elif isinstance(arg, List) and len(arg) == 3:
-            (self.pos_x, self.pos_y, self.pos_z) = arg
+            self.pos_x, self.pos_y, self.pos_z = arg
         else:
             raise Raise.error(
                 f"List type expected, '{type(arg)}' received.",
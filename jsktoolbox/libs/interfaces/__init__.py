@@ -3,18 +3,23 @@ Author:  Jacek Kotlarski --<szumak@virthost.pl>
 Created: 2023-06-24
 
 Purpose: Aggregate commonly used interface mixins.
+
+Exports are resolved lazily, so importing one interface module does not load
+the others.
 """
 
-from .comparators import (  # noqa: F401
-    IComparators,
-    IEq,
-    IGe,
-    IGt,
-    ILe,
-    ILt,
-    INe,
-)
-from .logger_engine import ILoggerEngine  # noqa: F401
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .comparators import IComparators as IComparators
+    from .comparators import IEq as IEq
+    from .comparators import IGe as IGe
+    from .comparators import IGt as IGt
+    from .comparators import ILe as ILe
+    from .comparators import ILt as ILt
+    from .comparators import INe as INe
+    from .logger_engine import ILoggerEngine as ILoggerEngine
 
 __all__ = [
     "ILt",
@@ -26,3 +31,44 @@ __all__ = [
     "IComparators",
     "ILoggerEngine",
 ]
+
+_EXPORT_MAP = {
+    "ILt": ("comparators", "ILt"),
+    "ILe": ("comparators", "ILe"),
+    "IEq": ("comparators", "IEq"),
+    "INe": ("comparators", "INe"),
+    "IGt": ("comparators", "IGt"),
+    "IGe": ("comparators", "IGe"),
+    "IComparators": ("comparators", "IComparators"),
+    "ILoggerEngine": ("logger_engine", "ILoggerEngine"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve configured interface exports on demand.
+
+    ### Arguments:
+    * name: str - Requested attribute name.
+
+    ### Returns:
+    [Any] - Resolved attribute from the target submodule.
+
+    ### Raises:
+    * AttributeError: Raised when the attribute is not registered.
+    """
+    if name not in _EXPORT_MAP:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module_name, attr_name = _EXPORT_MAP[name]
+    module = import_module(f"{__name__}.{module_name}")
+    value = getattr(module, attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Expose lazy exports in `dir()` calls.
+
+    ### Returns:
+    [list[str]] - Sorted list of exported symbols.
+    """
+    return sorted(__all__)
@@ -16,6 +16,8 @@ class ILt(ABC):
     x < y
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __lt__(self, value: object) -> bool:
         pass
@@ -27,6 +29,8 @@ class ILe(ABC):
     x <= y
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __le__(self, value: object) -> bool:
         pass
@@ -38,6 +42,8 @@ class IEq(ABC):
     x == y
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __eq__(self, value: object) -> bool:
         pass
@@ -49,6 +55,8 @@ class INe(ABC):
     x != y
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __ne__(self, value: object) -> bool:
         pass
@@ -60,6 +68,8 @@ class IGt(ABC):
     x > y
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __gt__(self, value: object) -> bool:
         pass
@@ -71,6 +81,8 @@ class IGe(ABC):
     x >= y
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __ge__(self, value: object) -> bool:
         pass
@@ -79,7 +91,7 @@ class IGe(ABC):
 class IComparators(IEq, IGe, IGt, ILe, ILt, INe):
     """Aggregate interface grouping all comparison operators."""
 
-    pass
+    __slots__ = ()
 
 
 # #[EOF]#######################################################################
@@ -10,6 +10,7 @@ messages and are leveraged by higher-level logging utilities.
 """
 
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class ILoggerEngine(ABC):
@@ -26,5 +27,51 @@ class ILoggerEngine(ABC):
         None - Implementations should not return a value.
         """
 
+    def send_many(self, messages: List[str]) -> None:
+        """Deliver a batch of log messages to the underlying transport.
+
+        The default implementation calls `send()` for every message;
+        engines able to emit a whole batch at once should override it.
+
+        ### Arguments:
+        * messages: List[str] - Serialised log records in queue order.
+
+        ### Returns:
+        None - Implementations should not return a value.
+        """
+        for message in messages:
+            self.send(message)
+
+    def flush(self) -> None:
+        """Write output buffered by the engine.
+
+        The default implementation does nothing.
+
+        ### Returns:
+        None - Implementations should not return a value.
+        """
+
+    def flush_due(self) -> None:
+        """Write buffered output whose flush deadline has passed.
+
+        Called by the logger processor while the queue is idle, so buffered
+        data is written even when no further messages arrive. The default
+        implementation does nothing.
+
+        ### Returns:
+        None - Implementations should not return a value.
+        """
+
+    def close(self) -> None:
+        """Flush and release resources held by the engine.
+
+        Called by the logger processor when it stops. The default
+        implementation calls `flush()`.
+
+        ### Returns:
+        None - Implementations should not return a value.
+        """
+        self.flush()
+
 
 # #[EOF]#######################################################################
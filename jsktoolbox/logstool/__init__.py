@@ -15,16 +15,24 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from .keys import LogKeys as LogKeys
     from .keys import LogsLevelKeys as LogsLevelKeys
+    from .keys import LogsQueuePolicyKeys as LogsQueuePolicyKeys
+    from .keys import LogsRotationKeys as LogsRotationKeys
     from .keys import SysLogKeys as SysLogKeys
+    from .keys import SysLogSocketKeys as SysLogSocketKeys
     from .queue import LoggerQueue as LoggerQueue
+    from .queue import LoggerProcessQueue as LoggerProcessQueue
+    from .records import LogRecord as LogRecord
     from .formatters import LogFormatterNull as LogFormatterNull
     from .formatters import LogFormatterDateTime as LogFormatterDateTime
     from .formatters import LogFormatterTime as LogFormatterTime
     from .formatters import LogFormatterTimestamp as LogFormatterTimestamp
+    from .formatters import LogFormatterJson as LogFormatterJson
     from .engines import LoggerEngineStdout as LoggerEngineStdout
     from .engines import LoggerEngineStderr as LoggerEngineStderr
     from .engines import LoggerEngineFile as LoggerEngineFile
     from .engines import LoggerEngineSyslog as LoggerEngineSyslog
+    from .engines import LoggerEngineSyslogSocket as LoggerEngineSyslogSocket
+    from .engines import ThLogArchiver as ThLogArchiver
     from .logs import LoggerClient as LoggerClient
     from .logs import LoggerEngine as LoggerEngine
     from .logs import ThLoggerProcessor as ThLoggerProcessor
@@ -32,16 +40,24 @@ if TYPE_CHECKING:
 __all__ = [
     "LogKeys",
     "LogsLevelKeys",
+    "LogsQueuePolicyKeys",
+    "LogsRotationKeys",
     "SysLogKeys",
+    "SysLogSocketKeys",
     "LoggerQueue",
+    "LoggerProcessQueue",
+    "LogRecord",
     "LogFormatterNull",
     "LogFormatterDateTime",
     "LogFormatterTime",
     "LogFormatterTimestamp",
+    "LogFormatterJson",
     "LoggerEngineStdout",
     "LoggerEngineStderr",
     "LoggerEngineFile",
     "LoggerEngineSyslog",
+    "LoggerEngineSyslogSocket",
+    "ThLogArchiver",
     "LoggerClient",
     "LoggerEngine",
     "ThLoggerProcessor",
@@ -50,16 +66,24 @@ __all__ = [
 _EXPORT_MAP = {
     "LogKeys": ("keys", "LogKeys"),
     "LogsLevelKeys": ("keys", "LogsLevelKeys"),
+    "LogsQueuePolicyKeys": ("keys", "LogsQueuePolicyKeys"),
+    "LogsRotationKeys": ("keys", "LogsRotationKeys"),
     "SysLogKeys": ("keys", "SysLogKeys"),
+    "SysLogSocketKeys": ("keys", "SysLogSocketKeys"),
     "LoggerQueue": ("queue", "LoggerQueue"),
+    "LoggerProcessQueue": ("queue", "LoggerProcessQueue"),
+    "LogRecord": ("records", "LogRecord"),
     "LogFormatterNull": ("formatters", "LogFormatterNull"),
     "LogFormatterDateTime": ("formatters", "LogFormatterDateTime"),
     "LogFormatterTime": ("formatters", "LogFormatterTime"),
     "LogFormatterTimestamp": ("formatters", "LogFormatterTimestamp"),
+    "LogFormatterJson": ("formatters", "LogFormatterJson"),
     "LoggerEngineStdout": ("engines", "LoggerEngineStdout"),
     "LoggerEngineStderr": ("engines", "LoggerEngineStderr"),
     "LoggerEngineFile": ("engines", "LoggerEngineFile"),
     "LoggerEngineSyslog": ("engines", "LoggerEngineSyslog"),
+    "LoggerEngineSyslogSocket": ("engines", "LoggerEngineSyslogSocket"),
+    "ThLogArchiver": ("engines", "ThLogArchiver"),
     "LoggerClient": ("logs", "LoggerClient"),
     "LoggerEngine": ("logs", "LoggerEngine"),
     "ThLoggerProcessor": ("logs", "ThLoggerProcessor"),
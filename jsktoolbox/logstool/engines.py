@@ -9,30 +9,191 @@ Each engine adheres to `ILoggerEngine`, providing consistent `send` semantics
 while supporting optional formatters and buffering behaviour.
 """
 
+import errno
 import os
-import ssl
+import select
+import shutil
+import socket
 import sys
 import syslog
+import threading
+import time
 
+from collections import deque
+from datetime import datetime, timedelta
 from inspect import currentframe
-from typing import Optional, Union, cast
+from queue import Empty, Queue
+from typing import Any, Deque, List, Optional, TextIO, Tuple, Union, cast
 from types import ModuleType
 
-from .keys import LogKeys, SysLogKeys
+from .keys import LogKeys, LogsRotationKeys, SysLogKeys, SysLogSocketKeys
 
-from ..attribtool import NoDynamicAttributes
+from ..attribtool import NoDynamicAttributes, ReadOnlyClass
 from ..raisetool import Raise
 from ..basetool.data import BData
 from ..systemtool import PathChecker
 from ..basetool.logs import (
     BLoggerEngine,
 )
+from ..basetool.threads import ThBaseObject
 from ..libs.interfaces.logger_engine import ILoggerEngine
 from .formatters import BLogFormatter
 
 # https://www.geeksforgeeks.org/python-testing-output-to-stdout/
 
 
+class _Keys(object, metaclass=ReadOnlyClass):
+    """Keys definition class.
+
+    For internal purpose only.
+    """
+
+    ARCHIVER: str = "__archiver__"
+    FAILED: str = "__failed__"
+    JOBS: str = "__jobs__"
+    LAST_ERROR: str = "__last_error__"
+
+
+def _shift_archives(file_path: str, backup_count: int, suffix: str = "") -> None:
+    """Shift numbered archives up by one slot, dropping the oldest one.
+
+    ### Arguments:
+    * file_path: str - Active log file path.
+    * backup_count: int - Number of archives to keep.
+    * suffix: str - Archive extension, e.g. `.gz`; empty for plain files.
+    """
+    highest_path = f"{file_path}.{backup_count - 1}{suffix}"
+    if os.path.exists(highest_path):
+        os.remove(highest_path)
+    for index in range(backup_count - 1, 0, -1):
+        src = f"{file_path}.{index - 1}{suffix}"
+        dst = f"{file_path}.{index}{suffix}"
+        if os.path.exists(src):
+            os.replace(src, dst)
+
+
+class ThLogArchiver(threading.Thread, ThBaseObject, NoDynamicAttributes):
+    """Compress rotated log segments in a background thread.
+
+    `LoggerEngineFile` only renames the active file on the logging thread and
+    queues the segment here; archive shifting and compression run serially
+    in this thread, so the logging path never waits for compression. Failed
+    jobs are counted in `failed` and the latest exception is kept in
+    `last_error`.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the archiver thread.
+
+        ### Returns:
+        None - Constructor.
+        """
+        threading.Thread.__init__(self, name=self._c_name)
+        self._stop_event = threading.Event()
+        self._work_event = threading.Event()
+        self.daemon = True
+        self._set_data(key=_Keys.JOBS, value=Queue(), set_default_type=Queue)
+        self._set_data(key=_Keys.FAILED, value=0, set_default_type=int)
+        self._set_data(
+            key=_Keys.LAST_ERROR,
+            value=None,
+            set_default_type=Optional[BaseException],
+        )
+
+    @property
+    def failed(self) -> int:
+        """Return the number of segments that could not be archived.
+
+        ### Returns:
+        int - Failed job count.
+        """
+        return self._get_data(key=_Keys.FAILED)  # type: ignore
+
+    @property
+    def last_error(self) -> Optional[BaseException]:
+        """Return the exception of the most recent failed job.
+
+        ### Returns:
+        Optional[BaseException] - Exception, or None when no job failed.
+        """
+        return self._get_data(key=_Keys.LAST_ERROR)
+
+    def archive(
+        self, segment: str, file_path: str, backup_count: int, compression: str
+    ) -> None:
+        """Queue a rotated segment for compression.
+
+        ### Arguments:
+        * segment: str - Temporary path of the rotated segment.
+        * file_path: str - Active log file path used to name archives.
+        * backup_count: int - Number of archives to keep.
+        * compression: str - Compression identifier from `LogsRotationKeys`.
+
+        ### Returns:
+        None - The job is queued.
+        """
+        self._get_data(key=_Keys.JOBS).put(  # type: ignore
+            (segment, file_path, backup_count, compression)
+        )
+        self.notify_work()
+
+    def join_jobs(self) -> None:
+        """Block until every queued segment has been processed.
+
+        ### Returns:
+        None - Returns when the job queue is empty.
+        """
+        self._get_data(key=_Keys.JOBS).join()  # type: ignore
+
+    def run(self) -> None:
+        """Process queued segments until stopped and the job queue is empty.
+
+        The thread sleeps on the work event between jobs, so it wakes up only
+        when `archive()` or `stop()` is called.
+        """
+        jobs: Queue = self._get_data(key=_Keys.JOBS)  # type: ignore
+        while True:
+            try:
+                segment, file_path, backup_count, compression = jobs.get_nowait()
+            except Empty:
+                if self.stopped:
+                    break
+                self._wait_for_work()
+                continue
+            try:
+                self.__compress(segment, file_path, backup_count, compression)
+            except Exception as ex:
+                self._set_data(key=_Keys.FAILED, value=self.failed + 1)
+                self._set_data(key=_Keys.LAST_ERROR, value=ex)
+            finally:
+                jobs.task_done()
+
+    @staticmethod
+    def __compress(
+        segment: str, file_path: str, backup_count: int, compression: str
+    ) -> None:
+        """Shift existing archives and compress the segment into slot `.0`.
+
+        ### Arguments:
+        * segment: str - Temporary path of the rotated segment.
+        * file_path: str - Active log file path used to name archives.
+        * backup_count: int - Number of archives to keep.
+        * compression: str - Compression identifier from `LogsRotationKeys`.
+        """
+        suffix: str = f".{compression}"
+        _shift_archives(file_path, backup_count, suffix)
+        target: str = f"{file_path}.0{suffix}"
+        partial: str = f"{target}.part"
+        if compression == LogsRotationKeys.GZIP:
+            from gzip import open as opener
+        else:
+            from lzma import open as opener  # type: ignore[assignment]
+        with open(segment, "rb") as src, opener(partial, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(partial, target)
+        os.remove(segment)
+
+
 class LoggerEngineStdout(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttributes):
     """Emit formatted log records to standard output."""
 
@@ -79,6 +240,29 @@ class LoggerEngineStdout(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttribute
         if not self._get_data(key=LogKeys.BUFFERED):
             sys.stdout.flush()
 
+    def send_many(self, messages: List[str]) -> None:
+        """Write a batch of messages to stdout with a single write call.
+
+        ### Arguments:
+        * messages: List[str] - Raw log payloads.
+
+        ### Returns:
+        None - Output is written to stdout.
+        """
+        if not messages:
+            return None
+        formatter: BLogFormatter = self._get_data(key=LogKeys.FORMATTER)  # type: ignore
+        name: Optional[str] = self.name
+        lines: List[str] = []
+        for message in messages:
+            if formatter:
+                message = formatter.format(message, name)
+            message = f"{message}"
+            lines.append(message if message.endswith("\n") else f"{message}\n")
+        sys.stdout.write("".join(lines))
+        if not self._get_data(key=LogKeys.BUFFERED):
+            sys.stdout.flush()
+
 
 class LoggerEngineStderr(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttributes):
     """Emit formatted log records to standard error."""
@@ -123,13 +307,56 @@ class LoggerEngineStderr(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttribute
         if not self._get_data(key=LogKeys.BUFFERED):
             sys.stderr.flush()
 
+    def send_many(self, messages: List[str]) -> None:
+        """Write a batch of messages to stderr with a single write call.
+
+        ### Arguments:
+        * messages: List[str] - Raw log payloads.
+
+        ### Returns:
+        None - Output is written to stderr.
+        """
+        if not messages:
+            return None
+        formatter: BLogFormatter = self._get_data(key=LogKeys.FORMATTER)  # type: ignore
+        name: Optional[str] = self.name
+        lines: List[str] = []
+        for message in messages:
+            if formatter:
+                message = formatter.format(message, name)
+            message = f"{message}"
+            lines.append(message if message.endswith("\n") else f"{message}\n")
+        sys.stderr.write("".join(lines))
+        if not self._get_data(key=LogKeys.BUFFERED):
+            sys.stderr.flush()
+
 
 class LoggerEngineFile(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttributes):
     """Append formatted log records to files stored on disk.
 
-    Supports optional size-based rotation with numbered suffixes when configured.
+    The log file is kept open between writes and its size is tracked in
+    memory. Output is flushed after every call unless `buffered` is set, in
+    which case `flush_interval` and `flush_bytes` decide when data hits the
+    disk. The file is reopened after rotation or when an external tool
+    (e.g. logrotate) moves it away.
+
+    Supports optional size-based and time-based rotation with numbered
+    suffixes when configured. Rotated segments may be compressed by a
+    background `ThLogArchiver` thread.
     """
 
+    #: Encoding of the log files; sizes are tracked in encoded bytes.
+    ENCODING: str = "utf-8"
+
+    __handle: Optional[TextIO] = None
+    __rollover_at: Optional[float] = None
+    __path: Optional[str] = None
+    __inode: Optional[Tuple[int, int]] = None
+    __size: int = 0
+    __pending: int = 0
+    __last_flush: float = 0.0
+    __last_check: float = 0.0
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -152,6 +379,15 @@ class LoggerEngineFile(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttributes)
             set_default_type=Optional[BLogFormatter],
         )
 
+    def __del__(self) -> None:
+        try:
+            self.close()
+            archiver: Optional[ThLogArchiver] = self._get_data(key=_Keys.ARCHIVER)
+            if archiver is not None:
+                archiver.stop()
+        except Exception:
+            pass
+
     def send(self, message: str) -> None:
         """Append the formatted message to the configured log file.
 
@@ -174,13 +410,281 @@ class LoggerEngineFile(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttributes)
                     self._c_name,
                     currentframe(),
                 )
-            log_dir: str = self.logdir if self.logdir else ""
-            file_path = os.path.join(log_dir, self.logfile)
-            self._rotate_if_needed(file_path, len(f"{message}\n"))
-            with open(file_path, "a") as file:
-                if file.writable:
-                    file.write(message)
-                    file.write("\n")
+            self._write_lines([f"{message}\n"])
+
+    def send_many(self, messages: List[str]) -> None:
+        """Append a batch of formatted messages to the configured log file.
+
+        The batch is written with a single write call and rotated between
+        messages when the configured size threshold is reached.
+
+        ### Arguments:
+        * messages: List[str] - Raw log payloads.
+
+        ### Returns:
+        None - The file on disk is updated.
+
+        ### Raises:
+        * ValueError: Raised when `logfile` is not configured.
+        """
+        formatter: BLogFormatter = self._get_data(key=LogKeys.FORMATTER)  # type: ignore
+        if not formatter or not messages:
+            return None
+        if self.logfile is None:
+            raise Raise.error(
+                f"The {self._c_name} is not configured correctly.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        name: Optional[str] = self.name
+        self._write_lines(
+            [f"{formatter.format(message, name)}\n" for message in messages]
+        )
+
+    def flush(self) -> None:
+        """Flush buffered log data to disk.
+
+        ### Returns:
+        None - Pending data is written to the open file.
+        """
+        if self.__handle is not None:
+            self.__handle.flush()
+        self.__pending = 0
+        self.__last_flush = time.monotonic()
+
+    def flush_due(self) -> None:
+        """Flush buffered data kept longer than `flush_interval`.
+
+        Called by `ThLoggerProcessor` while the queue is idle, so buffered
+        output reaches the disk even when no further messages arrive.
+
+        ### Returns:
+        None - Pending data is written when its deadline has passed.
+        """
+        if (
+            self.__pending
+            and time.monotonic() - self.__last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def close(self) -> None:
+        """Flush and close the log file handle.
+
+        The file is reopened automatically by the next write.
+
+        ### Returns:
+        None - The handle is released.
+        """
+        handle: Optional[TextIO] = self.__handle
+        self.__handle = None
+        self.__path = None
+        self.__inode = None
+        self.__size = 0
+        self.__pending = 0
+        self.__rollover_at = None
+        if handle is not None:
+            handle.close()
+
+    def wait_for_archives(self) -> None:
+        """Block until background compression of rotated segments completes.
+
+        ### Returns:
+        None - Returns immediately when compression is not in use.
+        """
+        archiver: Optional[ThLogArchiver] = self._get_data(key=_Keys.ARCHIVER)
+        if archiver is not None:
+            archiver.join_jobs()
+
+    def _write_lines(self, lines: List[str]) -> None:
+        """Write terminated lines to the log file, rotating and flushing as needed.
+
+        ### Arguments:
+        * lines: List[str] - Formatted lines including trailing newlines.
+        """
+        log_dir: str = self.logdir if self.logdir else ""
+        file_path = os.path.join(log_dir, self.logfile)  # type: ignore
+        handle: TextIO = self.__get_handle(file_path)
+        max_bytes = self.rotation_max_bytes
+        backup_count = self.rotation_backup_count
+        if self.__rollover_at is not None and time.time() >= self.__rollover_at:
+            if backup_count > 0 and self.__size > 0:
+                self._perform_rotation(file_path, backup_count)
+                handle = self.__get_handle(file_path)
+            else:
+                self.__rollover_at = self.__compute_rollover(time.time())
+        if max_bytes is None or backup_count == 0:
+            data: str = "".join(lines)
+            handle.write(data)
+            size: int = self.__byte_len(data)
+            self.__size += size
+            self.__pending += size
+        else:
+            chunk: List[str] = []
+            chunk_size: int = 0
+            for line in lines:
+                length = self.__byte_len(line)
+                if self.__size + chunk_size + length > max_bytes:
+                    if chunk:
+                        handle.write("".join(chunk))
+                        self.__size += chunk_size
+                        self.__pending += chunk_size
+                        chunk = []
+                        chunk_size = 0
+                    if self._rotate_if_needed(file_path, length):
+                        handle = self.__get_handle(file_path)
+                chunk.append(line)
+                chunk_size += length
+            if chunk:
+                handle.write("".join(chunk))
+                self.__size += chunk_size
+                self.__pending += chunk_size
+        self.__flush_if_needed()
+
+    def __byte_len(self, data: str) -> int:
+        """Return the size of `data` once written to the log file.
+
+        ### Arguments:
+        * data: str - Text about to be written.
+
+        ### Returns:
+        int - Number of encoded bytes.
+        """
+        if data.isascii():
+            return len(data)
+        return len(data.encode(self.ENCODING))
+
+    def __get_handle(self, file_path: str) -> TextIO:
+        """Return an open handle for `file_path`, reopening it when required.
+
+        The inode of the path is compared with the open descriptor at most
+        once per `flush_interval`, which detects files moved by logrotate.
+
+        ### Arguments:
+        * file_path: str - Target log file path.
+
+        ### Returns:
+        TextIO - Open file handle in append mode.
+        """
+        if self.__handle is not None and self.__path == file_path:
+            now: float = time.monotonic()
+            if now - self.__last_check < self.flush_interval:
+                return self.__handle
+            self.__last_check = now
+            try:
+                st = os.stat(file_path)
+                if (st.st_dev, st.st_ino) == self.__inode:
+                    return self.__handle
+            except FileNotFoundError:
+                pass
+        self.close()
+        handle: TextIO = open(file_path, "a", encoding=self.ENCODING)
+        st = os.fstat(handle.fileno())
+        self.__handle = handle
+        self.__path = file_path
+        self.__inode = (st.st_dev, st.st_ino)
+        self.__size = st.st_size
+        self.__pending = 0
+        self.__last_flush = self.__last_check = time.monotonic()
+        self.__rollover_at = self.__compute_rollover(st.st_mtime)
+        return handle
+
+    def __compute_rollover(self, since: float) -> Optional[float]:
+        """Return the time of the next time-based rotation.
+
+        ### Arguments:
+        * since: float - Reference timestamp, usually the file modification time.
+
+        ### Returns:
+        Optional[float] - Epoch timestamp or None when time rotation is disabled.
+        """
+        when: Optional[str] = self.rotation_when
+        if when is None:
+            return None
+        if when == LogsRotationKeys.DAILY:
+            return since + 86400.0
+        start: datetime = datetime.fromtimestamp(since)
+        if when == LogsRotationKeys.HOURLY:
+            start = start.replace(minute=0, second=0, microsecond=0)
+            return (start + timedelta(hours=1)).timestamp()
+        start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        return (start + timedelta(days=1)).timestamp()
+
+    def __flush_if_needed(self) -> None:
+        """Flush according to the `buffered`, `flush_interval` and `flush_bytes` settings."""
+        if (
+            not self._get_data(key=LogKeys.BUFFERED)
+            or self.__pending >= self.flush_bytes
+            or time.monotonic() - self.__last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    @property
+    def flush_interval(self) -> float:
+        """Return the maximum time buffered data is kept before flushing.
+
+        The same interval limits how often the file is checked for being
+        moved by an external rotation tool.
+
+        ### Returns:
+        float - Interval in seconds.
+        """
+        return self._get_data(key=LogKeys.FLUSH_INTERVAL, default_value=1.0)  # type: ignore
+
+    @flush_interval.setter
+    def flush_interval(self, interval: float) -> None:
+        """Configure the maximum time buffered data is kept before flushing.
+
+        ### Arguments:
+        * interval: float - Non-negative interval in seconds.
+
+        ### Returns:
+        None - Internal configuration updated.
+
+        ### Raises:
+        * ValueError: When `interval` is negative.
+        """
+        if interval < 0:
+            raise Raise.error(
+                f"Expected non-negative flush interval, received: '{interval}'.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        self._set_data(
+            key=LogKeys.FLUSH_INTERVAL, value=float(interval), set_default_type=float
+        )
+
+    @property
+    def flush_bytes(self) -> int:
+        """Return the amount of buffered data that forces a flush.
+
+        ### Returns:
+        int - Threshold in characters.
+        """
+        return self._get_data(key=LogKeys.FLUSH_BYTES, default_value=65536)  # type: ignore
+
+    @flush_bytes.setter
+    def flush_bytes(self, size: int) -> None:
+        """Configure the amount of buffered data that forces a flush.
+
+        ### Arguments:
+        * size: int - Positive threshold in characters.
+
+        ### Returns:
+        None - Internal configuration updated.
+
+        ### Raises:
+        * ValueError: When `size` is not positive.
+        """
+        if size <= 0:
+            raise Raise.error(
+                f"Expected positive flush size, received: '{size}'.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        self._set_data(key=LogKeys.FLUSH_BYTES, value=size, set_default_type=int)
 
     @property
     def logdir(self) -> Optional[str]:
@@ -207,6 +711,7 @@ class LoggerEngineFile(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttributes)
         if not pc_ld.exists:
             pc_ld.create()
         if pc_ld.exists and pc_ld.is_dir:
+            self.close()
             self._set_data(key=LogKeys.DIR, value=pc_ld.path)
 
     @property
@@ -255,6 +760,7 @@ class LoggerEngineFile(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttributes)
                     currentframe(),
                 )
         self.logdir = pc_ld.dirname if pc_ld.dirname else ""
+        self.close()
         self._set_data(key=LogKeys.FILE, value=pc_ld.filename)
 
     @property
@@ -327,34 +833,137 @@ class LoggerEngineFile(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttributes)
             return
         self._set_data(key=LogKeys.ROTATE_COUNT, value=count, set_default_type=int)
 
-    def _rotate_if_needed(self, file_path: str, incoming_length: int) -> None:
-        """Rotate the log file when size and backup thresholds are met."""
+    def _rotate_if_needed(self, file_path: str, incoming_length: int) -> bool:
+        """Rotate the log file when size and backup thresholds are met.
+
+        ### Arguments:
+        * file_path: str - Active log file path.
+        * incoming_length: int - Size in bytes of the data about to be written.
+
+        ### Returns:
+        bool - True when the file was rotated.
+        """
         max_bytes = self.rotation_max_bytes
         backup_count = self.rotation_backup_count
         if max_bytes is None or backup_count == 0:
-            return
-        try:
-            current_size = os.path.getsize(file_path)
-        except FileNotFoundError:
-            return
+            return False
+        if self.__handle is not None and self.__path == file_path:
+            current_size = self.__size
+        else:
+            try:
+                current_size = os.path.getsize(file_path)
+            except FileNotFoundError:
+                return False
         if (current_size + incoming_length) <= max_bytes:
-            return
+            return False
         self._perform_rotation(file_path, backup_count)
+        return True
+
+    @property
+    def rotation_when(self) -> Optional[str]:
+        """Return the time-based rotation schedule.
+
+        ### Returns:
+        Optional[str] - Identifier from `LogsRotationKeys.when_keys` or None.
+        """
+        return self._get_data(key=LogKeys.ROTATE_WHEN, default_value=None)
+
+    @rotation_when.setter
+    def rotation_when(self, when: Optional[str]) -> None:
+        """Configure time-based rotation, used alongside size-based rotation.
+
+        Rotation also requires a positive `rotation_backup_count`.
+
+        ### Arguments:
+        * when: Optional[str] - `HOURLY`, `DAILY` or `MIDNIGHT`; None disables it.
+
+        ### Returns:
+        None - Internal configuration updated.
+
+        ### Raises:
+        * KeyError: When `when` is not a known schedule.
+        """
+        if when is None:
+            self._delete_data(key=LogKeys.ROTATE_WHEN)
+        elif when not in LogsRotationKeys.when_keys:
+            raise Raise.error(
+                f"Rotation schedule not found: '{when}'",
+                KeyError,
+                self._c_name,
+                currentframe(),
+            )
+        else:
+            self._set_data(key=LogKeys.ROTATE_WHEN, value=when, set_default_type=str)
+        self.close()
+
+    @property
+    def rotation_compression(self) -> Optional[str]:
+        """Return the compression applied to rotated segments.
+
+        ### Returns:
+        Optional[str] - Identifier from `LogsRotationKeys.compression_keys` or None.
+        """
+        return self._get_data(key=LogKeys.ROTATE_COMPRESS, default_value=None)
+
+    @rotation_compression.setter
+    def rotation_compression(self, compression: Optional[str]) -> None:
+        """Configure compression of rotated segments.
+
+        Archives are named `app.log.0.gz`, `app.log.1.gz`, ... and are
+        produced by a background thread.
+
+        ### Arguments:
+        * compression: Optional[str] - `gz` or `xz`; None keeps plain archives.
+
+        ### Returns:
+        None - Internal configuration updated.
+
+        ### Raises:
+        * KeyError: When `compression` is not supported.
+        """
+        if compression is None:
+            self._delete_data(key=LogKeys.ROTATE_COMPRESS)
+            return
+        if compression not in LogsRotationKeys.compression_keys:
+            raise Raise.error(
+                f"Compression type not found: '{compression}'",
+                KeyError,
+                self._c_name,
+                currentframe(),
+            )
+        self._set_data(
+            key=LogKeys.ROTATE_COMPRESS, value=compression, set_default_type=str
+        )
 
     def _perform_rotation(self, file_path: str, backup_count: int) -> None:
-        """Perform numbered rotation using suffixes `.0`, `.1`, etc."""
+        """Perform numbered rotation using suffixes `.0`, `.1`, etc.
+
+        With compression enabled the active file is only renamed here;
+        shifting and compression are delegated to `ThLogArchiver`.
+        """
         if backup_count <= 0:
             return
-        highest_path = f"{file_path}.{backup_count - 1}"
-        if os.path.exists(highest_path):
-            os.remove(highest_path)
-        for index in range(backup_count - 1, 0, -1):
-            src = f"{file_path}.{index - 1}"
-            dst = f"{file_path}.{index}"
-            if os.path.exists(src):
-                os.replace(src, dst)
-        if os.path.exists(file_path):
-            os.replace(file_path, f"{file_path}.0")
+        self.close()
+        compression: Optional[str] = self.rotation_compression
+        if compression is None:
+            _shift_archives(file_path, backup_count)
+            if os.path.exists(file_path):
+                os.replace(file_path, f"{file_path}.0")
+            return
+        if not os.path.exists(file_path):
+            return
+        segment: str = f"{file_path}.{time.time_ns()}.rotated"
+        os.replace(file_path, segment)
+        archiver: Optional[ThLogArchiver] = self._get_data(key=_Keys.ARCHIVER)
+        if archiver is None or not archiver.is_alive():
+            archiver = ThLogArchiver()
+            self._set_data(
+                key=_Keys.ARCHIVER,
+                value=archiver,
+                set_default_type=Optional[ThLogArchiver],
+            )
+            archiver.start()
+        archiver.archive(segment, file_path, backup_count, compression)
 
 
 class LoggerEngineSyslog(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttributes):
@@ -520,5 +1129,559 @@ class LoggerEngineSyslog(ILoggerEngine, BLoggerEngine, BData, NoDynamicAttribute
             priority=self._get_data(LogKeys.LEVEL), message=message
         )
 
+    def send_many(self, messages: List[str]) -> None:
+        """Emit a batch of messages to syslog.
+
+        The C `syslog` module has no batch call, so the handle, level and
+        formatter are resolved once and messages are emitted in a loop.
+
+        ### Arguments:
+        * messages: List[str] - Raw log payloads.
+
+        ### Returns:
+        None - Messages are forwarded to syslog with configured facility/level.
+        """
+        if not messages:
+            return None
+        formatter: BLogFormatter = self._get_data(key=LogKeys.FORMATTER)  # type: ignore
+        name: Optional[str] = self.name
+        if self._get_data(key=LogKeys.SYSLOG) is None:
+            self._set_data(key=LogKeys.SYSLOG, value=syslog)
+            self._get_data(key=LogKeys.SYSLOG).openlog(facility=self._get_data(key=LogKeys.FACILITY))  # type: ignore
+        s_slog = self._get_data(key=LogKeys.SYSLOG)
+        priority: int = self._get_data(LogKeys.LEVEL)  # type: ignore
+        for message in messages:
+            if formatter:
+                message = formatter.format(message, name)
+            s_slog.syslog(priority=priority, message=message)  # type: ignore
+
+
+class LoggerEngineSyslogSocket(LoggerEngineSyslog):
+    """Send log records to a syslog collector over a plain socket.
+
+    Unlike `LoggerEngineSyslog`, which calls the C `syslog` module, this
+    engine builds RFC 3164 or RFC 5424 messages itself and writes them to
+    a Unix socket (e.g. `/dev/log`), a UDP collector or a TCP collector.
+
+    Sockets are non-blocking. Datagrams that cannot be sent immediately are
+    dropped and counted in `dropped`. TCP frames use octet counting and are
+    kept in a bounded pending buffer while the connection is established or
+    congested; reconnection uses exponential backoff and never blocks the
+    calling thread. Collector host names are resolved once by a background
+    thread; datagrams sent before the lookup completes are dropped.
+    """
+
+    #: Upper bound of bytes kept for a stream connection.
+    MAX_PENDING: int = 1024 * 1024
+    #: Initial reconnect delay in seconds.
+    RECONNECT_MIN: float = 0.5
+    #: Maximum reconnect delay in seconds.
+    RECONNECT_MAX: float = 30.0
+    #: Seconds `close()` waits for pending stream frames to be written.
+    CLOSE_TIMEOUT: float = 1.0
+
+    __MONTHS: Tuple[str, ...] = (
+        "Jan",
+        "Feb",
+        "Mar",
+        "Apr",
+        "May",
+        "Jun",
+        "Jul",
+        "Aug",
+        "Sep",
+        "Oct",
+        "Nov",
+        "Dec",
+    )
+
+    __sock: Optional[socket.socket] = None
+    __stream: bool = False
+    __connecting: bool = False
+    __resolved: Optional[Tuple[int, Any]] = None
+    __resolver: Optional[threading.Thread] = None
+    __resolve_failed: bool = False
+    __frames: Optional[Deque[bytes]] = None
+    __offset: int = 0
+    __pending: int = 0
+    __retry_at: float = 0.0
+    __backoff: float = 0.0
+    __dropped: int = 0
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        formatter: Optional[BLogFormatter] = None,
+        buffered: bool = False,
+        transport: str = SysLogSocketKeys.UNIX,
+        address: Optional[Union[str, Tuple[str, int]]] = None,
+        rfc: Optional[str] = None,
+    ) -> None:
+        """Initialise socket syslog engine configuration.
+
+        ### Arguments:
+        * name: Optional[str] - Logger name, also used as the syslog APP-NAME.
+        * formatter: Optional[BLogFormatter] - Formatter applied prior to emission.
+        * buffered: bool - Kept for interface compatibility.
+        * transport: str - One of `SysLogSocketKeys.transport_keys`.
+        * address: Optional[Union[str, Tuple[str, int]]] - Socket path for
+          `UNIX` or `(host, port)` for `UDP`/`TCP`; defaults to `/dev/log`
+          or `("localhost", 514)`.
+        * rfc: Optional[str] - One of `SysLogSocketKeys.format_keys`; defaults
+          to `RFC3164` for `UNIX` and `RFC5424` otherwise.
+
+        ### Raises:
+        * ValueError: When transport or message format is unknown.
+        * TypeError: When address does not match the transport.
+        """
+        super().__init__(name=name, formatter=formatter, buffered=buffered)
+        if transport not in SysLogSocketKeys.transport_keys:
+            raise Raise.error(
+                f"Unknown syslog transport: '{transport}'",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        if address is None:
+            if transport == SysLogSocketKeys.UNIX:
+                address = "/dev/log"
+            else:
+                address = ("localhost", 514)
+        if transport == SysLogSocketKeys.UNIX:
+            if not isinstance(address, str):
+                raise Raise.error(
+                    f"Expected str socket path, received: '{type(address)}'",
+                    TypeError,
+                    self._c_name,
+                    currentframe(),
+                )
+        elif (
+            not isinstance(address, tuple)
+            or len(address) != 2
+            or not isinstance(address[0], str)
+            or not isinstance(address[1], int)
+        ):
+            raise Raise.error(
+                f"Expected (host, port) tuple, received: '{address}'",
+                TypeError,
+                self._c_name,
+                currentframe(),
+            )
+        if rfc is None:
+            if transport == SysLogSocketKeys.UNIX:
+                rfc = SysLogSocketKeys.RFC3164
+            else:
+                rfc = SysLogSocketKeys.RFC5424
+        if rfc not in SysLogSocketKeys.format_keys:
+            raise Raise.error(
+                f"Unknown syslog message format: '{rfc}'",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        self._set_data(key=LogKeys.TRANSPORT, value=transport, set_default_type=str)
+        self._set_data(
+            key=LogKeys.ADDRESS,
+            value=address,
+            set_default_type=Union[str, Tuple],
+        )
+        self._set_data(key=LogKeys.RFC, value=rfc, set_default_type=str)
+        self.__frames = deque()
+        self.__stream = transport == SysLogSocketKeys.TCP
+        if transport != SysLogSocketKeys.UNIX:
+            self.__resolve()
+
+    def __del__(self) -> None:
+        try:
+            self.close(0.0)
+        except Exception:
+            pass
+
+    @property
+    def transport(self) -> str:
+        """Return the configured transport.
+
+        ### Returns:
+        str - One of `SysLogSocketKeys.transport_keys`.
+        """
+        return self._get_data(key=LogKeys.TRANSPORT)  # type: ignore
+
+    @property
+    def address(self) -> Union[str, Tuple[str, int]]:
+        """Return the configured collector address.
+
+        ### Returns:
+        Union[str, Tuple[str, int]] - Socket path or `(host, port)` tuple.
+        """
+        return self._get_data(key=LogKeys.ADDRESS)  # type: ignore
+
+    @property
+    def rfc(self) -> str:
+        """Return the configured message format.
+
+        ### Returns:
+        str - One of `SysLogSocketKeys.format_keys`.
+        """
+        return self._get_data(key=LogKeys.RFC)  # type: ignore
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of messages dropped since creation.
+
+        ### Returns:
+        int - Messages lost to a full socket, full pending buffer or broken
+        connection.
+        """
+        return self.__dropped
+
+    @property
+    def connected(self) -> bool:
+        """Return True when the socket is open and ready for writing.
+
+        ### Returns:
+        bool - Connection state.
+        """
+        return self.__sock is not None and not self.__connecting
+
+    def send(self, message: str) -> None:
+        """Emit a single message to the syslog socket.
+
+        ### Arguments:
+        * message: str - Raw log payload.
+
+        ### Returns:
+        None - Message is sent or queued for the stream connection.
+        """
+        self.send_many([message])
+
+    def send_many(self, messages: List[str]) -> None:
+        """Emit a batch of messages to the syslog socket.
+
+        The message header is built once per batch. Stream transports append
+        all frames to the pending buffer and write it with as few calls as
+        the socket accepts.
+
+        ### Arguments:
+        * messages: List[str] - Raw log payloads.
+
+        ### Returns:
+        None - Messages are sent, queued or counted as dropped.
+        """
+        if not messages:
+            return None
+        formatter: Optional[BLogFormatter] = self._get_data(key=LogKeys.FORMATTER)
+        name: Optional[str] = self.name
+        if formatter:
+            messages = [formatter.format(message, name) for message in messages]
+        header: bytes = self.__header()
+        sock: Optional[socket.socket] = self.__get_socket()
+        if not self.__stream:
+            if sock is None:
+                self.__dropped += len(messages)
+                return None
+            for index, message in enumerate(messages):
+                try:
+                    sock.send(header + message.encode("utf-8", "replace"))
+                except (BlockingIOError, InterruptedError):
+                    self.__dropped += 1
+                except OSError as ex:
+                    self.__dropped += 1
+                    if ex.errno not in (errno.ECONNREFUSED, errno.EMSGSIZE):
+                        self.__dropped += len(messages) - index - 1
+                        self.__disconnect()
+                        return None
+            return None
+        for message in messages:
+            self.__push_frame(header + message.encode("utf-8", "replace"))
+        if sock is not None:
+            self.__flush_stream()
+
+    def flush(self) -> None:
+        """Write as much of the pending stream buffer as the socket accepts.
+
+        ### Returns:
+        None - Returns immediately for datagram transports.
+        """
+        if self.__stream and self.__get_socket() is not None:
+            self.__flush_stream()
+
+    def flush_due(self) -> None:
+        """Write pending stream frames while the logger queue is idle.
+
+        Frames queued during a pending connect are otherwise written only by
+        the next `send()`.
+
+        ### Returns:
+        None - Returns immediately for datagram transports.
+        """
+        self.flush()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write pending stream frames, then close the socket.
+
+        ### Arguments:
+        * timeout: Optional[float] - Seconds to wait for pending frames;
+          defaults to `CLOSE_TIMEOUT`. Frames still pending afterwards are
+          dropped.
+
+        ### Returns:
+        None - The next send opens a new connection.
+        """
+        if timeout is None:
+            timeout = self.CLOSE_TIMEOUT
+        if self.__stream and self.__frames and timeout > 0:
+            self.__drain(timeout)
+        self.__disconnect()
+        if self.__frames:
+            self.__dropped += len(self.__frames)
+            self.__frames.clear()
+        self.__offset = 0
+        self.__pending = 0
+        self.__retry_at = 0.0
+        self.__backoff = 0.0
+
+    def __header(self) -> bytes:
+        """Build the message header for the current batch.
+
+        ### Returns:
+        bytes - Encoded header including PRI, timestamp and tag.
+        """
+        pri: int = self.facility | self.level
+        app: str = (self.name or os.path.basename(sys.argv[0]) or "-").replace(" ", "_")
+        now: datetime = datetime.now()
+        if self.rfc == SysLogSocketKeys.RFC5424:
+            return (
+                f"<{pri}>1 {now.astimezone().isoformat(timespec='microseconds')} "
+                f"{socket.gethostname() or '-'} {app} {os.getpid()} - - "
+            ).encode("utf-8", "replace")
+        stamp: str = f"{self.__MONTHS[now.month - 1]} {now.day:2d} {now:%H:%M:%S}"
+        if self.transport == SysLogSocketKeys.UNIX:
+            return f"<{pri}>{stamp} {app}[{os.getpid()}]: ".encode("utf-8", "replace")
+        return f"<{pri}>{stamp} {socket.gethostname()} {app}[{os.getpid()}]: ".encode(
+            "utf-8", "replace"
+        )
+
+    def __push_frame(self, payload: bytes) -> None:
+        """Append a stream frame to the pending buffer.
+
+        ### Arguments:
+        * payload: bytes - Encoded syslog message.
+        """
+        if self.transport == SysLogSocketKeys.TCP:
+            frame: bytes = b"%d %s" % (len(payload), payload)
+        else:
+            frame = payload + b"\n"
+        if self.__pending + len(frame) > self.MAX_PENDING:
+            self.__dropped += 1
+            return None
+        self.__frames.append(frame)  # type: ignore
+        self.__pending += len(frame)
+
+    def __flush_stream(self) -> None:
+        """Write pending frames until the socket would block."""
+        frames: Deque[bytes] = self.__frames  # type: ignore
+        sock: Optional[socket.socket] = self.__sock
+        while frames and sock is not None:
+            chunk: bytearray = bytearray(frames[0][self.__offset :])
+            for index in range(1, len(frames)):
+                if len(chunk) >= 65536:
+                    break
+                chunk += frames[index]
+            try:
+                sent: int = sock.send(chunk)
+            except (BlockingIOError, InterruptedError):
+                return None
+            except OSError:
+                self.__disconnect()
+                return None
+            while sent and frames:
+                remain: int = len(frames[0]) - self.__offset
+                if sent >= remain:
+                    sent -= remain
+                    self.__pending -= len(frames.popleft())
+                    self.__offset = 0
+                else:
+                    self.__offset += sent
+                    sent = 0
+
+    def __drain(self, timeout: float) -> None:
+        """Write pending stream frames, waiting for the socket up to `timeout`.
+
+        ### Arguments:
+        * timeout: float - Maximum wait time in seconds.
+        """
+        deadline: float = time.monotonic() + timeout
+        while self.__frames:
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            resolver: Optional[threading.Thread] = self.__resolver
+            if self.__resolved is None and resolver is not None and resolver.is_alive():
+                resolver.join(remaining)
+                continue
+            if self.__get_socket() is not None:
+                self.__flush_stream()
+                if not self.__frames:
+                    return None
+            sock: Optional[socket.socket] = self.__sock
+            if sock is None:
+                # connection failed, the next attempt waits for the backoff
+                return None
+            try:
+                select.select([], [sock], [], remaining)
+            except (OSError, ValueError):
+                return None
+
+    def __get_socket(self) -> Optional[socket.socket]:
+        """Return a writable socket, connecting without blocking if needed.
+
+        ### Returns:
+        Optional[socket.socket] - Ready socket or None while unavailable.
+        """
+        if self.__sock is not None:
+            if not self.__connecting:
+                return self.__sock
+            try:
+                _, writable, _ = select.select([], [self.__sock], [], 0)
+            except (OSError, ValueError):
+                self.__disconnect()
+                return None
+            if not writable:
+                return None
+            err: int = self.__sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            if err:
+                self.__disconnect()
+                return None
+            self.__connecting = False
+            self.__backoff = 0.0
+            return self.__sock
+        if time.monotonic() < self.__retry_at:
+            return None
+        try:
+            self.__connect()
+        except OSError:
+            self.__disconnect()
+            return None
+        if self.__sock is None or self.__connecting:
+            return None
+        self.__backoff = 0.0
+        return self.__sock
+
+    def __resolve(self) -> None:
+        """Start resolving the collector address without blocking.
+
+        Numeric addresses are converted at once; host names are looked up
+        by a daemon thread and the result is cached for reconnects.
+        """
+        host, port = self.address
+        sock_type: int = self.__sock_type()
+        try:
+            info = socket.getaddrinfo(
+                host, port, 0, sock_type, 0, socket.AI_NUMERICHOST
+            )
+        except (OSError, UnicodeError):
+            pass
+        else:
+            self.__resolved = (info[0][0], info[0][4])
+            return None
+        if self.__resolver is not None and self.__resolver.is_alive():
+            return None
+        self.__resolver = threading.Thread(
+            target=self.__lookup,
+            args=(host, port, sock_type),
+            name=f"{self._c_name}-resolver",
+            daemon=True,
+        )
+        self.__resolver.start()
+
+    def __lookup(self, host: str, port: int, sock_type: int) -> None:
+        """Resolve the collector host name; runs on the resolver thread.
+
+        ### Arguments:
+        * host: str - Collector host name.
+        * port: int - Collector port.
+        * sock_type: int - Socket type of the transport.
+        """
+        try:
+            info = socket.getaddrinfo(host, port, 0, sock_type)
+        except (OSError, UnicodeError):
+            self.__resolve_failed = True
+            return None
+        self.__resolved = (info[0][0], info[0][4])
+
+    def __sock_type(self) -> int:
+        """Return the socket type of the network transport."""
+        if self.transport == SysLogSocketKeys.TCP:
+            return socket.SOCK_STREAM
+        return socket.SOCK_DGRAM
+
+    def __connect(self) -> None:
+        """Open the socket for the configured transport.
+
+        ### Raises:
+        * OSError: When the socket cannot be created or connected.
+        """
+        transport: str = self.transport
+        address: Any = self.address
+        if transport == SysLogSocketKeys.UNIX:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            try:
+                sock.connect(address)
+                self.__stream = False
+            except OSError as ex:
+                sock.close()
+                if ex.errno != errno.EPROTOTYPE:
+                    raise
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    sock.connect(address)
+                except OSError:
+                    sock.close()
+                    raise
+                self.__stream = True
+            sock.setblocking(False)
+            self.__sock = sock
+            return None
+        if self.__resolved is None:
+            if self.__resolve_failed:
+                self.__resolve_failed = False
+                raise OSError(
+                    errno.EHOSTUNREACH, f"Cannot resolve host: '{address[0]}'"
+                )
+            self.__resolve()
+            if self.__resolved is None:
+                return None
+        sock_type: int = self.__sock_type()
+        family, sockaddr = self.__resolved
+        sock = socket.socket(family, sock_type)
+        sock.setblocking(False)
+        result: int = sock.connect_ex(sockaddr)
+        if result in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+            self.__connecting = True
+        elif result != 0:
+            sock.close()
+            raise OSError(result, os.strerror(result))
+        self.__sock = sock
+
+    def __disconnect(self) -> None:
+        """Close the socket and schedule the next reconnect attempt."""
+        sock: Optional[socket.socket] = self.__sock
+        self.__sock = None
+        self.__connecting = False
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+        if self.__offset and self.__frames:
+            # a partially written frame cannot be resumed on a new connection
+            self.__pending -= len(self.__frames.popleft())
+            self.__offset = 0
+            self.__dropped += 1
+        self.__backoff = min(
+            self.RECONNECT_MAX, max(self.RECONNECT_MIN, self.__backoff * 2)
+        )
+        self.__retry_at = time.monotonic() + self.__backoff
+
 
 # #[EOF]#######################################################################
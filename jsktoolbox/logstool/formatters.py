@@ -6,13 +6,44 @@ Created: 2023-10-10
 Purpose: Provide reusable log formatter implementations.
 
 Each formatter composes a list of format segments consumed by `BLogFormatter`
-to render message payloads consistently across engines.
+to render message payloads consistently across engines. Time prefixes are
+rendered at most once per second and reused for every record in between.
 """
 
+import json
+import time
+
 from datetime import datetime
+from typing import Any, Callable, Dict, Optional
 
 from ..basetool.logs import BLogFormatter
 from ..datetool import Timestamp
+from .records import LogRecord
+
+
+class _BCachedClockFormatter(BLogFormatter):
+    """Base formatter caching a rendered time prefix per second.
+
+    For internal purpose only.
+    """
+
+    __clock_second: int = -1
+    __clock_value: str = ""
+
+    def _cached_clock_(self, render: Callable[[], object]) -> str:
+        """Return the rendered time, calling `render` once per wall-clock second.
+
+        ### Arguments:
+        * render: Callable[[], object] - Function producing the current time string.
+
+        ### Returns:
+        str - Cached or freshly rendered time string.
+        """
+        second: int = int(time.time())
+        if second != self.__clock_second:
+            self.__clock_value = f"{render()}"
+            self.__clock_second = second
+        return self.__clock_value
 
 
 class LogFormatterNull(BLogFormatter):
@@ -28,7 +59,7 @@ class LogFormatterNull(BLogFormatter):
         self._forms_.append("[{name}]: {message}")
 
 
-class LogFormatterDateTime(BLogFormatter):
+class LogFormatterDateTime(_BCachedClockFormatter):
     """Prefix log messages with the current local date and time."""
 
     def __init__(self) -> None:
@@ -45,12 +76,12 @@ class LogFormatterDateTime(BLogFormatter):
         """Return the current local datetime string.
 
         ### Returns:
-        str - Timestamp in `%Y-%m-%d %H:%M:%S` format.
+        str - Timestamp in `%Y-%m-%d %H:%M:%S` format, cached per second.
         """
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return self._cached_clock_(lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
 
-class LogFormatterTime(BLogFormatter):
+class LogFormatterTime(_BCachedClockFormatter):
     """Prefix log messages with the current local time."""
 
     def __init__(self) -> None:
@@ -67,12 +98,12 @@ class LogFormatterTime(BLogFormatter):
         """Return the current local time string.
 
         ### Returns:
-        str - Timestamp in `%H:%M:%S` format.
+        str - Timestamp in `%H:%M:%S` format, cached per second.
         """
-        return datetime.now().strftime("%H:%M:%S")
+        return self._cached_clock_(lambda: datetime.now().strftime("%H:%M:%S"))
 
 
-class LogFormatterTimestamp(BLogFormatter):
+class LogFormatterTimestamp(_BCachedClockFormatter):
     """Prefix log messages with a high-resolution numeric timestamp."""
 
     def __init__(self) -> None:
@@ -81,9 +112,50 @@ class LogFormatterTimestamp(BLogFormatter):
         ### Returns:
         None - Populates the formatter template list.
         """
-        self._forms_.append(Timestamp.now())
+        self._forms_.append(self.__get_timestamp__)
         self._forms_.append("{message}")
         self._forms_.append("[{name}]: {message}")
 
+    def __get_timestamp__(self) -> str:
+        """Return the current Unix timestamp.
+
+        ### Returns:
+        str - Value of `Timestamp.now()`, cached per second.
+        """
+        return self._cached_clock_(Timestamp.now)
+
+
+class LogFormatterJson(BLogFormatter):
+    """Serialise log records as single-line JSON objects.
+
+    Engines using this formatter receive `LogRecord` objects unformatted and
+    each record is serialised exactly once. Plain string messages are
+    wrapped with the current time and the engine name. Values that JSON
+    cannot represent are converted with `str()`.
+    """
+
+    structured: bool = True
+
+    def format(self, message: Any, name: Optional[str] = None) -> str:
+        """Render a record or message as a JSON object.
+
+        ### Arguments:
+        * message: Any - `LogRecord` or plain log string.
+        * name: Optional[str] - Engine name, used for plain strings.
+
+        ### Returns:
+        str - JSON document without a trailing newline.
+        """
+        if isinstance(message, LogRecord):
+            data: Dict[str, Any] = message.to_dict()
+        else:
+            data = {
+                "time": time.time(),
+                "level": None,
+                "name": name,
+                "message": f"{message}",
+            }
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
 
 # #[EOF]#######################################################################
@@ -24,6 +24,8 @@ class LogKeys(object, metaclass=ReadOnlyClass):
     DIR: str = "__dir__"
     FACILITY: str = "__facility__"
     FILE: str = "__file__"
+    FLUSH_BYTES: str = "__flush_bytes__"
+    FLUSH_INTERVAL: str = "__flush_interval__"
     FORMATTER: str = "__formatter__"
     LEVEL: str = "__level__"
     NAME: str = "__name__"
@@ -32,6 +34,11 @@ class LogKeys(object, metaclass=ReadOnlyClass):
     SYSLOG: str = "__syslog__"
     ROTATE_SIZE: str = "__rotate_size__"
     ROTATE_COUNT: str = "__rotate_count__"
+    ROTATE_WHEN: str = "__rotate_when__"
+    ROTATE_COMPRESS: str = "__rotate_compress__"
+    ADDRESS: str = "__address__"
+    RFC: str = "__rfc__"
+    TRANSPORT: str = "__transport__"
 
 
 class SysLogKeys(object, metaclass=ReadOnlyClass):
@@ -97,6 +104,33 @@ class SysLogKeys(object, metaclass=ReadOnlyClass):
     )
 
 
+class SysLogSocketKeys(object, metaclass=ReadOnlyClass):
+    """Provide transport and message format identifiers for socket syslog engines."""
+
+    #: Local Unix domain socket, e.g. `/dev/log`.
+    UNIX: str = "UNIX"
+    #: Remote or local collector over UDP.
+    UDP: str = "UDP"
+    #: Remote or local collector over TCP with octet-counted framing.
+    TCP: str = "TCP"
+    #: BSD syslog message format.
+    RFC3164: str = "RFC3164"
+    #: IETF syslog message format.
+    RFC5424: str = "RFC5424"
+
+    #: Contains all supported transport identifiers.
+    transport_keys: tuple[str, ...] = (
+        UNIX,
+        UDP,
+        TCP,
+    )
+    #: Contains all supported message format identifiers.
+    format_keys: tuple[str, ...] = (
+        RFC3164,
+        RFC5424,
+    )
+
+
 class LogsLevelKeys(object, metaclass=ReadOnlyClass):
     """Provide symbolic identifiers for supported log severities."""
 
@@ -122,4 +156,52 @@ class LogsLevelKeys(object, metaclass=ReadOnlyClass):
     )
 
 
+class LogsRotationKeys(object, metaclass=ReadOnlyClass):
+    """Provide time-based rotation and compression identifiers for file engines."""
+
+    #: Rotate at the start of every hour.
+    HOURLY: str = "HOURLY"
+    #: Rotate 24 hours after the active file was last modified.
+    DAILY: str = "DAILY"
+    #: Rotate at local midnight.
+    MIDNIGHT: str = "MIDNIGHT"
+    #: Compress rotated segments with gzip (`.gz`).
+    GZIP: str = "gz"
+    #: Compress rotated segments with LZMA (`.xz`).
+    XZ: str = "xz"
+
+    #: Contains all supported time-based rotation identifiers.
+    when_keys: tuple[str, ...] = (
+        HOURLY,
+        DAILY,
+        MIDNIGHT,
+    )
+    #: Contains all supported compression identifiers.
+    compression_keys: tuple[str, ...] = (
+        GZIP,
+        XZ,
+    )
+
+
+class LogsQueuePolicyKeys(object, metaclass=ReadOnlyClass):
+    """Provide overflow policy identifiers for bounded `LoggerQueue` instances."""
+
+    #: Block the producer until space is available.
+    BLOCK: str = "BLOCK"
+    #: Discard the oldest queued entry to make room for the new one.
+    DROP_OLDEST: str = "DROP_OLDEST"
+    #: Discard the incoming entry.
+    DROP_NEWEST: str = "DROP_NEWEST"
+    #: Shed low-severity entries first, keep high-severity ones.
+    DROP_BY_LEVEL: str = "DROP_BY_LEVEL"
+
+    #: Contains all supported overflow policy identifiers.
+    keys: tuple[str, ...] = (
+        BLOCK,
+        DROP_OLDEST,
+        DROP_NEWEST,
+        DROP_BY_LEVEL,
+    )
+
+
 # #[EOF]#######################################################################
@@ -9,15 +9,15 @@ These classes orchestrate message queuing, engine dispatch, and background
 processing for the logging subsystem.
 """
 
-import time
 import threading
 from inspect import currentframe
 
-from typing import Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
 from .queue import LoggerQueue
+from .records import LogRecord
 
-from .keys import LogKeys, LogsLevelKeys
+from .keys import LogKeys, LogsLevelKeys, LogsQueuePolicyKeys
 
 from ..attribtool import NoDynamicAttributes, ReadOnlyClass
 from ..raisetool import Raise
@@ -85,12 +85,36 @@ class LoggerClient(BLoggerQueue, NoDynamicAttributes):
                 key=LogKeys.NAME, value=name.strip(), set_default_type=Optional[str]
             )
 
-    def message(self, message: str, log_level: str = LogsLevelKeys.INFO) -> None:
+    def is_enabled(self, log_level: str) -> bool:
+        """Return True when records at `log_level` would reach an engine.
+
+        ### Arguments:
+        * log_level: str - Severity key from `LogsLevelKeys`.
+
+        ### Returns:
+        bool - False when no queue is set or no engine handles the level.
+        """
+        queue: Optional[LoggerQueue] = self.logs_queue
+        return queue is not None and log_level in queue.enabled_levels
+
+    def message(
+        self,
+        message: Union[str, Callable[[], Any], Any],
+        log_level: str = LogsLevelKeys.INFO,
+        *args: Any,
+    ) -> None:
         """Emit a log message at the requested level.
 
+        The level is checked against `LoggerQueue.enabled_levels` before any
+        other work, so records for levels without engines cost a set lookup.
+        Expensive payloads can be passed lazily: a callable is invoked and
+        `%`-style `args` are interpolated only for enabled levels.
+
         ### Arguments:
-        * message: str - Payload to log.
+        * message: Union[str, Callable[[], Any], Any] - Payload to log, a
+          `%`-style template for `args`, or a callable returning the payload.
         * log_level: str - Severity key from `LogsLevelKeys`; defaults to INFO.
+        * args: Any - Optional values interpolated with `message % args`.
 
         ### Returns:
         None - Message enqueued when a queue is available.
@@ -106,19 +130,76 @@ class LoggerClient(BLoggerQueue, NoDynamicAttributes):
                 self._c_name,
                 currentframe(),
             )
-        if log_level not in LogsLevelKeys.keys:
+        queue: Optional[LoggerQueue] = self.logs_queue
+        if queue is None or log_level not in queue.enabled_levels:
+            if log_level not in LogsLevelKeys.keys:
+                raise Raise.error(
+                    f"Expected 'log_level' as key from .base_logs.LogsLevelKeys.keys, received: '{log_level}'.",
+                    KeyError,
+                    self._c_name,
+                    currentframe(),
+                )
+            return None
+        if callable(message):
+            message = message()
+        if args:
+            message = message % args
+        if not isinstance(message, str):
+            message = f"{message}"
+        name: Optional[str] = self.name
+        if name is not None:
+            message = f"[{name}] {message}"
+        queue.put(message, log_level)
+
+    def record(
+        self,
+        message: Union[str, Callable[[], Any], Any],
+        log_level: str = LogsLevelKeys.INFO,
+        *args: Any,
+        **fields: Any,
+    ) -> None:
+        """Emit a structured log record at the requested level.
+
+        Unlike `message`, nothing is rendered here: the queue carries a
+        `LogRecord` holding the timestamp, level, client name, template,
+        `args` and `fields`. Text engines receive the same `[name] message`
+        string as `message` would produce; structured formatters such as
+        `LogFormatterJson` serialise the record once, at the sink.
+
+        ### Arguments:
+        * message: Union[str, Callable[[], Any], Any] - Payload to log, a
+          `%`-style template for `args`, or a callable returning the payload.
+        * log_level: str - Severity key from `LogsLevelKeys`; defaults to INFO.
+        * args: Any - Optional values interpolated with `message % args`.
+        * fields: Any - Additional key/value pairs stored on the record.
+
+        ### Returns:
+        None - Record enqueued when a queue is available.
+
+        ### Raises:
+        * TypeError: When `log_level` is not a string.
+        * KeyError: When `log_level` is not recognised.
+        """
+        if not isinstance(log_level, str):
             raise Raise.error(
-                f"Expected 'log_level' as key from .base_logs.LogsLevelKeys.keys, received: '{log_level}'.",
-                KeyError,
+                f"Expected 'log_level' as string type, received: '{type(log_level)}'.",
+                TypeError,
                 self._c_name,
                 currentframe(),
             )
-        if not isinstance(message, str):
-            message = f"{message}"
-        if self.name is not None:
-            message = f"[{self.name}] {message}"
-        if self.logs_queue:
-            self.logs_queue.put(message, log_level)
+        queue: Optional[LoggerQueue] = self.logs_queue
+        if queue is None or log_level not in queue.enabled_levels:
+            if log_level not in LogsLevelKeys.keys:
+                raise Raise.error(
+                    f"Expected 'log_level' as key from .base_logs.LogsLevelKeys.keys, received: '{log_level}'.",
+                    KeyError,
+                    self._c_name,
+                    currentframe(),
+                )
+            return None
+        if callable(message):
+            message = message()
+        queue.put(LogRecord(message, log_level, self.name, args, fields), log_level)
 
     @property
     def message_alert(self) -> None:
@@ -284,14 +365,29 @@ class LoggerClient(BLoggerQueue, NoDynamicAttributes):
 class LoggerEngine(BLoggerQueue, NoDynamicAttributes):
     """Coordinate engines and dispatch queued log messages."""
 
-    def __init__(self) -> None:
+    #: Maximum number of queue entries dispatched per `send_many()` round.
+    BATCH_SIZE: int = 1024
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        policy: str = LogsQueuePolicyKeys.BLOCK,
+        block_timeout: Optional[float] = None,
+    ) -> None:
         """Initialise the logging engine with default outputs.
 
+        ### Arguments:
+        * maxsize: Optional[int] - Capacity of the logs queue; None means unbounded.
+        * policy: str - Queue overflow policy from `LogsQueuePolicyKeys`.
+        * block_timeout: Optional[float] - Producer wait limit for the `BLOCK` policy.
+
         ### Returns:
         None - Constructor.
         """
         # make logs queue object
-        self.logs_queue = LoggerQueue()
+        self.logs_queue = LoggerQueue(
+            maxsize=maxsize, policy=policy, block_timeout=block_timeout
+        )
         # default logs level configuration
         self._data[LogKeys.NO_CONF] = {}
         self._data[LogKeys.NO_CONF][LogsLevelKeys.INFO] = [LoggerEngineStdout()]
@@ -306,6 +402,49 @@ class LoggerEngine(BLoggerQueue, NoDynamicAttributes):
             LoggerEngineStdout(),
             LoggerEngineStderr(),
         ]
+        self.__publish_levels()
+
+    @property
+    def logs_queue(self) -> Optional[LoggerQueue]:
+        """Return the configured logging queue instance.
+
+        ### Returns:
+        Optional[LoggerQueue] - Logger queue or None when not set.
+        """
+        return BLoggerQueue.logs_queue.fget(self)  # type: ignore
+
+    @logs_queue.setter
+    def logs_queue(self, obj: Optional[LoggerQueue]) -> None:
+        """Assign the logger queue and publish enabled levels to it.
+
+        ### Arguments:
+        * obj: Optional[LoggerQueue] - Queue instance or None.
+        """
+        BLoggerQueue.logs_queue.fset(self, obj)  # type: ignore
+        self.__publish_levels()
+
+    @property
+    def enabled_levels(self) -> FrozenSet[str]:
+        """Return levels with at least one configured engine.
+
+        ### Returns:
+        FrozenSet[str] - Level identifiers handled by `send()`.
+        """
+        if LogKeys.CONF in self._data and len(self._data[LogKeys.CONF]) > 0:
+            conf: Dict[str, List[ILoggerEngine]] = self._data[LogKeys.CONF]
+        else:
+            conf = self._data.get(LogKeys.NO_CONF, {})
+        return frozenset(
+            level
+            for level, engines in conf.items()
+            if engines and level in LogsLevelKeys.keys
+        )
+
+    def __publish_levels(self) -> None:
+        """Publish `enabled_levels` to the queue shared with clients."""
+        queue: Optional[LoggerQueue] = self.logs_queue
+        if queue is not None and LogKeys.NO_CONF in self._data:
+            queue.enabled_levels = self.enabled_levels
 
     def add_engine(self, log_level: str, engine: ILoggerEngine) -> None:
         """Attach an engine to a specific log level.
@@ -351,34 +490,89 @@ class LoggerEngine(BLoggerQueue, NoDynamicAttributes):
                         test = True
                 if not test:
                     self._data[LogKeys.CONF][log_level].append(engine)
+        self.__publish_levels()
 
     def send(self) -> None:
         """Dequeue pending messages and dispatch them to engines.
 
+        Messages are drained in batches of up to `BATCH_SIZE` entries and
+        delivered to every engine with a single `send_many()` call.
+
         ### Returns:
         None - The queue is drained until empty.
         """
         while True:
-            if self.logs_queue is not None:
-                item: Optional[tuple[str, ...]] = self.logs_queue.get()
-                if item is not None:
-                    # get tuple(log_level, message)
-                    log_level, message = item
-                    # check if has have configured logging subsystem
-                    if LogKeys.CONF in self._data and len(self._data[LogKeys.CONF]) > 0:
-                        if log_level in self._data[LogKeys.CONF]:
-                            for l_eng in self._data[LogKeys.CONF][log_level]:
-                                engine: ILoggerEngine = l_eng
-                                engine.send(message)
-                    else:
-                        if log_level in self._data[LogKeys.NO_CONF]:
-                            for l_eng in self._data[LogKeys.NO_CONF][log_level]:
-                                engine: ILoggerEngine = l_eng
-                                engine.send(message)
-                else:
-                    return None
-            else:
+            if self.logs_queue is None:
+                return None
+            items: List[tuple[str, ...]] = self.logs_queue.get_many(self.BATCH_SIZE)
+            if not items:
                 return None
+            # check if has have configured logging subsystem
+            if LogKeys.CONF in self._data and len(self._data[LogKeys.CONF]) > 0:
+                conf: Dict[str, List[ILoggerEngine]] = self._data[LogKeys.CONF]
+            else:
+                conf = self._data[LogKeys.NO_CONF]
+            batches: Dict[int, Tuple[ILoggerEngine, List[Any]]] = {}
+            records: bool = False
+            for log_level, message in items:
+                if log_level in conf:
+                    if message.__class__ is not str:
+                        records = True
+                    for engine in conf[log_level]:
+                        key: int = id(engine)
+                        if key not in batches:
+                            batches[key] = (engine, [])
+                        batches[key][1].append(message)
+            for engine, messages in batches.values():
+                if records and not getattr(engine, "structured", False):
+                    # text engines receive the flat string form of records
+                    messages = [
+                        item if item.__class__ is str else f"{item}"
+                        for item in messages
+                    ]
+                engine.send_many(messages)
+
+    def __engines(self) -> List[ILoggerEngine]:
+        """Return every configured engine once.
+
+        ### Returns:
+        List[ILoggerEngine] - Engines of the default and custom configuration.
+        """
+        engines: Dict[int, ILoggerEngine] = {}
+        for conf_key in (LogKeys.NO_CONF, LogKeys.CONF):
+            for level_engines in self._data.get(conf_key, {}).values():
+                for engine in level_engines:
+                    engines[id(engine)] = engine
+        return list(engines.values())
+
+    def flush(self) -> None:
+        """Write output buffered by all engines.
+
+        ### Returns:
+        None - `flush()` is called on every engine.
+        """
+        for engine in self.__engines():
+            engine.flush()
+
+    def flush_due(self) -> None:
+        """Write buffered output whose flush deadline has passed.
+
+        ### Returns:
+        None - `flush_due()` is called on every engine.
+        """
+        for engine in self.__engines():
+            engine.flush_due()
+
+    def close(self) -> None:
+        """Flush and release resources held by all engines.
+
+        Engines reopen their outputs on the next message.
+
+        ### Returns:
+        None - `close()` is called on every engine.
+        """
+        for engine in self.__engines():
+            engine.close()
 
 
 class ThLoggerProcessor(threading.Thread, ThBaseObject, NoDynamicAttributes):
@@ -457,6 +651,13 @@ class ThLoggerProcessor(threading.Thread, ThBaseObject, NoDynamicAttributes):
     def run(self) -> None:
         """Process the logging queue until stopped.
 
+        The thread blocks on the engine queue and is woken up as soon as a
+        message is published or `stop()` is called; `sleep_period` only bounds
+        the wait time. After every wakeup engines flush data whose deadline
+        has passed; on stop the remaining messages are sent and all engines
+        are closed. While running, the thread is registered as the queue
+        `consumer`, so its own `BLOCK`-policy entries never wait on itself.
+
         ### Raises:
         * ValueError: When required engine or client references are missing.
         """
@@ -477,24 +678,40 @@ class ThLoggerProcessor(threading.Thread, ThBaseObject, NoDynamicAttributes):
             )
         if self._debug:
             self.logger_client.message_debug = f"[{self._c_name}] starting..."
+        # register as consumer, so BLOCK-policy puts from here never wait
+        consumed: Optional[LoggerQueue] = self.logger_engine.logs_queue
+        if isinstance(consumed, LoggerQueue):
+            consumed.consumer = threading.get_ident()
         # run
-        while not self.stopped:
+        try:
+            while not self.stopped:
+                self.logger_engine.send()
+                self.logger_engine.flush_due()
+                queue: Optional[LoggerQueue] = self.logger_engine.logs_queue
+                if queue is not None:
+                    queue.wait(self.sleep_period)
+                else:
+                    self._sleep(self.sleep_period)
+            if self._debug:
+                self.logger_client.message_debug = f"[{self._c_name}] stopped."
             self.logger_engine.send()
-            time.sleep(self.sleep_period)
-        if self._debug:
-            self.logger_client.message_debug = f"[{self._c_name}] stopped."
-        self.logger_engine.send()
+            self.logger_engine.close()
+        finally:
+            if isinstance(consumed, LoggerQueue):
+                consumed.consumer = None
 
     def stop(self) -> None:
         """Request the background thread to stop.
 
         ### Returns:
-        None - Signals the internal stop event.
+        None - Signals the internal stop event and wakes up the queue waiter.
         """
         if self._debug and self.logger_client:
             self.logger_client.message_debug = f"[{self._c_name}] stopping..."
         if self._stop_event:
             self._stop_event.set()
+        if self.logger_engine and self.logger_engine.logs_queue:
+            self.logger_engine.logs_queue.wakeup()
 
     @property
     def stopped(self) -> bool:
@@ -6,30 +6,239 @@ Created: 2024-09-06
 Purpose: Provide a minimal FIFO queue implementation for the logging subsystem.
 
 `LoggerQueue` stores log level/message pairs in memory when engines cannot
-dispatch immediately.
+dispatch immediately. The queue is backed by `collections.deque` guarded by
+a condition variable, so consumers may block in `wait()` and are woken up as
+soon as a new entry is published. An optional `maxsize` bounds the queue and
+selects an overflow policy from `LogsQueuePolicyKeys`.
+
+`LoggerProcessQueue` transports entries through a `multiprocessing` queue,
+so clients running in child processes can log through a single
+`LoggerEngine`/`ThLoggerProcessor` pair in the parent process.
 """
 
-from typing import Optional, List
+import threading
+
+from collections import deque
+from queue import Empty
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    List,
+)
 
 from ..attribtool import NoDynamicAttributes
 from ..basetool.classes import BClasses
-from .keys import LogsLevelKeys
+from .keys import LogsLevelKeys, LogsQueuePolicyKeys
 from ..raisetool import Raise
 from inspect import currentframe
 
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
 
 class LoggerQueue(BClasses, NoDynamicAttributes):
     """In-memory FIFO storage for log messages."""
 
-    __queue: List[List[str]] = []
+    #: Levels retained by the `DROP_BY_LEVEL` policy by default.
+    DEFAULT_KEEP_LEVELS: FrozenSet[str] = frozenset(
+        (
+            LogsLevelKeys.EMERGENCY,
+            LogsLevelKeys.ALERT,
+            LogsLevelKeys.CRITICAL,
+            LogsLevelKeys.ERROR,
+        )
+    )
+
+    __queue: Deque[List[str]] = None  # type: ignore
+    __cond: threading.Condition = None  # type: ignore
+    __not_full: threading.Condition = None  # type: ignore
+    __wakeup: bool = False
+    __maxsize: Optional[int] = None
+    __policy: str = LogsQueuePolicyKeys.BLOCK
+    __block_timeout: Optional[float] = None
+    __consumer: Optional[int] = None
+    __keep_levels: FrozenSet[str] = frozenset()
+    __dropped: Dict[str, int] = None  # type: ignore
+    __dropped_levels: Dict[str, int] = None  # type: ignore
+    __enabled_levels: FrozenSet[str] = frozenset(LogsLevelKeys.keys)
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        policy: str = LogsQueuePolicyKeys.BLOCK,
+        block_timeout: Optional[float] = None,
+        keep_levels: Optional[Iterable[str]] = None,
+    ) -> None:
         """Initialise an empty queue.
 
+        ### Arguments:
+        * maxsize: Optional[int] - Maximum number of queued entries; None means unbounded.
+        * policy: str - Overflow policy from `LogsQueuePolicyKeys`; defaults to `BLOCK`.
+        * block_timeout: Optional[float] - Maximum time a producer is blocked by the
+          `BLOCK` policy; the entry is dropped when it expires. None blocks forever,
+          except on the registered `consumer` thread, whose entries are dropped at
+          once since nothing else would drain the queue.
+        * keep_levels: Optional[Iterable[str]] - Levels never shed by the `DROP_BY_LEVEL`
+          policy; defaults to `DEFAULT_KEEP_LEVELS`.
+
         ### Returns:
         None - Constructor does not return a value.
+
+        ### Raises:
+        * ValueError: When `maxsize` is not positive.
+        * KeyError: When `policy` or one of `keep_levels` is unknown.
+        """
+        if maxsize is not None and maxsize <= 0:
+            raise Raise.error(
+                f"Expected positive 'maxsize', received: '{maxsize}'.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        if policy not in LogsQueuePolicyKeys.keys:
+            raise Raise.error(
+                f"Queue policy key not found, '{policy}' received.",
+                KeyError,
+                self._c_name,
+                currentframe(),
+            )
+        if keep_levels is None:
+            keep_levels = self.DEFAULT_KEEP_LEVELS
+        for level in keep_levels:
+            if level not in LogsLevelKeys.keys:
+                raise Raise.error(
+                    f"logs_level key not found, '{level}' received.",
+                    KeyError,
+                    self._c_name,
+                    currentframe(),
+                )
+        lock = threading.Lock()
+        self.__queue = deque()
+        self.__cond = threading.Condition(lock)
+        self.__not_full = threading.Condition(lock)
+        self.__wakeup = False
+        self.__maxsize = maxsize
+        self.__policy = policy
+        self.__block_timeout = block_timeout
+        self.__keep_levels = frozenset(keep_levels)
+        self.__dropped = {key: 0 for key in LogsQueuePolicyKeys.keys}
+        self.__dropped_levels = {key: 0 for key in LogsLevelKeys.keys}
+
+    def __len__(self) -> int:
+        """Return the number of queued entries.
+
+        ### Returns:
+        int - Current queue length.
+        """
+        return len(self.__queue)
+
+    def __bool__(self) -> bool:
+        """Return True for every queue instance, including empty ones.
+
+        Keeps `if queue:` checks meaning "queue is configured".
+
+        ### Returns:
+        bool - Always True.
+        """
+        return True
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        """Return the configured queue capacity.
+
+        ### Returns:
+        Optional[int] - Maximum number of entries or None when unbounded.
+        """
+        return self.__maxsize
+
+    @property
+    def policy(self) -> str:
+        """Return the configured overflow policy.
+
+        ### Returns:
+        str - Policy identifier from `LogsQueuePolicyKeys`.
         """
-        self.__queue = []
+        return self.__policy
+
+    @property
+    def consumer(self) -> Optional[int]:
+        """Return the identifier of the thread registered as the consumer.
+
+        ### Returns:
+        Optional[int] - `threading.get_ident()` value or None when not registered.
+        """
+        return self.__consumer
+
+    @consumer.setter
+    def consumer(self, ident: Optional[int]) -> None:
+        """Register the thread draining the queue.
+
+        `BLOCK`-policy entries put from this thread are dropped instead of
+        waiting for free space. `ThLoggerProcessor` registers itself while it
+        runs.
+
+        ### Arguments:
+        * ident: Optional[int] - `threading.get_ident()` value or None to clear.
+        """
+        self.__consumer = ident
+
+    @property
+    def enabled_levels(self) -> FrozenSet[str]:
+        """Return levels that have at least one engine attached.
+
+        Published by `LoggerEngine`; clients skip formatting and enqueuing
+        of records whose level is not in this set.
+
+        ### Returns:
+        FrozenSet[str] - Enabled level identifiers; all levels by default.
+        """
+        return self.__enabled_levels
+
+    @enabled_levels.setter
+    def enabled_levels(self, levels: Iterable[str]) -> None:
+        """Publish the set of enabled levels.
+
+        ### Arguments:
+        * levels: Iterable[str] - Level identifiers from `LogsLevelKeys`.
+
+        ### Raises:
+        * KeyError: When one of `levels` is unknown.
+        """
+        levels = frozenset(levels)
+        for level in levels:
+            if level not in LogsLevelKeys.keys:
+                raise Raise.error(
+                    f"logs_level key not found, '{level}' received.",
+                    KeyError,
+                    self._c_name,
+                    currentframe(),
+                )
+        self.__enabled_levels = levels
+
+    @property
+    def dropped(self) -> Dict[str, int]:
+        """Return the number of dropped entries per overflow policy.
+
+        ### Returns:
+        Dict[str, int] - Snapshot of counters keyed by `LogsQueuePolicyKeys`.
+        """
+        with self.__cond:
+            return dict(self.__dropped)
+
+    @property
+    def dropped_levels(self) -> Dict[str, int]:
+        """Return the number of dropped entries per log level.
+
+        ### Returns:
+        Dict[str, int] - Snapshot of counters keyed by `LogsLevelKeys`.
+        """
+        with self.__cond:
+            return dict(self.__dropped_levels)
 
     def get(self) -> Optional[tuple[str, ...]]:
         """Return and remove the next queued log entry.
@@ -41,7 +250,11 @@ class LoggerQueue(BClasses, NoDynamicAttributes):
         * Exception: Re-raised as `Raise.error` when unexpected errors occur.
         """
         try:
-            return tuple(self.__queue.pop(0))
+            with self.__cond:
+                item: List[str] = self.__queue.popleft()
+                if self.__maxsize is not None:
+                    self.__not_full.notify()
+            return tuple(item)
         except IndexError:
             return None
         except Exception as ex:
@@ -52,11 +265,35 @@ class LoggerQueue(BClasses, NoDynamicAttributes):
                 currentframe(),
             )
 
-    def put(self, message: str, log_level: str = LogsLevelKeys.INFO) -> None:
+    def get_many(self, max_items: Optional[int] = None) -> List[tuple[str, ...]]:
+        """Return and remove up to `max_items` queued log entries at once.
+
+        ### Arguments:
+        * max_items: Optional[int] - Maximum batch size; None drains the whole queue.
+
+        ### Returns:
+        List[tuple[str, ...]] - Tuples `(level, message)` in queue order; empty when idle.
+        """
+        out: List[tuple[str, ...]] = []
+        with self.__cond:
+            count: int = len(self.__queue)
+            if max_items is not None and max_items < count:
+                count = max_items
+            popleft = self.__queue.popleft
+            for _ in range(count):
+                out.append(tuple(popleft()))
+            if count and self.__maxsize is not None:
+                self.__not_full.notify(count)
+        return out
+
+    def put(self, message: Any, log_level: str = LogsLevelKeys.INFO) -> None:
         """Append a new log entry to the queue.
 
+        Consumers blocked in `wait()` are woken up. When the queue is bounded
+        and full, the configured overflow policy decides which entry is lost.
+
         ### Arguments:
-        * message: str - Log message payload.
+        * message: Any - Log message string or `LogRecord`.
         * log_level: str - Log severity; defaults to `LogsLevelKeys.INFO`.
 
         ### Returns:
@@ -72,12 +309,245 @@ class LoggerQueue(BClasses, NoDynamicAttributes):
                 self._c_name,
                 currentframe(),
             )
-        self.__queue.append(
-            [
-                log_level,
-                message,
-            ]
-        )
+        with self.__cond:
+            if (
+                self.__maxsize is not None
+                and len(self.__queue) >= self.__maxsize
+                and not self.__make_room(log_level)
+            ):
+                return None
+            self.__queue.append(
+                [
+                    log_level,
+                    message,
+                ]
+            )
+            self.__cond.notify()
+
+    def __make_room(self, log_level: str) -> bool:
+        """Apply the overflow policy to a full queue.
+
+        Must be called with the queue lock held.
+
+        ### Arguments:
+        * log_level: str - Level of the incoming entry.
+
+        ### Returns:
+        bool - True when the incoming entry may be appended.
+        """
+        policy: str = self.__policy
+        if policy == LogsQueuePolicyKeys.BLOCK:
+            # The consumer would wait for itself: drop instead of deadlocking.
+            if self.__consumer != threading.get_ident() and self.__not_full.wait_for(
+                lambda: len(self.__queue) < self.__maxsize,  # type: ignore
+                self.__block_timeout,
+            ):
+                return True
+            self.__count_drop(policy, log_level)
+            return False
+        if policy == LogsQueuePolicyKeys.DROP_NEWEST:
+            self.__count_drop(policy, log_level)
+            return False
+        if policy == LogsQueuePolicyKeys.DROP_OLDEST:
+            self.__count_drop(policy, self.__queue.popleft()[0])
+            return True
+        # DROP_BY_LEVEL
+        if log_level not in self.__keep_levels:
+            self.__count_drop(policy, log_level)
+            return False
+        for index, item in enumerate(self.__queue):
+            if item[0] not in self.__keep_levels:
+                del self.__queue[index]
+                self.__count_drop(policy, item[0])
+                return True
+        self.__count_drop(policy, self.__queue.popleft()[0])
+        return True
+
+    def __count_drop(self, policy: str, log_level: str) -> None:
+        """Increment drop counters.
+
+        ### Arguments:
+        * policy: str - Policy that discarded the entry.
+        * log_level: str - Level of the discarded entry.
+        """
+        self.__dropped[policy] += 1
+        self.__dropped_levels[log_level] += 1
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until an entry is available, `wakeup()` is called or timeout expires.
+
+        ### Arguments:
+        * timeout: Optional[float] - Maximum wait time in seconds; None waits forever.
+
+        ### Returns:
+        bool - True when the queue holds at least one entry.
+        """
+        with self.__cond:
+            if not self.__queue and not self.__wakeup:
+                self.__cond.wait(timeout)
+            self.__wakeup = False
+            return len(self.__queue) > 0
+
+    def wakeup(self) -> None:
+        """Release consumers blocked in `wait()` without publishing an entry.
+
+        The request is remembered, so a consumer entering `wait()` right after
+        this call returns immediately.
+
+        ### Returns:
+        None - Waiting consumers are notified.
+        """
+        with self.__cond:
+            self.__wakeup = True
+            self.__cond.notify_all()
+
+
+class LoggerProcessQueue(LoggerQueue):
+    """Log queue shared between processes through `multiprocessing.Queue`.
+
+    Producers in any process call `put()`; the consumer side (the parent
+    running `LoggerEngine.send()`) reads entries back in FIFO order. The
+    instance can be handed to child processes as a `Process` argument or a
+    pool `initializer` argument; it cannot be sent through pool task arguments.
+    Bounded mode and overflow policies are not supported.
+    """
+
+    __mp_queue: Any = None
+
+    def __init__(self, context: Optional["BaseContext"] = None) -> None:
+        """Initialise the inter-process queue.
+
+        ### Arguments:
+        * context: Optional[BaseContext] - Multiprocessing context used to create
+          the underlying queue; defaults to the global context.
+
+        ### Returns:
+        None - Constructor.
+        """
+        LoggerQueue.__init__(self)
+        if context is None:
+            import multiprocessing
+
+            self.__mp_queue = multiprocessing.Queue()
+        else:
+            self.__mp_queue = context.Queue()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the picklable state: the multiprocessing queue and enabled levels.
+
+        ### Returns:
+        Dict[str, Any] - State transferred to a child process.
+        """
+        return {"mp_queue": self.__mp_queue, "enabled_levels": self.enabled_levels}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the queue in a child process.
+
+        ### Arguments:
+        * state: Dict[str, Any] - State produced by `__getstate__`.
+        """
+        LoggerQueue.__init__(self)
+        self.__mp_queue = state["mp_queue"]
+        self.enabled_levels = state["enabled_levels"]
+
+    def __len__(self) -> int:
+        """Return the approximate number of queued entries.
+
+        ### Returns:
+        int - Locally buffered entries plus the multiprocessing queue size
+        where the platform supports `qsize()`.
+        """
+        try:
+            remote: int = self.__mp_queue.qsize()
+        except NotImplementedError:
+            remote = 0
+        return LoggerQueue.__len__(self) + remote
+
+    def put(self, message: Any, log_level: str = LogsLevelKeys.INFO) -> None:
+        """Send a new log entry to the consumer process.
+
+        ### Arguments:
+        * message: Any - Log message string or `LogRecord`.
+        * log_level: str - Log severity; defaults to `LogsLevelKeys.INFO`.
+
+        ### Returns:
+        None - The entry is handed over to the multiprocessing queue.
+
+        ### Raises:
+        * KeyError: When `log_level` is not part of `LogsLevelKeys.keys`.
+        """
+        if log_level not in LogsLevelKeys.keys:
+            raise Raise.error(
+                f"logs_level key not found, '{log_level}' received.",
+                KeyError,
+                self._c_name,
+                currentframe(),
+            )
+        self.__mp_queue.put((log_level, message))
+
+    def get(self) -> Optional[tuple[str, ...]]:
+        """Return and remove the next log entry without blocking.
+
+        ### Returns:
+        Optional[tuple[str, ...]] - Tuple in form `(level, message)` or None when empty.
+        """
+        item: Optional[tuple[str, ...]] = LoggerQueue.get(self)
+        if item is not None:
+            return item
+        while True:
+            try:
+                item = self.__mp_queue.get_nowait()
+            except Empty:
+                return None
+            if item is not None:
+                return item
+
+    def get_many(self, max_items: Optional[int] = None) -> List[tuple[str, ...]]:
+        """Return and remove up to `max_items` entries without blocking.
+
+        ### Arguments:
+        * max_items: Optional[int] - Maximum batch size; None drains all available entries.
+
+        ### Returns:
+        List[tuple[str, ...]] - Tuples `(level, message)` in queue order.
+        """
+        out: List[tuple[str, ...]] = LoggerQueue.get_many(self, max_items)
+        while max_items is None or len(out) < max_items:
+            try:
+                item = self.__mp_queue.get_nowait()
+            except Empty:
+                break
+            if item is not None:
+                out.append(item)
+        return out
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until an entry arrives, `wakeup()` is called or timeout expires.
+
+        ### Arguments:
+        * timeout: Optional[float] - Maximum wait time in seconds; None waits forever.
+
+        ### Returns:
+        bool - True when at least one entry is available.
+        """
+        if LoggerQueue.__len__(self) > 0:
+            return True
+        try:
+            item = self.__mp_queue.get(timeout=timeout)
+        except Empty:
+            return False
+        if item is None:
+            return False
+        LoggerQueue.put(self, item[1], item[0])
+        return True
+
+    def wakeup(self) -> None:
+        """Release a consumer blocked in `wait()` without publishing an entry.
+
+        ### Returns:
+        None - A wake-up marker is sent through the multiprocessing queue.
+        """
+        self.__mp_queue.put(None)
 
 
 # #[EOF]#######################################################################
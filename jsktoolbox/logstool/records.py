@@ -0,0 +1,119 @@
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Provide the structured log record passed through logstool queues.
+
+A `LogRecord` keeps the timestamp, level, client name, message template and
+arbitrary key/value fields apart until a sink needs them. Text engines see
+the same `[name] message` string produced by `LoggerClient.message`, while
+structured formatters serialise the record in one step.
+"""
+
+import time
+
+from typing import Any, Dict, Optional, Tuple
+
+from .keys import LogsLevelKeys
+
+
+class LogRecord(object):
+    """Structured log entry carried unformatted from client to engine.
+
+    The `msg % args` interpolation is deferred until `message` is first
+    read, so records discarded by the queue never build their text.
+    """
+
+    __slots__ = ("timestamp", "level", "name", "msg", "args", "fields", "_message")
+
+    def __init__(
+        self,
+        msg: Any,
+        level: str = LogsLevelKeys.INFO,
+        name: Optional[str] = None,
+        args: Tuple[Any, ...] = (),
+        fields: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Initialise the record.
+
+        ### Arguments:
+        * msg: Any - Message payload or `%`-style template for `args`.
+        * level: str - Severity key from `LogsLevelKeys`.
+        * name: Optional[str] - Name of the emitting client.
+        * args: Tuple[Any, ...] - Values interpolated into `msg` on demand.
+        * fields: Optional[Dict[str, Any]] - Additional structured fields.
+        * timestamp: Optional[float] - Epoch seconds; defaults to `time.time()`.
+        """
+        self.timestamp: float = time.time() if timestamp is None else timestamp
+        self.level: str = level
+        self.name: Optional[str] = name
+        self.msg: Any = msg
+        self.args: Tuple[Any, ...] = args
+        self.fields: Dict[str, Any] = fields if fields is not None else {}
+        self._message: Optional[str] = None
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """Return picklable state with the message already rendered."""
+        return (self.timestamp, self.level, self.name, self.message, self.fields)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restore state produced by `__getstate__`."""
+        self.timestamp, self.level, self.name, self._message, self.fields = state
+        self.msg = self._message
+        self.args = ()
+
+    def __repr__(self) -> str:
+        """Return a debugging representation of the record."""
+        return (
+            f"{self.__class__.__name__}(level={self.level!r}, "
+            f"name={self.name!r}, message={self.message!r}, fields={self.fields!r})"
+        )
+
+    def __str__(self) -> str:
+        """Return the record as the flat text used by text engines.
+
+        ### Returns:
+        str - `[name] message`, or just the message when no name is set.
+        """
+        if self.name is None:
+            return self.message
+        return f"[{self.name}] {self.message}"
+
+    @property
+    def message(self) -> str:
+        """Return the rendered message text.
+
+        ### Returns:
+        str - `msg % args` when arguments were given, otherwise `str(msg)`.
+        """
+        if self._message is None:
+            msg: Any = self.msg
+            if self.args:
+                msg = msg % self.args
+            self._message = msg if isinstance(msg, str) else f"{msg}"
+        return self._message
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a flat dictionary.
+
+        Core keys (`time`, `level`, `name`, `message`) take precedence over
+        fields with the same name.
+
+        ### Returns:
+        Dict[str, Any] - Serialisable record representation.
+        """
+        out: Dict[str, Any] = {
+            "time": self.timestamp,
+            "level": self.level,
+            "name": self.name,
+            "message": self.message,
+        }
+        for key, value in self.fields.items():
+            if key not in out:
+                out[key] = value
+        return out
+
+
+# #[EOF]#######################################################################
@@ -13,6 +13,13 @@ from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from .bulk import BulkResult as BulkResult
+    from .bulk import format_many as format_many
+    from .bulk import format_many6 as format_many6
+    from .bulk import parse_many as parse_many
+    from .bulk import parse_many6 as parse_many6
+    from .ipset import IPSet as IPSet
+    from .ipset import IPSet6 as IPSet6
     from .ipv4 import Address as Address
     from .ipv4 import DEFAULT_IPV4_HOST_LIMIT as DEFAULT_IPV4_HOST_LIMIT
     from .ipv4 import DEFAULT_IPV4_SUBNET_LIMIT as DEFAULT_IPV4_SUBNET_LIMIT
@@ -27,22 +34,31 @@ if TYPE_CHECKING:
     from .ipv6 import SubNetwork6 as SubNetwork6
     from .libs.octets import Octet as Octet
     from .libs.words import Word16 as Word16
+    from .trie import PrefixTrie as PrefixTrie
 
 __all__ = [
     "Address",
     "Address6",
+    "BulkResult",
     "DEFAULT_IPV4_HOST_LIMIT",
     "DEFAULT_IPV4_SUBNET_LIMIT",
     "DEFAULT_IPV6_HOST_LIMIT",
     "DEFAULT_IPV6_SUBNET_LIMIT",
+    "IPSet",
+    "IPSet6",
     "Netmask",
     "Network",
     "Network6",
     "Octet",
     "Prefix6",
+    "PrefixTrie",
     "SubNetwork",
     "SubNetwork6",
     "Word16",
+    "format_many",
+    "format_many6",
+    "parse_many",
+    "parse_many6",
 ]
 
 _EXPORT_MAP = {
@@ -60,6 +76,14 @@ _EXPORT_MAP = {
     "DEFAULT_IPV6_SUBNET_LIMIT": ("ipv6", "DEFAULT_IPV6_SUBNET_LIMIT"),
     "Octet": ("libs.octets", "Octet"),
     "Word16": ("libs.words", "Word16"),
+    "PrefixTrie": ("trie", "PrefixTrie"),
+    "IPSet": ("ipset", "IPSet"),
+    "IPSet6": ("ipset", "IPSet6"),
+    "BulkResult": ("bulk", "BulkResult"),
+    "parse_many": ("bulk", "parse_many"),
+    "format_many": ("bulk", "format_many"),
+    "parse_many6": ("bulk", "parse_many6"),
+    "format_many6": ("bulk", "format_many6"),
 }
 
 
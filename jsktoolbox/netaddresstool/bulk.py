@@ -0,0 +1,198 @@
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Convert whole columns of IP addresses to packed arrays and back.
+
+`parse_many()` and `parse_many6()` turn iterables of address strings into
+compact buffers without creating an `Address` object per row: IPv4 values
+land in an `array` of unsigned 32-bit integers, IPv6 values in a `bytearray`
+of 16-byte network-order records. Invalid rows are collected in the result
+instead of raising. Both buffers support the buffer protocol, so they can be
+wrapped by `numpy.frombuffer()` without copying.
+"""
+
+import socket
+import sys
+
+from array import array
+from inspect import currentframe
+from typing import Any, Iterable, List, Tuple, Union
+
+from ..raisetool import Raise
+from .ipv4 import Address
+from .ipv6 import Address6
+
+# Typecode of the native unsigned 32-bit array item.
+IPV4_TYPECODE: str = "I" if array("I").itemsize == 4 else "L"
+
+_AF_INET: int = socket.AF_INET
+_AF_INET6: int = socket.AF_INET6
+_LITTLE_ENDIAN: bool = sys.byteorder == "little"
+
+
+class BulkResult(object):
+    """Outcome of a bulk parse.
+
+    `values` holds one entry per input row; rows listed in `errors` keep a
+    zero placeholder so positions stay aligned with the input.
+    """
+
+    __slots__ = ("values", "errors")
+
+    def __init__(
+        self,
+        values: Union[array, bytearray],
+        errors: List[Tuple[int, Any, str]],
+    ) -> None:
+        """Initialise the result.
+
+        ### Arguments:
+        * values: Union[array, bytearray] - Packed addresses.
+        * errors: List[Tuple[int, Any, str]] - (row, input, reason) of rejected rows.
+        """
+        self.values: Union[array, bytearray] = values
+        self.errors: List[Tuple[int, Any, str]] = errors
+
+    def __repr__(self) -> str:
+        """Return a debugging representation of the result."""
+        rows: int = (
+            len(self.values)
+            if isinstance(self.values, array)
+            else len(self.values) // 16
+        )
+        return f"{self.__class__.__name__}(rows={rows}, errors={len(self.errors)})"
+
+
+def _type_error(item: Any) -> str:
+    """Return the row error reported for a non-string input."""
+    return f"Expected str type, received: {type(item)}."
+
+
+def parse_many(items: Iterable[str]) -> BulkResult:
+    """Parse IPv4 address strings into an array of integers.
+
+    Surrounding whitespace is ignored. Canonical dotted quads are converted
+    by `socket.inet_pton`; other rows are checked by `Address`, so the
+    accepted forms and error messages match the single-address API. Rows
+    that are not strings are reported as errors.
+
+    ### Arguments:
+    * items: Iterable[str] - Address strings, e.g. lines of a lease dump.
+
+    ### Returns:
+    [BulkResult] - `values` is an `array` with typecode `IPV4_TYPECODE`.
+    """
+    packed: bytearray = bytearray()
+    errors: List[Tuple[int, Any, str]] = []
+    inet_pton = socket.inet_pton
+    for row, item in enumerate(items):
+        if not isinstance(item, str):
+            errors.append((row, item, _type_error(item)))
+            packed += b"\x00\x00\x00\x00"
+            continue
+        text: str = item.strip()
+        try:
+            packed += inet_pton(_AF_INET, text)
+            continue
+        except (OSError, ValueError):
+            pass
+        try:
+            packed += int(Address(text)).to_bytes(4, "big")
+        except (TypeError, ValueError) as ex:
+            errors.append((row, item, str(ex)))
+            packed += b"\x00\x00\x00\x00"
+    values: array = array(IPV4_TYPECODE)
+    values.frombytes(bytes(packed))
+    if _LITTLE_ENDIAN:
+        values.byteswap()
+    return BulkResult(values, errors)
+
+
+def format_many(values: Iterable[int]) -> List[str]:
+    """Format IPv4 integers as dotted-quad strings.
+
+    ### Arguments:
+    * values: Iterable[int] - Array returned by `parse_many()` or any integers.
+
+    ### Returns:
+    [List[str]] - Address strings in input order.
+
+    ### Raises:
+    * OverflowError: A value is outside the 32-bit range.
+    """
+    data: array = array(IPV4_TYPECODE)
+    if isinstance(values, array) and values.typecode == IPV4_TYPECODE:
+        data.frombytes(values.tobytes())
+    else:
+        data.extend(values)
+    if _LITTLE_ENDIAN:
+        data.byteswap()
+    raw: bytes = data.tobytes()
+    inet_ntoa = socket.inet_ntoa
+    return [inet_ntoa(raw[pos : pos + 4]) for pos in range(0, len(raw), 4)]
+
+
+def parse_many6(items: Iterable[str]) -> BulkResult:
+    """Parse IPv6 address strings into packed 16-byte records.
+
+    Rows rejected by `socket.inet_pton` are checked by `Address6`, so the
+    accepted forms and error messages match the single-address API. Rows
+    that are not strings are reported as errors.
+
+    ### Arguments:
+    * items: Iterable[str] - Address strings.
+
+    ### Returns:
+    [BulkResult] - `values` is a `bytearray` of network-order records;
+    `int.from_bytes(values[16 * row : 16 * row + 16], "big")` gives the
+    integer of one row.
+    """
+    packed: bytearray = bytearray()
+    errors: List[Tuple[int, Any, str]] = []
+    inet_pton = socket.inet_pton
+    for row, item in enumerate(items):
+        if not isinstance(item, str):
+            errors.append((row, item, _type_error(item)))
+            packed += bytes(16)
+            continue
+        text: str = item.strip()
+        try:
+            packed += inet_pton(_AF_INET6, text)
+            continue
+        except (OSError, ValueError):
+            pass
+        try:
+            packed += int(Address6(text)).to_bytes(16, "big")
+        except (TypeError, ValueError) as ex:
+            errors.append((row, item, str(ex)))
+            packed += bytes(16)
+    return BulkResult(packed, errors)
+
+
+def format_many6(values: Union[bytes, bytearray, memoryview]) -> List[str]:
+    """Format packed IPv6 records as compressed address strings.
+
+    ### Arguments:
+    * values: Union[bytes, bytearray, memoryview] - Buffer returned by `parse_many6()`.
+
+    ### Returns:
+    [List[str]] - Address strings in input order.
+
+    ### Raises:
+    * ValueError: The buffer length is not a multiple of 16.
+    """
+    raw: bytes = bytes(values)
+    if len(raw) % 16:
+        raise Raise.error(
+            f"Expected buffer length divisible by 16, received: {len(raw)}.",
+            ValueError,
+            "",
+            currentframe(),
+        )
+    inet_ntop = socket.inet_ntop
+    return [inet_ntop(_AF_INET6, raw[pos : pos + 16]) for pos in range(0, len(raw), 16)]
+
+
+# #[EOF]#######################################################################
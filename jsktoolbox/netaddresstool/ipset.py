@@ -0,0 +1,384 @@
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Sets of IP addresses stored as sorted integer intervals.
+
+`IPSet` and `IPSet6` keep disjoint, non-adjacent `[start, end]` ranges, so a
+/8 or a whole IPv6 prefix costs one interval instead of one object per
+host. Union, intersection and difference are linear sweeps over the sorted
+intervals, membership is a binary search and `collapse()` returns the
+minimal list of CIDR networks covering the set.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from inspect import currentframe
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from ..attribtool import NoDynamicAttributes
+from ..basetool.classes import BClasses
+from ..raisetool import Raise
+from .ipv4 import Address, Netmask, Network
+from .ipv6 import Address6, Network6, Prefix6
+
+TIPSet = TypeVar("TIPSet", bound="BIPSet")
+TInterval = Tuple[int, int]
+
+
+class BIPSet(ABC, BClasses, NoDynamicAttributes):
+    """Base class of address sets over integer intervals.
+
+    Subclasses define the address width and the conversion between items
+    and intervals. Instances are immutable and hashable.
+    """
+
+    __slots__ = ("__starts", "__ends")
+
+    # Number of bits of the address family.
+    _WIDTH: int = 0
+
+    def __init__(self, items: Optional[Iterable[Any]] = None) -> None:
+        """Constructor.
+
+        ### Arguments:
+        * items: Optional[Iterable[Any]] - Networks, addresses, their string
+          forms, address integers or `(first, last)` pairs of addresses or
+          integers.
+
+        ### Raises:
+        * TypeError: Unsupported item type.
+        * ValueError: Invalid address, network or range.
+        """
+        intervals: List[TInterval] = []
+        if items is not None:
+            for item in items:
+                intervals.extend(self._item_intervals(item))
+        self.__set_intervals(BIPSet.__normalize(intervals))
+
+    def __set_intervals(self, intervals: List[TInterval]) -> None:
+        """Store normalized intervals."""
+        self.__starts: List[int] = [start for start, _ in intervals]
+        self.__ends: List[int] = [end for _, end in intervals]
+
+    @classmethod
+    def _from_intervals(cls: type, intervals: List[TInterval]) -> Any:
+        """Create a set from already normalized intervals."""
+        out = cls()
+        out.__set_intervals(intervals)
+        return out
+
+    @staticmethod
+    def __normalize(intervals: List[TInterval]) -> List[TInterval]:
+        """Sort intervals and merge overlapping or adjacent ones."""
+        out: List[TInterval] = []
+        for start, end in sorted(intervals):
+            if out and start <= out[-1][1] + 1:
+                if end > out[-1][1]:
+                    out[-1] = (out[-1][0], end)
+            else:
+                out.append((start, end))
+        return out
+
+    def _item_intervals(self, item: Any) -> List[TInterval]:
+        """Convert one constructor item to intervals.
+
+        ### Arguments:
+        * item: Any - Item accepted by the subclass.
+
+        ### Returns:
+        [List[TInterval]] - Inclusive integer intervals.
+        """
+        if isinstance(item, self.__class__):
+            return item.intervals
+        if isinstance(item, int):
+            value: int = self._to_int(item)
+            return [(value, value)]
+        if isinstance(item, tuple) and len(item) == 2:
+            first: int = self._to_int(item[0])
+            last: int = self._to_int(item[1])
+            if first > last:
+                raise Raise.error(
+                    f"Expected range start <= end, received: {item}.",
+                    ValueError,
+                    self._c_name,
+                    currentframe(),
+                )
+            return [(first, last)]
+        return [self._parse(item)]
+
+    def _to_int(self, value: Any) -> int:
+        """Return integer of an address or integer range bound."""
+        if isinstance(value, int):
+            if 0 <= value < 1 << self._WIDTH:
+                return value
+            raise Raise.error(
+                f"Expected integer in {self._WIDTH}-bit range, received: {value}.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        start, end = self._parse(value)
+        if start != end:
+            raise Raise.error(
+                f"Expected single address as range bound, received: '{value}'.",
+                ValueError,
+                self._c_name,
+                currentframe(),
+            )
+        return start
+
+    @abstractmethod
+    def _parse(self, item: Any) -> TInterval:
+        """Convert a network or address to an interval."""
+
+    @abstractmethod
+    def _network(self, start: int, plen: int) -> Any:
+        """Build a network object for the CIDR block."""
+
+    @property
+    def intervals(self) -> List[TInterval]:
+        """Return the sorted, disjoint intervals of the set.
+
+        ### Returns:
+        [List[Tuple[int, int]]] - Inclusive `(start, end)` integer pairs.
+        """
+        return list(zip(self.__starts, self.__ends))
+
+    @property
+    def size(self) -> int:
+        """Return number of addresses in the set.
+
+        ### Returns:
+        [int] - Address count; may exceed `sys.maxsize` for IPv6.
+        """
+        return sum(end - start + 1 for start, end in zip(self.__starts, self.__ends))
+
+    def __bool__(self) -> bool:
+        """Return True for a non-empty set."""
+        return bool(self.__starts)
+
+    def __contains__(self, item: Any) -> bool:
+        """Check if the address, integer, network or range lies in the set."""
+        try:
+            intervals: List[TInterval] = self._item_intervals(item)
+        except (TypeError, ValueError):
+            return False
+        for start, end in intervals:
+            idx: int = bisect_right(self.__starts, start) - 1
+            if idx < 0 or self.__ends[idx] < end:
+                return False
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        """Equal."""
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.__starts == other.__starts and self.__ends == other.__ends
+
+    def __ne__(self, other: object) -> bool:
+        """Negative."""
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return not self == other
+
+    def __hash__(self) -> int:
+        """Return hash of the intervals."""
+        return hash((tuple(self.__starts), tuple(self.__ends)))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the minimal covering networks."""
+        return iter(self.collapse())
+
+    def __repr__(self) -> str:
+        """Return representation of object."""
+        return f"{self._c_name}({[str(net) for net in self.collapse()]})"
+
+    def __or__(self: TIPSet, other: object) -> TIPSet:
+        """Union."""
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self: TIPSet, other: object) -> TIPSet:
+        """Intersection."""
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self: TIPSet, other: object) -> TIPSet:
+        """Difference."""
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self: TIPSet, other: object) -> TIPSet:
+        """Symmetric difference."""
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.difference(other).union(other.difference(self))
+
+    def __le__(self, other: object) -> bool:
+        """Subset."""
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return not self.difference(other)
+
+    def __ge__(self, other: object) -> bool:
+        """Superset."""
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return not other.difference(self)
+
+    def union(self: TIPSet, other: TIPSet) -> TIPSet:
+        """Return addresses present in either set.
+
+        ### Arguments:
+        * other: Same set type.
+
+        ### Returns:
+        [Same set type] - New set.
+        """
+        return self._from_intervals(
+            BIPSet.__normalize(self.intervals + other.intervals)
+        )
+
+    def intersection(self: TIPSet, other: TIPSet) -> TIPSet:
+        """Return addresses present in both sets.
+
+        ### Arguments:
+        * other: Same set type.
+
+        ### Returns:
+        [Same set type] - New set.
+        """
+        out: List[TInterval] = []
+        left: List[TInterval] = self.intervals
+        right: List[TInterval] = other.intervals
+        i: int = 0
+        j: int = 0
+        while i < len(left) and j < len(right):
+            start: int = max(left[i][0], right[j][0])
+            end: int = min(left[i][1], right[j][1])
+            if start <= end:
+                out.append((start, end))
+            if left[i][1] < right[j][1]:
+                i += 1
+            else:
+                j += 1
+        return self._from_intervals(out)
+
+    def difference(self: TIPSet, other: TIPSet) -> TIPSet:
+        """Return addresses of this set missing from the other one.
+
+        ### Arguments:
+        * other: Same set type.
+
+        ### Returns:
+        [Same set type] - New set.
+        """
+        out: List[TInterval] = []
+        right: List[TInterval] = other.intervals
+        j: int = 0
+        for start, end in self.intervals:
+            while j < len(right) and right[j][1] < start:
+                j += 1
+            k: int = j
+            while k < len(right) and right[k][0] <= end:
+                if right[k][0] > start:
+                    out.append((start, right[k][0] - 1))
+                start = max(start, right[k][1] + 1)
+                if start > end:
+                    break
+                k += 1
+            if start <= end:
+                out.append((start, end))
+        return self._from_intervals(out)
+
+    def collapse(self) -> List[Any]:
+        """Return the minimal list of CIDR networks covering the set.
+
+        ### Returns:
+        [List[Union[Network, Network6]]] - Networks in address order.
+        """
+        width: int = self._WIDTH
+        out: List[Any] = []
+        for start, end in zip(self.__starts, self.__ends):
+            while start <= end:
+                # Largest block aligned at `start` that still fits the range.
+                bits: int = (start & -start).bit_length() - 1 if start else width
+                span: int = (end - start + 1).bit_length() - 1
+                bits = min(bits, span)
+                out.append(self._network(start, width - bits))
+                start += 1 << bits
+        return out
+
+
+class IPSet(BIPSet):
+    """Set of IPv4 addresses.
+
+    Constructor argument:
+    items: Optional[Iterable] -- `Network`, `Address`, their string forms,
+    integers, `IPSet` or `(first, last)` pairs of addresses or integers.
+    """
+
+    __slots__ = ()
+
+    _WIDTH: int = 32
+
+    def _parse(self, item: Any) -> TInterval:
+        """Convert a network or address to an interval."""
+        if isinstance(item, str):
+            item = Network(item) if "/" in item else Address(item)
+        if isinstance(item, Address):
+            return int(item), int(item)
+        if isinstance(item, Network):
+            start: int = int(item.network)
+            return start, start | 0xFFFFFFFF >> int(item.mask)
+        raise Raise.lazy(
+            "Expected Network, Address or str type, received: %s.",
+            TypeError,
+            self._c_name,
+            type(item),
+        )
+
+    def _network(self, start: int, plen: int) -> Network:
+        """Build a network object for the CIDR block."""
+        return Network([Address(start), Netmask(plen)])
+
+
+class IPSet6(BIPSet):
+    """Set of IPv6 addresses.
+
+    Constructor argument:
+    items: Optional[Iterable] -- `Network6`, `Address6`, their string forms,
+    integers, `IPSet6` or `(first, last)` pairs of addresses or integers.
+    """
+
+    __slots__ = ()
+
+    _WIDTH: int = 128
+
+    def _parse(self, item: Any) -> TInterval:
+        """Convert a network or address to an interval."""
+        if isinstance(item, str):
+            item = Network6(item) if "/" in item else Address6(item)
+        if isinstance(item, Address6):
+            return int(item), int(item)
+        if isinstance(item, Network6):
+            start: int = int(item.network)
+            return start, start + item.count - 1
+        raise Raise.lazy(
+            "Expected Network6, Address6 or str type, received: %s.",
+            TypeError,
+            self._c_name,
+            type(item),
+        )
+
+    def _network(self, start: int, plen: int) -> Network6:
+        """Build a network object for the CIDR block."""
+        return Network6([Address6(start), Prefix6(plen)])
+
+
+# #[EOF]#######################################################################
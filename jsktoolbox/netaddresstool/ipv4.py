@@ -8,10 +8,9 @@ Purpose: Classes for IPv4
 
 import socket
 import struct
-from copy import deepcopy
 from inspect import currentframe
 import warnings
-from typing import Iterator, Optional, TypeVar, Union, List
+from typing import Iterator, Optional, Tuple, TypeVar, Union, List
 
 from ..attribtool import NoDynamicAttributes
 from ..raisetool import Raise
@@ -20,11 +19,20 @@ from ..libs.interfaces.comparators import IComparators
 from ..basetool.classes import BClasses
 
 TAddress = TypeVar("TAddress", bound="Address")
+TNetmask = TypeVar("TNetmask", bound="Netmask")
+TNetwork = TypeVar("TNetwork", bound="Network")
+
+_IPV4_MAX: int = 0xFFFFFFFF
 
 DEFAULT_IPV4_HOST_LIMIT: int = 65536
 DEFAULT_IPV4_SUBNET_LIMIT: int = 4096
 
 
+def _prefix_mask(cidr: int) -> int:
+    """Return the IPv4 netmask integer for a prefix length."""
+    return _IPV4_MAX ^ (_IPV4_MAX >> cidr)
+
+
 class Address(IComparators, BClasses, NoDynamicAttributes):
     """Address class for representing IPv4 addresses.
 
@@ -38,7 +46,7 @@ class Address(IComparators, BClasses, NoDynamicAttributes):
     octets: Union[str, int, List] -- Set IPv4 address from string, integer or list of octets.
     """
 
-    __var_int: int = 0
+    __slots__ = ("__var_int",)
 
     def __init__(
         self, addr: Union[str, int, Union[List[str], List[int], List[Octet]]]
@@ -53,65 +61,42 @@ class Address(IComparators, BClasses, NoDynamicAttributes):
     def __eq__(self, arg: Union[TAddress, object]) -> bool:
         """Equal."""
         if not isinstance(arg, Address):
-            raise Raise.error(
-                f"Expected argument of Address type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
-        return int(self) == int(arg)
+            return NotImplemented
+        return self.__var_int == arg.__var_int
 
     def __ge__(self, arg: Union[TAddress, object]) -> bool:
         """Greater or equal."""
         if not isinstance(arg, Address):
-            raise Raise.error(
-                f"Expected argument of Address type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
-        return int(self) >= int(arg)
+            return NotImplemented
+        return self.__var_int >= arg.__var_int
 
     def __gt__(self, arg: Union[TAddress, object]) -> bool:
         """Greater."""
         if not isinstance(arg, Address):
-            raise Raise.error(
-                f"Expected argument of Address type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
-            return False
-        return int(self) > int(arg)
+            return NotImplemented
+        return self.__var_int > arg.__var_int
 
     def __le__(self, arg: Union[TAddress, object]) -> bool:
         """Less or equal."""
         if not isinstance(arg, Address):
-            raise Raise.error(
-                f"Expected argument of Address type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
-        return int(self) <= int(arg)
+            return NotImplemented
+        return self.__var_int <= arg.__var_int
 
     def __lt__(self, arg: Union[TAddress, object]) -> bool:
         """Less."""
         if not isinstance(arg, Address):
-            raise Raise.error(
-                f"Expected argument of Address type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
-            return False
-        return int(self) < int(arg)
+            return NotImplemented
+        return self.__var_int < arg.__var_int
 
     def __ne__(self, arg: Union[TAddress, object]) -> bool:
         """Negative."""
         if not isinstance(arg, Address):
-            return False
-        return int(self) != int(arg)
+            return NotImplemented
+        return self.__var_int != arg.__var_int
+
+    def __hash__(self) -> int:
+        """Return hash of the integer value."""
+        return hash(self.__var_int)
 
     @staticmethod
     def __int_to_ip(ip_int: int) -> str:
@@ -123,40 +108,77 @@ class Address(IComparators, BClasses, NoDynamicAttributes):
         """Convert ipv4 str representation to ip int."""
         return struct.unpack("!L", socket.inet_aton(ip_str))[0]
 
+    @staticmethod
+    def __parts_to_int(
+        value: Union[List[str], List[int], List[Octet]],
+    ) -> Optional[int]:
+        """Convert four valid octet values to ip int without building Octets.
+
+        Returns None when any part is invalid, so the caller can fall back
+        to `Octet` validation for the error report.
+        """
+        out: int = 0
+        for part in value:
+            if isinstance(part, str):
+                try:
+                    part = int(part)
+                except ValueError:
+                    return None
+            elif isinstance(part, Octet):
+                part = part.value
+            elif not isinstance(part, int):
+                return None
+            if part < 0 or part > 255:
+                return None
+            out = out << 8 | part
+        return out
+
     def __set_octets_from_list(
         self, value: Union[List[str], List[int], List[Octet]]
     ) -> None:
         if not value:
-            raise Raise.error(
+            raise Raise.lazy(
                 "Empty list received.",
                 ValueError,
                 self._c_name,
-                currentframe(),
             )
         if len(value) != 4:
-            raise Raise.error(
-                f"Expected list with four elements, len({len(value)}) received.",
+            raise Raise.lazy(
+                "Expected list with four elements, len(%s) received.",
                 ValueError,
                 self._c_name,
-                currentframe(),
+                len(value),
             )
-
+        ip_int: Optional[int] = Address.__parts_to_int(value)
+        if ip_int is not None:
+            self.__var_int = ip_int
+            return
         self.__var_int = Address.__ip_to_int(
             f"{Octet(value[0])}.{Octet(value[1])}.{Octet(value[2])}.{Octet(value[3])}"
         )
 
     def __set_octets_from_int(self, value: int) -> None:
-        if value in range(0, 4294967296):
+        if 0 <= value <= _IPV4_MAX:
             self.__var_int = value
         else:
-            raise Raise.error(
-                f"IP-int out of range (0-4294967295), received: {value}",
+            raise Raise.lazy(
+                "IP-int out of range (0-4294967295), received: %s",
                 ValueError,
                 self._c_name,
-                currentframe(),
+                value,
             )
 
     def __set_octets_from_str(self, value: str) -> None:
+        # Canonical dotted quads are parsed by inet_aton alone; other forms
+        # accepted by Octet (leading zeros, spaces) take the validated path.
+        try:
+            packed: bytes = socket.inet_aton(value)
+        except (OSError, ValueError):
+            pass
+        else:
+            if socket.inet_ntoa(packed) == value:
+                self.__var_int = int.from_bytes(packed, "big")
+                return
         self.__set_octets_from_list(value.split("."))
 
     def __int__(self) -> int:
@@ -178,8 +200,13 @@ class Address(IComparators, BClasses, NoDynamicAttributes):
         ### Returns:
         List[Octet] - List of four Octet objects representing each byte.
         """
-        tmp: list[str] = str(self).split(".")
-        return [Octet(tmp[0]), Octet(tmp[1]), Octet(tmp[2]), Octet(tmp[3])]
+        ip_int: int = self.__var_int
+        return [
+            Octet(ip_int >> 24),
+            Octet(ip_int >> 16 & 0xFF),
+            Octet(ip_int >> 8 & 0xFF),
+            Octet(ip_int & 0xFF),
+        ]
 
     @octets.setter
     def octets(
@@ -190,23 +217,23 @@ class Address(IComparators, BClasses, NoDynamicAttributes):
         ### Arguments:
         * value: Union[str, int, Union[List[str], List[int], List[Octet]]] - IPv4 address representation.
         """
-        if isinstance(value, List):
-            self.__set_octets_from_list(value)
+        if isinstance(value, str):
+            self.__set_octets_from_str(value)
         elif isinstance(value, int):
             self.__set_octets_from_int(value)
-        elif isinstance(value, str):
-            self.__set_octets_from_str(value)
+        elif isinstance(value, list):
+            self.__set_octets_from_list(value)
         else:
-            raise Raise.error(
-                f"Expected String or Integer or List type, received: {type(value)}.",
+            raise Raise.lazy(
+                "Expected String or Integer or List type, received: %s.",
                 TypeError,
                 self._c_name,
-                currentframe(),
+                type(value),
             )
 
 
 # netmask
-class Netmask(BClasses, NoDynamicAttributes):
+class Netmask(IComparators, BClasses, NoDynamicAttributes):
     """Netmask class for IPv4 addresses.
 
     Constructor argument:
@@ -221,8 +248,7 @@ class Netmask(BClasses, NoDynamicAttributes):
     cidr: Union[str, int] -- Set netmask from CIDR format of string or integer.
     """
 
-    # CIDR format
-    __cidr: int = 0
+    __slots__ = ("__cidr",)
 
     def __init__(
         self, addr: Union[str, int, Union[List[str], List[int], List[Octet]]]
@@ -239,8 +265,8 @@ class Netmask(BClasses, NoDynamicAttributes):
                 self.cidr = addr
             else:
                 self.octets = addr
-        elif isinstance(addr, List):
-            self.octets = str(Address(addr))
+        elif isinstance(addr, list):
+            self.octets = addr
         else:
             raise Raise.error(
                 f"Expected String, Integer or List type, received: '{type(addr)}'.",
@@ -249,21 +275,59 @@ class Netmask(BClasses, NoDynamicAttributes):
                 currentframe(),
             )
 
+    def __eq__(self, arg: Union[TNetmask, object]) -> bool:
+        """Equal."""
+        if not isinstance(arg, Netmask):
+            return NotImplemented
+        return self.__cidr == arg.__cidr
+
+    def __ge__(self, arg: Union[TNetmask, object]) -> bool:
+        """Greater or equal."""
+        if not isinstance(arg, Netmask):
+            return NotImplemented
+        return self.__cidr >= arg.__cidr
+
+    def __gt__(self, arg: Union[TNetmask, object]) -> bool:
+        """Greater."""
+        if not isinstance(arg, Netmask):
+            return NotImplemented
+        return self.__cidr > arg.__cidr
+
+    def __le__(self, arg: Union[TNetmask, object]) -> bool:
+        """Less or equal."""
+        if not isinstance(arg, Netmask):
+            return NotImplemented
+        return self.__cidr <= arg.__cidr
+
+    def __lt__(self, arg: Union[TNetmask, object]) -> bool:
+        """Less."""
+        if not isinstance(arg, Netmask):
+            return NotImplemented
+        return self.__cidr < arg.__cidr
+
+    def __ne__(self, arg: Union[TNetmask, object]) -> bool:
+        """Negative."""
+        if not isinstance(arg, Netmask):
+            return NotImplemented
+        return self.__cidr != arg.__cidr
+
+    def __hash__(self) -> int:
+        """Return hash of the prefix length."""
+        return hash(self.__cidr)
+
     def __int__(self) -> int:
         return self.__cidr
 
     def __str__(self) -> str:
         # convert CIDR to netmask
-        return socket.inet_ntoa(
-            struct.pack("!I", (1 << 32) - (1 << (32 - self.__cidr)))
-        )
+        return socket.inet_ntoa(struct.pack("!I", _prefix_mask(self.__cidr)))
 
     def __repr__(self) -> str:
         return f"{self._c_name}({self.cidr})"
 
     def __cidr_validator(self, cidr: int) -> None:
         """Check and set cidr."""
-        if cidr >= 0 and cidr <= 32:
+        if 0 <= cidr <= 32:
             self.__cidr = cidr
         else:
             raise Raise.error(
@@ -275,45 +339,9 @@ class Netmask(BClasses, NoDynamicAttributes):
 
     @staticmethod
     def __octets_validator(octets: int) -> bool:
-        """Check if given octets list is valid."""
-        test: list[int] = [
-            0,  # '0.0.0.0'
-            2147483648,  # "128.0.0.0",
-            3221225472,  # "192.0.0.0",
-            3758096384,  # "224.0.0.0",
-            4026531840,  # "240.0.0.0",
-            4160749568,  # "248.0.0.0",
-            4227858432,  # "252.0.0.0",
-            4261412864,  # "254.0.0.0",
-            4278190080,  # "255.0.0.0",
-            4286578688,  # "255.128.0.0",
-            4290772992,  # "255.192.0.0",
-            4292870144,  # "255.224.0.0",
-            4293918720,  # "255.240.0.0",
-            4294443008,  # "255.248.0.0",
-            4294705152,  # "255.252.0.0",
-            4294836224,  # "255.254.0.0",
-            4294901760,  # "255.255.0.0",
-            4294934528,  # "255.255.128.0",
-            4294950912,  # "255.255.192.0",
-            4294959104,  # "255.255.224.0",
-            4294963200,  # "255.255.240.0",
-            4294965248,  # "255.255.248.0",
-            4294966272,  # "255.255.252.0",
-            4294966784,  # "255.255.254.0",
-            4294967040,  # "255.255.255.0",
-            4294967168,  # "255.255.255.128",
-            4294967232,  # "255.255.255.192",
-            4294967264,  # "255.255.255.224",
-            4294967280,  # "255.255.255.240",
-            4294967288,  # "255.255.255.248",
-            4294967292,  # "255.255.255.252",
-            4294967294,  # "255.255.255.254",
-            4294967295,  # "255.255.255.255",
-        ]
-        if octets in test:
-            return True
-        return False
+        """Check if given integer is a contiguous netmask."""
+        inverse: int = octets ^ _IPV4_MAX
+        return 0 <= octets <= _IPV4_MAX and inverse & (inverse + 1) == 0
 
     @property
     def octets(self) -> List[Octet]:
@@ -322,8 +350,7 @@ class Netmask(BClasses, NoDynamicAttributes):
         ### Returns:
         List[Octet] - List of four Octet objects representing each byte.
         """
-        tmp: list[str] = str(self).split(".")
-        return [Octet(tmp[0]), Octet(tmp[1]), Octet(tmp[2]), Octet(tmp[3])]
+        return Address(_prefix_mask(self.__cidr)).octets
 
     @octets.setter
     def octets(
@@ -337,12 +364,12 @@ class Netmask(BClasses, NoDynamicAttributes):
         tmp = int(Address(addr))
         if not Netmask.__octets_validator(tmp):
             raise Raise.error(
-                f"Invalid mask, received: {str(Address(addr))}",
+                f"Invalid mask, received: {str(Address(tmp))}",
                 ValueError,
                 self._c_name,
                 currentframe(),
             )
-        self.cidr = sum([bin(x.value).count("1") for x in Address(addr).octets])
+        self.__cidr = bin(tmp).count("1")
 
     @property
     def cidr(self) -> str:
@@ -374,7 +401,7 @@ class Netmask(BClasses, NoDynamicAttributes):
 
 
 # Network
-class Network(BClasses, NoDynamicAttributes):
+class Network(IComparators, BClasses, NoDynamicAttributes):
     """Network IPv4 class.
 
     Constructor argument:
@@ -392,8 +419,7 @@ class Network(BClasses, NoDynamicAttributes):
     min: Address -- Return min address of host in network range.
     """
 
-    __address: Address = None  # type: ignore
-    __mask: Netmask = None  # type: ignore
+    __slots__ = ("__address", "__mask")
 
     def __init__(self, addr: Union[str, List]) -> None:
         """Constructor.
@@ -403,7 +429,7 @@ class Network(BClasses, NoDynamicAttributes):
         """
         if isinstance(addr, str):
             self.__network_from_str(addr)
-        elif isinstance(addr, List):
+        elif isinstance(addr, list):
             self.__network_from_list(addr)
         else:
             raise Raise.error(
@@ -413,6 +439,52 @@ class Network(BClasses, NoDynamicAttributes):
                 currentframe(),
             )
 
+    def __eq__(self, arg: Union[TNetwork, object]) -> bool:
+        """Equal."""
+        if not isinstance(arg, Network):
+            return NotImplemented
+        return self.__key == arg.__key
+
+    def __ge__(self, arg: Union[TNetwork, object]) -> bool:
+        """Greater or equal."""
+        if not isinstance(arg, Network):
+            return NotImplemented
+        return self.__key >= arg.__key
+
+    def __gt__(self, arg: Union[TNetwork, object]) -> bool:
+        """Greater."""
+        if not isinstance(arg, Network):
+            return NotImplemented
+        return self.__key > arg.__key
+
+    def __le__(self, arg: Union[TNetwork, object]) -> bool:
+        """Less or equal."""
+        if not isinstance(arg, Network):
+            return NotImplemented
+        return self.__key <= arg.__key
+
+    def __lt__(self, arg: Union[TNetwork, object]) -> bool:
+        """Less."""
+        if not isinstance(arg, Network):
+            return NotImplemented
+        return self.__key < arg.__key
+
+    def __ne__(self, arg: Union[TNetwork, object]) -> bool:
+        """Negative."""
+        if not isinstance(arg, Network):
+            return NotImplemented
+        return self.__key != arg.__key
+
+    def __hash__(self) -> int:
+        """Return hash of the network address and prefix length."""
+        return hash(self.__key)
+
+    @property
+    def __key(self) -> Tuple[int, int]:
+        """Return (network address, prefix length) used for comparisons."""
+        cidr: int = int(self.__mask)
+        return int(self.__address) & _prefix_mask(cidr), cidr
+
     def __str__(self) -> str:
         """Return string representation of network address."""
         return f"{self.network}/{int(self.mask)}"
@@ -445,11 +517,11 @@ class Network(BClasses, NoDynamicAttributes):
                 currentframe(),
             )
         if isinstance(addr[0], Address):
-            self.__address = deepcopy(addr[0])
+            self.__address = Address(int(addr[0]))
         else:
             self.__address = Address(addr[0])
         if isinstance(addr[1], Netmask):
-            self.__mask = deepcopy(addr[1])
+            self.__mask = Netmask(int(addr[1]))
         else:
             self.__mask = Netmask(addr[1])
 
@@ -469,9 +541,7 @@ class Network(BClasses, NoDynamicAttributes):
         ### Returns:
         Address - The broadcast address for this network.
         """
-        ip = int(self.address)
-        mask = int(Address(self.mask.octets))
-        broadcast: int = ip | (mask ^ (1 << 32) - 1)
+        broadcast: int = int(self.__address) | _IPV4_MAX >> int(self.__mask)
         return Address(broadcast)
 
     @property
@@ -575,9 +645,7 @@ class Network(BClasses, NoDynamicAttributes):
         ### Returns:
         Address - The network address.
         """
-        ip = int(self.address)
-        mask = int(Address(self.mask.octets))
-        net: int = ip & mask
+        net: int = int(self.__address) & _prefix_mask(int(self.__mask))
         return Address(net)
 
 
@@ -13,7 +13,7 @@ import socket
 from copy import deepcopy
 from inspect import currentframe
 import warnings
-from typing import Iterator, Optional, TypeVar, Union, List
+from typing import Iterator, Optional, Tuple, TypeVar, Union, List
 
 from ..attribtool import NoDynamicAttributes
 from ..raisetool import Raise
@@ -54,69 +54,43 @@ class Address6(IComparators, BClasses, NoDynamicAttributes):
     def __eq__(self, arg: Union[TAddress6, object]) -> bool:
         """Equal."""
         if not isinstance(arg, Address6):
-            raise Raise.error(
-                f"Expected argument of Address6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) == int(arg)
 
     def __ge__(self, arg: Union[TAddress6, object]) -> bool:
         """Greater or equal."""
         if not isinstance(arg, Address6):
-            raise Raise.error(
-                f"Expected argument of Address6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) >= int(arg)
 
     def __gt__(self, arg: Union[TAddress6, object]) -> bool:
         """Greater."""
         if not isinstance(arg, Address6):
-            raise Raise.error(
-                f"Expected argument of Address6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) > int(arg)
 
     def __le__(self, arg: Union[TAddress6, object]) -> bool:
         """Less or equal."""
         if not isinstance(arg, Address6):
-            raise Raise.error(
-                f"Expected argument of Address6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) <= int(arg)
 
     def __lt__(self, arg: Union[TAddress6, object]) -> bool:
         """Less."""
         if not isinstance(arg, Address6):
-            raise Raise.error(
-                f"Expected argument of Address6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) < int(arg)
 
     def __ne__(self, arg: Union[TAddress6, object]) -> bool:
         """Negative."""
         if not isinstance(arg, Address6):
-            raise Raise.error(
-                f"Expected argument of Address6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) != int(arg)
 
+    def __hash__(self) -> int:
+        """Return hash of the integer value."""
+        return hash(int(self))
+
     @staticmethod
     def __check_groups(group_list: List[str]) -> List[str]:
         for i in range(0, len(group_list)):
@@ -177,11 +151,10 @@ class Address6(IComparators, BClasses, NoDynamicAttributes):
     ) -> None:
         """Set address from list."""
         if len(value) != 8:
-            raise Raise.error(
-                f"Expected list of eight elements.",
+            raise Raise.lazy(
+                "Expected list of eight elements.",
                 ValueError,
                 self._c_name,
-                currentframe(),
             )
         tmp: str = (
             f"{str(Word16(value[0]))}:"
@@ -200,22 +173,22 @@ class Address6(IComparators, BClasses, NoDynamicAttributes):
         if value in range(0, 340282366920938463463374607431768211456):
             self.__var_int = value
         else:
-            raise Raise.error(
-                f"IP-int out of range (0-340282366920938463463374607431768211455), received: {value}",
+            raise Raise.lazy(
+                "IP-int out of range (0-340282366920938463463374607431768211455), received: %s",
                 ValueError,
                 self._c_name,
-                currentframe(),
+                value,
             )
 
     def __set_words_from_str(self, value: str) -> None:
         if Address6.__is_valid_ipv6(value):
             self.__var_int = Address6.__ip_to_int(value)
         else:
-            raise Raise.error(
-                f"IPv6 address is invalid: {value}",
+            raise Raise.lazy(
+                "IPv6 address is invalid: %s",
                 ValueError,
                 self._c_name,
-                currentframe(),
+                value,
             )
 
     def __int__(self) -> int:
@@ -265,11 +238,11 @@ class Address6(IComparators, BClasses, NoDynamicAttributes):
         elif isinstance(value, str):
             self.__set_words_from_str(value)
         else:
-            raise Raise.error(
-                f"Expected String or Integer or List type, received: {type(value)}.",
+            raise Raise.lazy(
+                "Expected String or Integer or List type, received: %s.",
                 TypeError,
                 self._c_name,
-                currentframe(),
+                type(value),
             )
 
 
@@ -277,6 +250,7 @@ class Address6(IComparators, BClasses, NoDynamicAttributes):
 # https://www.heficed.com/subnet-mask-cheat-sheet/
 
 TPrefix6 = TypeVar("TPrefix6", bound="Prefix6")
+TNetwork6 = TypeVar("TNetwork6", bound="Network6")
 
 
 class Prefix6(IComparators, BClasses, NoDynamicAttributes):
@@ -305,69 +279,43 @@ class Prefix6(IComparators, BClasses, NoDynamicAttributes):
     def __eq__(self, arg: Union[TPrefix6, object]) -> bool:
         """Equal."""
         if not isinstance(arg, Prefix6):
-            raise Raise.error(
-                f"Expected argument of Prefix6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) == int(arg)
 
     def __ge__(self, arg: Union[TPrefix6, object]) -> bool:
         """Greater or equal."""
         if not isinstance(arg, Prefix6):
-            raise Raise.error(
-                f"Expected argument of Prefix6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) >= int(arg)
 
     def __gt__(self, arg: Union[TPrefix6, object]) -> bool:
         """Greater."""
         if not isinstance(arg, Prefix6):
-            raise Raise.error(
-                f"Expected argument of Prefix6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) > int(arg)
 
     def __le__(self, arg: Union[TPrefix6, object]) -> bool:
         """Less or equal."""
         if not isinstance(arg, Prefix6):
-            raise Raise.error(
-                f"Expected argument of Prefix6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) <= int(arg)
 
     def __lt__(self, arg: Union[TPrefix6, object]) -> bool:
         """Less."""
         if not isinstance(arg, Prefix6):
-            raise Raise.error(
-                f"Expected argument of Prefix6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) < int(arg)
 
     def __ne__(self, arg: Union[TPrefix6, object]) -> bool:
         """Negative."""
         if not isinstance(arg, Prefix6):
-            raise Raise.error(
-                f"Expected argument of Prefix6 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) != int(arg)
 
+    def __hash__(self) -> int:
+        """Return hash of the integer value."""
+        return hash(int(self))
+
     def __str__(self) -> str:
         """Return prefix as string.
 
@@ -441,7 +389,7 @@ class Prefix6(IComparators, BClasses, NoDynamicAttributes):
 
 
 # Network
-class Network6(BClasses, NoDynamicAttributes):
+class Network6(IComparators, BClasses, NoDynamicAttributes):
     """Network6 IPv6 class.
 
     Constructor argument:
@@ -479,6 +427,52 @@ class Network6(BClasses, NoDynamicAttributes):
                 currentframe(),
             )
 
+    def __eq__(self, arg: Union[TNetwork6, object]) -> bool:
+        """Equal."""
+        if not isinstance(arg, Network6):
+            return NotImplemented
+        return self.__key == arg.__key
+
+    def __ge__(self, arg: Union[TNetwork6, object]) -> bool:
+        """Greater or equal."""
+        if not isinstance(arg, Network6):
+            return NotImplemented
+        return self.__key >= arg.__key
+
+    def __gt__(self, arg: Union[TNetwork6, object]) -> bool:
+        """Greater."""
+        if not isinstance(arg, Network6):
+            return NotImplemented
+        return self.__key > arg.__key
+
+    def __le__(self, arg: Union[TNetwork6, object]) -> bool:
+        """Less or equal."""
+        if not isinstance(arg, Network6):
+            return NotImplemented
+        return self.__key <= arg.__key
+
+    def __lt__(self, arg: Union[TNetwork6, object]) -> bool:
+        """Less."""
+        if not isinstance(arg, Network6):
+            return NotImplemented
+        return self.__key < arg.__key
+
+    def __ne__(self, arg: Union[TNetwork6, object]) -> bool:
+        """Negative."""
+        if not isinstance(arg, Network6):
+            return NotImplemented
+        return self.__key != arg.__key
+
+    def __hash__(self) -> int:
+        """Return hash of the network address and prefix length."""
+        return hash(self.__key)
+
+    @property
+    def __key(self) -> Tuple[int, int]:
+        """Return (network address, prefix length) used for comparisons."""
+        prefix: int = int(self.__prefix)
+        return int(self.__address) & ~((1 << 128 - prefix) - 1), prefix
+
     def __str__(self) -> str:
         """Return string representation of network address."""
         return f"{self.network}/{int(self.prefix)}"
@@ -604,12 +598,7 @@ class Network6(BClasses, NoDynamicAttributes):
         """
         ip = int(self.address)
         mask: int = (1 << 128 - int(self.prefix)) - 1
-        net: int = ip & ~mask
-        subnet_address = []
-        for _ in range(8):
-            subnet_address.insert(0, format(net & 0xFFFF, "x"))
-            net >>= 16
-        return Address6(":".join(subnet_address))
+        return Address6(ip & ~mask)
 
     @property
     def network(self) -> Address6:
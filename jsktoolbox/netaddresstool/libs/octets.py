@@ -6,7 +6,6 @@ Created: 23.06.2023
 Purpose: Octet class for representing ipv4 octet.
 """
 
-from inspect import currentframe
 from typing import Union, TypeVar
 
 from ...attribtool import NoDynamicAttributes
@@ -30,7 +29,7 @@ class Octet(IComparators, BClasses, NoDynamicAttributes):
     value [str|int|Octet] -- Set value of octet.
     """
 
-    __value: int = 0
+    __slots__ = ("__value",)
 
     def __init__(self, value: Union[str, int, TOctet]) -> None:
         """Constructor.
@@ -43,70 +42,43 @@ class Octet(IComparators, BClasses, NoDynamicAttributes):
     def __eq__(self, arg: Union[TOctet, object]) -> bool:
         """Equal."""
         if not isinstance(arg, Octet):
-            raise Raise.error(
-                f"Expected argument of Octet type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) == int(arg)
 
     def __ge__(self, arg: Union[TOctet, object]) -> bool:
         """Greater then or equal."""
         if not isinstance(arg, Octet):
-            raise Raise.error(
-                f"Expected argument of Octet type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) >= int(arg)
 
     def __gt__(self, arg: Union[TOctet, object]) -> bool:
         """Greater then."""
         if not isinstance(arg, Octet):
-            raise Raise.error(
-                f"Expected argument of Octet type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
-            return False
+            return NotImplemented
         return int(self) > int(arg)
 
     def __le__(self, arg: Union[TOctet, object]) -> bool:
         """Less then or equal."""
         if not isinstance(arg, Octet):
-            raise Raise.error(
-                f"Expected argument of Octet type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) <= int(arg)
 
     def __lt__(self, arg: Union[TOctet, object]) -> bool:
         """Less then."""
         if not isinstance(arg, Octet):
-            raise Raise.error(
-                f"Expected argument of Octet type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) < int(arg)
 
     def __ne__(self, arg: Union[TOctet, object]) -> bool:
         """Negative."""
         if not isinstance(arg, Octet):
-            raise Raise.error(
-                f"Expected argument of Octet type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return int(self) != int(arg)
 
+    def __hash__(self) -> int:
+        """Return hash of the integer value."""
+        return hash(int(self))
+
     def __int__(self) -> int:
         """Return integer representation of octet."""
         return self.value
@@ -161,11 +133,11 @@ class Octet(IComparators, BClasses, NoDynamicAttributes):
                 self.__value = args
                 return
             else:
-                raise Raise.error(
-                    f"Received value '{args}' out of range(0-255).",
+                raise Raise.lazy(
+                    "Received value '%s' out of range(0-255).",
                     ValueError,
                     self._c_name,
-                    currentframe(),
+                    args,
                 )
         elif isinstance(args, str):
             if Octet.__is_integer(args):
@@ -174,21 +146,21 @@ class Octet(IComparators, BClasses, NoDynamicAttributes):
                     self.__value = var
                     return
                 else:
-                    raise Raise.error(
-                        f"Received value '{args}' out of range(0-255).",
+                    raise Raise.lazy(
+                        "Received value '%s' out of range(0-255).",
                         ValueError,
                         self._c_name,
-                        currentframe(),
+                        args,
                     )
         elif isinstance(args, Octet):
             tmp: TOctet = args
             self.__value = tmp.value
             return
-        raise Raise.error(
-            f"Expected Integer or String type, received: '{type(args)}'.",
+        raise Raise.lazy(
+            "Expected Integer or String type, received: '%s'.",
             TypeError,
             self._c_name,
-            currentframe(),
+            type(args),
         )
 
 
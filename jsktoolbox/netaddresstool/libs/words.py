@@ -6,7 +6,6 @@ Created: 14.09.2023
 Purpose: Word16 class for representing IPv6 word.
 """
 
-from inspect import currentframe
 from typing import Union, TypeVar
 
 from ...attribtool import NoDynamicAttributes
@@ -42,69 +41,43 @@ class Word16(IComparators, BClasses, NoDynamicAttributes):
     def __eq__(self, arg: Union[TWord16, object]) -> bool:
         """Equal."""
         if not isinstance(arg, Word16):
-            raise Raise.error(
-                f"Expected argument of Word16 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return self.value == arg.value
 
     def __ge__(self, arg: Union[TWord16, object]) -> bool:
         """Greater then or equal."""
         if not isinstance(arg, Word16):
-            raise Raise.error(
-                f"Expected argument of Word16 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return self.value >= arg.value
 
     def __gt__(self, arg: Union[TWord16, object]) -> bool:
         """Greater then."""
         if not isinstance(arg, Word16):
-            raise Raise.error(
-                f"Expected argument of Word16 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return self.value > arg.value
 
     def __le__(self, arg: Union[TWord16, object]) -> bool:
         """Less then or equal."""
         if not isinstance(arg, Word16):
-            raise Raise.error(
-                f"Expected argument of Word16 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return self.value <= arg.value
 
     def __lt__(self, arg: Union[TWord16, object]) -> bool:
         """Less then."""
         if not isinstance(arg, Word16):
-            raise Raise.error(
-                f"Expected argument of Word16 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return self.value < arg.value
 
     def __ne__(self, arg: Union[TWord16, object]) -> bool:
         """Negative."""
         if not isinstance(arg, Word16):
-            raise Raise.error(
-                f"Expected argument of Word16 type, received: {type(arg)}.",
-                TypeError,
-                self._c_name,
-                currentframe(),
-            )
+            return NotImplemented
         return self.value != arg.value
 
+    def __hash__(self) -> int:
+        """Return hash of the integer value."""
+        return hash(self.value)
+
     def __int__(self) -> int:
         """Return integer representation of word."""
         return self.value
@@ -170,11 +143,11 @@ class Word16(IComparators, BClasses, NoDynamicAttributes):
                 self.__value = args
                 return
             else:
-                raise Raise.error(
-                    f"Received value '{args}' out of range(0-65535).",
+                raise Raise.lazy(
+                    "Received value '%s' out of range(0-65535).",
                     ValueError,
                     self._c_name,
-                    currentframe(),
+                    args,
                 )
         elif isinstance(args, str):
             if Word16.__is_integer(args):
@@ -182,27 +155,27 @@ class Word16(IComparators, BClasses, NoDynamicAttributes):
                 if Word16.__check_range(var):
                     self.__value = var
                     return
-                raise Raise.error(
-                    f"Received value '{args}' out of range(0-65535).",
+                raise Raise.lazy(
+                    "Received value '%s' out of range(0-65535).",
                     ValueError,
                     self._c_name,
-                    currentframe(),
+                    args,
                 )
-            raise Raise.error(
-                f"Received value '{args}' is not a valid integer literal.",
+            raise Raise.lazy(
+                "Received value '%s' is not a valid integer literal.",
                 ValueError,
                 self._c_name,
-                currentframe(),
+                args,
             )
         elif isinstance(args, Word16):
             tmp: TWord16 = args
             self.__value = tmp.value
             return
-        raise Raise.error(
-            f"Expected Integer or String type, received: '{type(args)}'.",
+        raise Raise.lazy(
+            "Expected Integer or String type, received: '%s'.",
             TypeError,
             self._c_name,
-            currentframe(),
+            type(args),
         )
 
 
@@ -0,0 +1,354 @@
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Prefix lookup table for IPv4 and IPv6 networks.
+
+`PrefixTrie` is a path-compressed binary (Patricia) trie keyed by `Network`
+and `Network6` objects. Every operation walks at most one node per prefix
+bit, so longest-prefix match, covering and covered queries cost O(prefix
+length) regardless of how many prefixes are stored.
+"""
+
+from inspect import currentframe
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from ..attribtool import NoDynamicAttributes
+from ..basetool.classes import BClasses
+from ..raisetool import Raise
+from .ipv4 import Address, Network
+from .ipv6 import Address6, Network6
+
+TNetworkKey = Union[Network, Network6, str]
+TAddressKey = Union[Address, Address6, Network, Network6, str]
+
+
+class _Node(object):
+    """Trie node; `network` is None for pure branching nodes."""
+
+    __slots__ = ("key", "plen", "network", "value", "child")
+
+    def __init__(self, key: int, plen: int) -> None:
+        self.key: int = key
+        self.plen: int = plen
+        self.network: Optional[Union[Network, Network6]] = None
+        self.value: Any = None
+        self.child: List[Optional["_Node"]] = [None, None]
+
+
+class PrefixTrie(BClasses, NoDynamicAttributes):
+    """Longest-prefix-match table over `Network` and `Network6` keys.
+
+    The table behaves like a mapping from networks to payloads. Networks
+    are compared by network address and prefix length, so `10.0.0.7/24`
+    and `10.0.0.0/24` are the same key. IPv4 and IPv6 prefixes are kept in
+    separate trees and may be mixed in one table. Keys and lookup arguments
+    may also be given as strings.
+    """
+
+    __slots__ = ("__root4", "__root6", "__size")
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self.__root4: _Node = _Node(0, 0)
+        self.__root6: _Node = _Node(0, 0)
+        self.__size: int = 0
+
+    def __len__(self) -> int:
+        """Return number of stored prefixes."""
+        return self.__size
+
+    def __contains__(self, network: TNetworkKey) -> bool:
+        """Check if the exact prefix is stored."""
+        return self.__find(network) is not None
+
+    def __getitem__(self, network: TNetworkKey) -> Any:
+        """Return payload of the exact prefix."""
+        node: Optional[_Node] = self.__find(network)
+        if node is None:
+            raise Raise.error(
+                f"Prefix not found: '{network}'.",
+                KeyError,
+                self._c_name,
+                currentframe(),
+            )
+        return node.value
+
+    def __setitem__(self, network: TNetworkKey, value: Any) -> None:
+        """Store payload for the prefix."""
+        self.insert(network, value)
+
+    def __delitem__(self, network: TNetworkKey) -> None:
+        """Remove the prefix."""
+        self.delete(network)
+
+    def __iter__(self) -> Iterator[Union[Network, Network6]]:
+        """Iterate over stored networks, IPv4 first, in address order."""
+        for root in (self.__root4, self.__root6):
+            for node in PrefixTrie.__walk(root):
+                yield node.network  # type: ignore
+
+    def __repr__(self) -> str:
+        """Return representation of object."""
+        return f"{self._c_name}(size={self.__size})"
+
+    @staticmethod
+    def __network(network: TNetworkKey) -> Union[Network, Network6]:
+        """Return network object for the key."""
+        if isinstance(network, (Network, Network6)):
+            return network
+        if isinstance(network, str):
+            return Network6(network) if ":" in network else Network(network)
+        raise Raise.lazy(
+            "Expected Network, Network6 or str type, received: %s.",
+            TypeError,
+            "PrefixTrie",
+            type(network),
+        )
+
+    def __prefix(
+        self, network: Union[Network, Network6]
+    ) -> Tuple[_Node, int, int, int]:
+        """Return (root, key, prefix length, width) for the network."""
+        if isinstance(network, Network):
+            return self.__root4, int(network.network), int(network.mask), 32
+        return self.__root6, int(network.network), int(network.prefix), 128
+
+    def __address(self, address: TAddressKey) -> Tuple[_Node, int, int, int]:
+        """Return (root, key, prefix length, width) for a lookup argument."""
+        if isinstance(address, str):
+            if "/" in address:
+                address = PrefixTrie.__network(address)
+            else:
+                address = Address6(address) if ":" in address else Address(address)
+        if isinstance(address, Address):
+            return self.__root4, int(address), 32, 32
+        if isinstance(address, Address6):
+            return self.__root6, int(address), 128, 128
+        return self.__prefix(PrefixTrie.__network(address))
+
+    @staticmethod
+    def __common(key_a: int, key_b: int, limit: int, width: int) -> int:
+        """Return length of the common leading bits, at most `limit`."""
+        diff: int = key_a ^ key_b
+        if diff == 0:
+            return limit
+        return min(limit, width - diff.bit_length())
+
+    @staticmethod
+    def __matches(node: _Node, key: int, width: int) -> bool:
+        """Check if `key` starts with the node prefix."""
+        return (key ^ node.key) >> (width - node.plen) == 0
+
+    @staticmethod
+    def __walk(node: Optional[_Node]) -> Iterator[_Node]:
+        """Yield stored nodes of the subtree in address order."""
+        stack: List[Optional[_Node]] = [node]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if node.network is not None:
+                yield node
+            stack.append(node.child[1])
+            stack.append(node.child[0])
+
+    def __find(self, network: TNetworkKey) -> Optional[_Node]:
+        """Return the node storing exactly this prefix."""
+        root, key, plen, width = self.__prefix(PrefixTrie.__network(network))
+        node: Optional[_Node] = root
+        while node is not None and node.plen <= plen:
+            if not PrefixTrie.__matches(node, key, width):
+                return None
+            if node.plen == plen:
+                return node if node.network is not None else None
+            node = node.child[(key >> (width - 1 - node.plen)) & 1]
+        return None
+
+    def insert(self, network: TNetworkKey, value: Any = None) -> None:
+        """Store the prefix with its payload, replacing an existing payload.
+
+        ### Arguments:
+        * network: Union[Network, Network6, str] - Prefix key.
+        * value: Any - Payload returned by lookups.
+
+        ### Raises:
+        * TypeError: Unsupported key type.
+        """
+        net: Union[Network, Network6] = PrefixTrie.__network(network)
+        root, key, plen, width = self.__prefix(net)
+        node: _Node = root
+        while True:
+            if node.plen == plen:
+                if node.network is None:
+                    self.__size += 1
+                node.network = net
+                node.value = value
+                return
+            bit: int = (key >> (width - 1 - node.plen)) & 1
+            child: Optional[_Node] = node.child[bit]
+            if child is None:
+                leaf = _Node(key, plen)
+                leaf.network = net
+                leaf.value = value
+                node.child[bit] = leaf
+                self.__size += 1
+                return
+            common: int = PrefixTrie.__common(
+                child.key, key, min(child.plen, plen), width
+            )
+            if common == child.plen:
+                node = child
+                continue
+            if common == plen:
+                # The new prefix becomes the parent of `child`.
+                leaf = _Node(key, plen)
+                leaf.child[(child.key >> (width - 1 - plen)) & 1] = child
+                node.child[bit] = leaf
+            else:
+                # Both hang under a new branching node at the common prefix.
+                branch = _Node(key >> (width - common) << (width - common), common)
+                leaf = _Node(key, plen)
+                branch.child[(key >> (width - 1 - common)) & 1] = leaf
+                branch.child[(child.key >> (width - 1 - common)) & 1] = child
+                node.child[bit] = branch
+            leaf.network = net
+            leaf.value = value
+            self.__size += 1
+            return
+
+    def delete(self, network: TNetworkKey) -> None:
+        """Remove the prefix.
+
+        ### Arguments:
+        * network: Union[Network, Network6, str] - Prefix key.
+
+        ### Raises:
+        * KeyError: The prefix is not stored.
+        """
+        root, key, plen, width = self.__prefix(PrefixTrie.__network(network))
+        path: List[_Node] = []
+        node: Optional[_Node] = root
+        while node is not None and node.plen < plen:
+            if not PrefixTrie.__matches(node, key, width):
+                node = None
+                break
+            path.append(node)
+            node = node.child[(key >> (width - 1 - node.plen)) & 1]
+        if (
+            node is None
+            or node.plen != plen
+            or node.network is None
+            or not PrefixTrie.__matches(node, key, width)
+        ):
+            raise Raise.error(
+                f"Prefix not found: '{network}'.",
+                KeyError,
+                self._c_name,
+                currentframe(),
+            )
+        node.network = None
+        node.value = None
+        self.__size -= 1
+        # Drop branching nodes left with fewer than two children.
+        while path and node.network is None:
+            parent: _Node = path[-1]
+            children: List[_Node] = [item for item in node.child if item is not None]
+            if len(children) == 2:
+                break
+            parent.child[parent.child.index(node)] = children[0] if children else None
+            node = parent
+            path.pop()
+
+    def get(self, network: TNetworkKey, default: Any = None) -> Any:
+        """Return payload of the exact prefix or `default`.
+
+        ### Arguments:
+        * network: Union[Network, Network6, str] - Prefix key.
+        * default: Any - Value returned when the prefix is not stored.
+
+        ### Returns:
+        [Any] - Stored payload or `default`.
+        """
+        node: Optional[_Node] = self.__find(network)
+        return default if node is None else node.value
+
+    def longest_match(
+        self, address: TAddressKey
+    ) -> Optional[Tuple[Union[Network, Network6], Any]]:
+        """Return the most specific prefix containing the address.
+
+        ### Arguments:
+        * address: Union[Address, Address6, Network, Network6, str] - Address,
+          or network whose whole range must be contained.
+
+        ### Returns:
+        [Optional[Tuple[Union[Network, Network6], Any]]] - (network, payload),
+        or None when no stored prefix matches.
+        """
+        root, key, plen, width = self.__address(address)
+        best: Optional[_Node] = None
+        node: Optional[_Node] = root
+        while node is not None and node.plen <= plen:
+            if not PrefixTrie.__matches(node, key, width):
+                break
+            if node.network is not None:
+                best = node
+            if node.plen == width:
+                break
+            node = node.child[(key >> (width - 1 - node.plen)) & 1]
+        if best is None:
+            return None
+        return best.network, best.value  # type: ignore
+
+    def covering(
+        self, address: TAddressKey
+    ) -> List[Tuple[Union[Network, Network6], Any]]:
+        """Return all prefixes containing the address or network.
+
+        ### Arguments:
+        * address: Union[Address, Address6, Network, Network6, str] - Lookup key.
+
+        ### Returns:
+        [List[Tuple[Union[Network, Network6], Any]]] - (network, payload)
+        pairs from the least to the most specific; a network key includes
+        itself when stored.
+        """
+        root, key, plen, width = self.__address(address)
+        out: List[Tuple[Union[Network, Network6], Any]] = []
+        node: Optional[_Node] = root
+        while node is not None and node.plen <= plen:
+            if not PrefixTrie.__matches(node, key, width):
+                break
+            if node.network is not None:
+                out.append((node.network, node.value))
+            if node.plen == width:
+                break
+            node = node.child[(key >> (width - 1 - node.plen)) & 1]
+        return out
+
+    def covered(
+        self, network: TNetworkKey
+    ) -> List[Tuple[Union[Network, Network6], Any]]:
+        """Return all prefixes inside the network, including itself.
+
+        ### Arguments:
+        * network: Union[Network, Network6, str] - Enclosing prefix.
+
+        ### Returns:
+        [List[Tuple[Union[Network, Network6], Any]]] - (network, payload)
+        pairs in address order.
+        """
+        root, key, plen, width = self.__prefix(PrefixTrie.__network(network))
+        node: Optional[_Node] = root
+        while node is not None and node.plen < plen:
+            if not PrefixTrie.__matches(node, key, width):
+                return []
+            node = node.child[(key >> (width - 1 - node.plen)) & 1]
+        if node is None or (key ^ node.key) >> (width - plen) != 0:
+            return []
+        return [(item.network, item.value) for item in PrefixTrie.__walk(node)]  # type: ignore
+
+
+# #[EOF]#######################################################################
@@ -19,6 +19,7 @@ from inspect import currentframe
 from typing import Optional, Dict, List, Tuple
 from socket import getaddrinfo
 from re import Pattern
+from shutil import which as find_executable
 
 from .basetool.data import BData
 from .attribtool import ReadOnlyClass
@@ -27,15 +28,6 @@ from .netaddresstool.ipv4 import Address
 from .netaddresstool.ipv6 import Address6
 from .raisetool import Raise
 
-try:
-    # For Python < 3.12
-    from distutils.spawn import (
-        find_executable,
-    )  # pyright: ignore[reportMissingModuleSource]
-except ImportError:
-    # For Python >= 3.12
-    from shutil import which as find_executable
-
 
 class _Keys(object, metaclass=ReadOnlyClass):
     """Private Keys definition class.
@@ -95,7 +87,7 @@ class Pinger(BData):
         )
         tmp: Optional[Tuple[str, int]] = self.__is_tool
         if tmp:
-            (command, multiplier) = tmp
+            command, multiplier = tmp
             self._set_data(key=_Keys.COMMAND, value=command, set_default_type=str)
             self._set_data(key=_Keys.MULTIPLIER, value=multiplier)
 
@@ -8,8 +8,9 @@ and formatting standardized exception messages. It helps in generating
 rich, informative error messages that include details like the class name,
 method name, and line number where the error occurred, facilitating easier debugging.
 """
+
 from types import FrameType
-from typing import Optional
+from typing import Any, Optional
 
 from .attribtool import NoDynamicAttributes
 
@@ -79,7 +80,7 @@ class Raise(NoDynamicAttributes):
         * TypeError: If the `exception` argument is not a class that inherits from `Exception`.
         """
         if isinstance(exception, type):
-            if not isinstance(exception(), Exception):
+            if not issubclass(exception, Exception):
                 raise cls.error(
                     f"Exception class or its derived class expected, '{exception.__qualname__}' received.",
                     TypeError,
@@ -105,5 +106,45 @@ class Raise(NoDynamicAttributes):
             )
         )
 
+    @classmethod
+    def lazy(
+        cls,
+        message: str,
+        exception: type[Exception] = Exception,
+        class_name: str = "",
+        *args: Any,
+    ) -> Exception:
+        """Create an exception without capturing the caller frame.
+
+        Intended for hot validation paths where errors are often caught and
+        discarded. No frame is taken, so the message carries the class name
+        prefix only, as `error()` does when called without `currentframe`.
+        `message % args` is interpolated here, so `args`, `str()` and
+        `repr()` of the returned exception all hold the final message.
+
+        ### Arguments:
+        * message: str - Error message, optionally a `%`-style template.
+        * exception: type[Exception] - The exception class to be instantiated. Defaults to `Exception`.
+        * class_name: str - The name of the class where the error occurred. Defaults to "".
+        * *args: Any - Values interpolated into `message`.
+
+        ### Returns:
+        Exception - An instance of the specified exception class.
+
+        ### Raises:
+        * TypeError: If the `exception` argument is not a class that inherits from `Exception`.
+        """
+        if not isinstance(exception, type) or not issubclass(exception, Exception):
+            raise cls.error(
+                "Exception class or its derived class expected.",
+                TypeError,
+                class_name,
+            )
+        if args:
+            message = message % args
+        return exception(
+            cls.message(f"[{exception.__qualname__}]: {message}", class_name)
+        )
+
 
 # #[EOF]#######################################################################
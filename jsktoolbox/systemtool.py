@@ -7,11 +7,8 @@ Purpose: Provide helpers for command-line parsing, environment inspection,
 and filesystem path validation used across the toolkit.
 """
 
-
 import os
 import sys
-import getopt
-import tempfile
 import subprocess
 import warnings
 
@@ -161,6 +158,8 @@ class CommandLineParser(BData):
         ### Returns:
         bool - True on successful parsing, False when getopt fails.
         """
+        import getopt
+
         short_mod = str(self.__config_args[_Keys.SHORT_OPTS]).replace(":", "")
         long_mod: List[str] = [
             item.replace("=", "") for item in self.__config_args[_Keys.LONG_OPTS]
@@ -326,6 +325,8 @@ class Env(BData):
         if tmp is None:
             tmp = os.getenv("TEMP")
             if tmp is None:
+                import tempfile
+
                 tmp = tempfile.gettempdir()
         self._set_data(key=_Keys.TMP, set_default_type=str, value=tmp)
 
@@ -106,5 +106,32 @@ class TestNoDynamicAttributes(unittest.TestCase):
         with self.assertRaisesRegex(AttributeError, "Cannot add new attribute 'abc'"):
             setattr(self.workclass, "abc", 1)
 
+    def test_declared_names_skip_getters(self) -> None:
+        """Test nr 3."""
+        from jsktoolbox.attribtool import NoDynamicAttributes, NoNewAttributes
+
+        calls = []
+        for base in (NoDynamicAttributes, NoNewAttributes):
+
+            class Example(base):  # type: ignore
+                """Example testing class."""
+
+                __slots__ = ("__variable",)
+
+                @property
+                def variable(self) -> Optional[Any]:
+                    calls.append(1)
+                    return self.__variable
+
+                @variable.setter
+                def variable(self, value) -> None:
+                    self.__variable = value
+
+            obj = Example()
+            obj.variable = 1
+            self.assertEqual(calls, [])
+            with self.assertRaises(AttributeError):
+                setattr(obj, "abc", 1)
+
 
 # #[EOF]#######################################################################
@@ -6,9 +6,16 @@ Created: 01.09.2023
 Purpose: for testing DData class
 """
 
+import pickle
 import unittest
-from typing import Dict, List, Optional, Any
-from jsktoolbox.basetool.data import BData
+from typing import Dict, List, Optional, Any, Tuple, Union
+from jsktoolbox.basetool.data import (
+    BData,
+    BDataValidationKeys,
+    _default_validation,
+    _type_checker,
+)
+from jsktoolbox.basetool.views import DictView, ListView
 
 
 class TestBData(unittest.TestCase):
@@ -397,5 +404,186 @@ class TestBData(unittest.TestCase):
                 key="test1", value=[{"x": "not an int"}], set_default_type=None
             )
 
+    def test_26_compiled_checkers(self) -> None:
+        """Test nr 26: type hints are compiled once and shared."""
+        self.assertIs(_type_checker(Optional[int]), _type_checker(Optional[int]))
+        other = BData()
+        self.obj._set_data(key="a", value=1, set_default_type=Optional[int])
+        other._set_data(key="a", value=None, set_default_type=Optional[int])
+        self.assertIs(
+            self.obj._BData__bdata_checks["a"],  # type: ignore
+            other._BData__bdata_checks["a"],  # type: ignore
+        )
+        checker = _type_checker(Union[int, Tuple[str, ...], None]).check
+        self.assertTrue(checker(None))
+        self.assertTrue(checker(("a", "b")))
+        self.assertFalse(checker(("a", 1)))
+        self.assertFalse(_type_checker(object).check(None))
+        clone = pickle.loads(pickle.dumps(self.obj))
+        with self.assertRaises(TypeError):
+            clone._set_data(key="a", value="x")
+
+    def test_27_checker_dropped_with_type(self) -> None:
+        """Test nr 27: deleting a key allows registering a new type."""
+        self.obj._set_data(key="a", value=1, set_default_type=int)
+        self.obj._delete_data("a")
+        self.obj._set_data(key="a", value="x", set_default_type=str)
+        with self.assertRaises(TypeError):
+            self.obj._set_data(key="a", value=1)
+        self.obj._data = None
+        self.obj._set_data(key="a", value=1)
+        self.assertEqual(self.obj._get_data("a"), 1)
+
+    def test_28_validation_policies(self) -> None:
+        """Test nr 28: shallow, sampled and disabled validation."""
+        bad = [1, 2, "x"]
+        self.obj._set_data(key="full", value=[1], set_default_type=List[int])
+        with self.assertRaises(TypeError):
+            self.obj._set_data(key="full", value=bad)
+        self.obj._set_data(
+            key="shallow",
+            value=bad,
+            set_default_type=List[int],
+            validation=BDataValidationKeys.SHALLOW,
+        )
+        with self.assertRaises(TypeError):
+            self.obj._set_data(key="shallow", value=(1,))
+        self.obj._set_data(
+            key="off",
+            value="not a list",
+            set_default_type=List[int],
+            validation=BDataValidationKeys.OFF,
+        )
+        with self.assertRaises(ValueError):
+            self.obj._set_data(key="x", value=1, set_default_type=int, validation="?")
+
+        class Sampled(BData):
+            _validation_ = BDataValidationKeys.SAMPLED
+            _validation_sample_ = 2
+
+        obj = Sampled()
+        obj._set_data(key="a", value=bad, set_default_type=List[int])
+        with self.assertRaises(TypeError):
+            obj._set_data(key="a", value=["x", 1, 2])
+        # switching the policy of a registered key
+        obj._set_data(key="a", value=[1], validation=BDataValidationKeys.FULL)
+        with self.assertRaises(TypeError):
+            obj._set_data(key="a", value=bad)
+
+    def test_29_replaced_container_is_not_cleared(self) -> None:
+        """Test nr 29: replaced values stay intact for other holders."""
+        items = [1, 2, 3]
+        self.obj._set_data(key="a", value=items, set_default_type=List[int])
+        self.obj._set_data(key="a", value=[4])
+        self.assertEqual(items, [1, 2, 3])
+        self.obj._clear_data("a")
+        self.assertIsNone(self.obj._get_data("a"))
+
+    def test_30_declared_fields(self) -> None:
+        """Test nr 30: slots-backed fields are typed and closed."""
+        import copy
+
+        obj = _Point(1, 2.5)
+        self.assertEqual(vars(obj), {})
+        self.assertEqual((obj.x, obj.y), (1, 2.5))
+        obj.y = None
+        self.assertIsNone(obj.y)
+        with self.assertRaises(TypeError):
+            obj.x = "1"
+        with self.assertRaises(AttributeError):
+            obj.z = 1
+        clone = pickle.loads(pickle.dumps(obj))
+        self.assertEqual((clone.x, clone.y), (1, None))
+        self.assertEqual(copy.deepcopy(obj).x, 1)
+
+    def test_31_declared_fields_with_data(self) -> None:
+        """Test nr 31: declared fields coexist with the BData storage."""
+        obj = _Point(1, None)
+        obj._set_data(key="a", value=[1], set_default_type=List[int])
+        with self.assertRaises(TypeError):
+            obj._set_data(key="a", value=["x"])
+        self.assertEqual(obj._get_data("a"), [1])
+
+        class _Point3(_Point):
+            __slots__ = {"z": int}
+
+        obj3 = _Point3(1, None)
+        obj3.z = 3
+        with self.assertRaises(TypeError):
+            obj3.x = "1"
+        with self.assertRaises(TypeError):
+            obj3.z = 3.0
+
+    def test_32_view_data(self) -> None:
+        """Test nr 32: views are read-only and share the stored data."""
+        cfg = {"hosts": ["a", "b"], "opts": {"port": 22}, "tags": {"x"}}
+        self.obj._set_data(key="cfg", value=cfg)
+        view = self.obj._view_data("cfg")
+        self.assertIsInstance(view, DictView)
+        self.assertIsInstance(view["hosts"], ListView)
+        self.assertEqual(view, cfg)
+        self.assertEqual(view["hosts"], ["a", "b"])
+        self.assertEqual(view["opts"]["port"], 22)
+        self.assertIsInstance(view["tags"], frozenset)
+        with self.assertRaises(TypeError):
+            view["hosts"] = []  # type: ignore
+        with self.assertRaises(TypeError):
+            view["hosts"][0] = "c"  # type: ignore
+        cfg["hosts"].append("c")
+        self.assertEqual(view["hosts"], ["a", "b", "c"])
+        self.assertIsNone(self.obj._view_data("missing"))
+
+    def test_33_view_thaw(self) -> None:
+        """Test nr 33: thawing returns an independent mutable copy."""
+        import copy
+
+        cfg = {"hosts": ["a", "b"]}
+        self.obj._set_data(key="cfg", value=cfg)
+        view = self.obj._view_data("cfg")
+        hosts = view["hosts"].thaw()
+        hosts.append("c")
+        whole = view.thaw()
+        whole["new"] = 1
+        self.assertEqual(cfg, {"hosts": ["a", "b"]})
+        clone = copy.deepcopy(view)
+        cfg["hosts"].append("d")
+        self.assertEqual(clone["hosts"], ["a", "b"])
+        self.assertEqual(pickle.loads(pickle.dumps(view)), cfg)
+
+    def test_34_default_validation(self) -> None:
+        """Test nr 34: FULL unless the environment opts out."""
+        from unittest import mock
+
+        with mock.patch.dict("os.environ", {}, clear=False) as env:
+            env.pop("JSKTOOLBOX_BDATA_VALIDATION", None)
+            self.assertEqual(_default_validation(), BDataValidationKeys.FULL)
+            env["JSKTOOLBOX_BDATA_VALIDATION"] = "sampled"
+            self.assertEqual(_default_validation(), BDataValidationKeys.SAMPLED)
+            env["JSKTOOLBOX_BDATA_VALIDATION"] = "bogus"
+            self.assertEqual(_default_validation(), BDataValidationKeys.FULL)
+
+    def test_35_mixes_with_builtin_layout(self) -> None:
+        """Test nr 35: BData combines with builtins having their own layout."""
+
+        class _Error(BData, Exception):
+            pass
+
+        err = _Error("boom")
+        err._set_data(key="code", value=5, set_default_type=int)
+        self.assertEqual(err._get_data("code"), 5)
+        self.assertEqual(err.args, ("boom",))
+        with self.assertRaises(_Error):
+            raise err
+
+
+class _Point(BData):
+    """Declared fields fixture."""
+
+    __slots__ = {"x": int, "y": Optional[float]}
+
+    def __init__(self, x: int, y: Optional[float]) -> None:
+        self.x = x
+        self.y = y
+
 
 # #[EOF]#######################################################################
@@ -6,6 +6,7 @@ Created: 4.10.2024, 12:43:33
 
 Purpose:
 """
+
 from types import NoneType
 import unittest
 from typing import Dict, List, Optional, Callable
@@ -97,5 +98,21 @@ class TestBLogFormatter(unittest.TestCase):
         self.formatter._forms_ = component
         self.assertIs(self.formatter._forms_[-1], component)
 
+    def test_04_compiled_forms_follow_appends(self) -> None:
+        """Test nr 04."""
+        formatter = BLogFormatter()
+        formatter._forms_ = "{message}"
+        self.assertEqual(formatter.format("first"), "first")
+        formatter._forms_ = " <{message!r:>6}> {{raw}}"
+        self.assertEqual(formatter.format("next"), "next <'next'> {raw}")
+        formatter._forms_ = "[{name}]: {message}"
+        self.assertEqual(formatter.format("evt", "svc"), "[svc]: evt")
+
+    def test_05_format_fallback_for_complex_fields(self) -> None:
+        """Test nr 05."""
+        formatter = BLogFormatter()
+        formatter._forms_ = "{message[0]}"
+        self.assertEqual(formatter.format("hello"), "h")
+
 
 # #[EOF]#######################################################################
@@ -6,12 +6,14 @@ Created: 7.10.2024, 11:36:25
 
 Purpose:
 """
-from time import sleep
+from time import monotonic, sleep
 import unittest
 from typing import Optional
 from threading import Thread, Event
 from queue import Queue, Empty
 
+from jsktoolbox.basetool.pool import ThPool, ThPoolStatsKeys
+from jsktoolbox.basetool.scheduler import ThScheduler
 from jsktoolbox.basetool.threads import ThBaseObject
 
 
@@ -76,5 +78,270 @@ class TestThBase(unittest.TestCase):
         except Exception as e:
             self.fail(f"{e}")
 
+    def test_02_interruptible_sleep(self) -> None:
+        """Test nr 02."""
+
+        class ThTest(ThBaseObject, Thread):
+            """Testing class."""
+
+            def __init__(self) -> None:
+                Thread.__init__(self, name=self._c_name)
+                self._stop_event = Event()
+                self.daemon = True
+                self.sleep_period = 30.0
+
+            def run(self) -> None:
+                """Run method."""
+                while not self.stopped:
+                    self._sleep()
+
+        th = ThTest()
+        th.start()
+        sleep(0.05)
+        start: float = monotonic()
+        th.stop()
+        th.join(timeout=5)
+        self.assertFalse(th.is_alive())
+        self.assertLess(monotonic() - start, 1.0)
+
+    def test_03_wait_for_work(self) -> None:
+        """Test nr 03."""
+
+        class ThTest(ThBaseObject, Thread):
+            """Testing class."""
+
+            def __init__(self, qcom: Queue) -> None:
+                Thread.__init__(self, name=self._c_name)
+                self._stop_event = Event()
+                self._work_event = Event()
+                self.daemon = True
+                self._set_data(key="queue", value=qcom, set_default_type=Queue)
+                self._set_data(key="done", value=[], set_default_type=list)
+
+            def run(self) -> None:
+                """Run method."""
+                qcom: Queue = self._get_data(key="queue")  # type: ignore
+                while True:
+                    try:
+                        self.done.append(qcom.get_nowait())
+                    except Empty:
+                        if self.stopped:
+                            break
+                        self._wait_for_work()
+
+            @property
+            def done(self) -> list:
+                return self._get_data(key="done")  # type: ignore
+
+        qcom = Queue()
+        th = ThTest(qcom)
+        th.start()
+        for item in range(3):
+            qcom.put(item)
+            th.notify_work()
+        th.stop()
+        th.join(timeout=5)
+        self.assertFalse(th.is_alive())
+        self.assertEqual(th.done, [0, 1, 2])
+
+
+class TestThPool(unittest.TestCase):
+    """Tests for ThPool class."""
+
+    def test_01_submit_and_map(self) -> None:
+        """Test nr 01."""
+        with ThPool(workers=2) as pool:
+            self.assertEqual(pool.submit(pow, 2, 10).result(timeout=5), 1024)
+            self.assertEqual(
+                list(pool.map(lambda x: x * x, range(10), timeout=5)),
+                [x * x for x in range(10)],
+            )
+            future = pool.submit(int, "nan")
+            with self.assertRaises(ValueError):
+                future.result(timeout=5)
+            stats = pool.stats
+        self.assertEqual(stats[ThPoolStatsKeys.COMPLETED], 11)
+        self.assertEqual(stats[ThPoolStatsKeys.FAILED], 1)
+        self.assertEqual(len(stats[ThPoolStatsKeys.WORKERS]), 2)
+        self.assertEqual(pool.stats[ThPoolStatsKeys.ALIVE], 0)
+
+    def test_02_bounded_concurrency(self) -> None:
+        """Test nr 02."""
+        barrier = Event()
+        pool = ThPool(workers=3)
+        futures = [pool.submit(barrier.wait, 5) for _ in range(5)]
+        sleep(0.1)
+        self.assertEqual(
+            sum(1 for f in futures if f.running()),
+            3,
+        )
+        self.assertEqual(pool.pending, 2)
+        barrier.set()
+        pool.stop()
+        self.assertTrue(all(f.result() for f in futures))
+
+    def test_03_stop(self) -> None:
+        """Test nr 03."""
+        barrier = Event()
+        pool = ThPool(workers=1)
+        running = pool.submit(barrier.wait, 5)
+        queued = [pool.submit(int) for _ in range(3)]
+        sleep(0.05)
+        barrier.set()
+        pool.stop(cancel_pending=True)
+        self.assertTrue(running.result())
+        self.assertTrue(all(f.cancelled() for f in queued))
+        self.assertTrue(pool.stopped)
+        with self.assertRaises(RuntimeError):
+            pool.submit(int)
+        with self.assertRaises(ValueError):
+            ThPool(workers=0)
+
+    def test_04_concurrent_lazy_start(self) -> None:
+        """Test nr 04."""
+        for _ in range(20):
+            pool = ThPool(workers=2)
+            gate = Event()
+
+            def submit() -> None:
+                gate.wait(5)
+                pool.submit(int)
+
+            threads = [Thread(target=submit) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            gate.set()
+            for thread in threads:
+                thread.join(5)
+            self.assertEqual(len(pool.workers), 2)
+            pool.stop()
+
+    def test_05_stop_with_full_queue(self) -> None:
+        """Test nr 05."""
+        barrier = Event()
+        pool = ThPool(workers=1, maxsize=1)
+        running = pool.submit(barrier.wait, 5)
+        sleep(0.05)
+        pool.submit(int)
+        errors: Queue = Queue()
+
+        def blocked_submit() -> None:
+            try:
+                pool.submit(int)
+            except RuntimeError as ex:
+                errors.put(ex)
+
+        thread = Thread(target=blocked_submit)
+        thread.start()
+        sleep(0.1)
+        start = monotonic()
+        pool.stop(wait=False, cancel_pending=True)
+        self.assertLess(monotonic() - start, 1.0)
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertIsInstance(errors.get_nowait(), RuntimeError)
+        barrier.set()
+        self.assertTrue(running.result(timeout=5))
+
+
+    def test_06_stop_from_task_with_full_queue(self) -> None:
+        """Test nr 06."""
+        pool = ThPool(workers=1, maxsize=1)
+        stopped = Event()
+        release = Event()
+
+        def stopper() -> None:
+            release.wait(5)
+            pool.stop()
+            stopped.set()
+
+        pool.submit(stopper)
+        sleep(0.05)
+        pending = pool.submit(int, "7")
+        release.set()
+        self.assertTrue(stopped.wait(2))
+        self.assertEqual(pending.result(timeout=2), 7)
+        pool.workers[0].join(2)
+        self.assertFalse(pool.workers[0].is_alive())
+
+
+class TestThScheduler(unittest.TestCase):
+    """Tests for ThScheduler class."""
+
+    def test_01_periodic_and_one_shot(self) -> None:
+        """Test nr 01."""
+        calls = []
+        sch = ThScheduler()
+        sch.start()
+        periodic = sch.schedule(calls.append, interval=0.02, args=("tick",))
+        once = sch.schedule(calls.append, delay=0.05, args=("once",))
+        cancelled = sch.schedule(calls.append, delay=0.05, args=("never",))
+        cancelled.cancel()
+        sleep(0.2)
+        sch.stop()
+        sch.join(timeout=5)
+        self.assertFalse(sch.is_alive())
+        self.assertEqual(calls.count("once"), 1)
+        self.assertNotIn("never", calls)
+        self.assertGreaterEqual(periodic.runs, 3)
+        self.assertEqual(once.runs, 1)
+        self.assertEqual(sch.jobs, [periodic])
+        with self.assertRaises(ValueError):
+            sch.schedule(int, interval=0)
+
+    def test_02_coalesce_missed_runs(self) -> None:
+        """Test nr 02."""
+        sch = ThScheduler()
+        sch.start()
+        job = sch.schedule(sleep, interval=0.01, args=(0.05,))
+        sleep(0.2)
+        sch.stop()
+        sch.join(timeout=5)
+        self.assertGreater(job.missed, 0)
+        self.assertLessEqual(job.runs, 5)
+
+    def test_03_dispatch_to_pool(self) -> None:
+        """Test nr 03."""
+        with ThPool(workers=2) as pool:
+            sch = ThScheduler(pool=pool)
+            sch.start()
+            job = sch.schedule(lambda: 1 / 0, interval=0.02)
+            sleep(0.1)
+            sch.stop()
+            sch.join(timeout=5)
+        self.assertGreater(job.runs, 0)
+        self.assertEqual(job.failed, job.runs)
+        self.assertIsInstance(job.last_error, ZeroDivisionError)
+
+    def test_04_stopped_pool(self) -> None:
+        """Test nr 04."""
+        pool = ThPool(workers=1)
+        pool.stop()
+        sch = ThScheduler(pool=pool)
+        sch.start()
+        job = sch.schedule(int, interval=0.02)
+        sch.join(timeout=5)
+        self.assertFalse(sch.is_alive())
+        self.assertTrue(sch.stopped)
+        self.assertEqual((job.runs, job.failed), (0, 1))
+        self.assertIsInstance(job.last_error, RuntimeError)
+
+    def test_05_inline_failure_is_recorded(self) -> None:
+        """Test nr 05."""
+        from contextlib import redirect_stderr
+        from io import StringIO
+
+        stream = StringIO()
+        sch = ThScheduler()
+        job = sch.schedule(lambda: 1 / 0)
+        with redirect_stderr(stream):
+            sch.start()
+            sleep(0.1)
+            sch.stop()
+            sch.join(timeout=5)
+        self.assertEqual((job.runs, job.failed), (1, 1))
+        self.assertIsInstance(job.last_error, ZeroDivisionError)
+        self.assertEqual(stream.getvalue(), "")
+
 
 # #[EOF]#######################################################################
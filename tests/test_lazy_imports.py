@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+test_lazy_imports.py
+Author : Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: Verify that heavy and optional dependencies are loaded on first use
+         and that lazy package exports resolve.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+from typing import List
+
+
+def _imported(code: str, modules: List[str]) -> List[str]:
+    """Run code in a fresh interpreter and return which modules got imported."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (os.getcwd(), env.get("PYTHONPATH")))
+    )
+    probe = f"{code}\nimport sys\nprint(' '.join(m for m in {modules!r} if m in sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return out.stdout.split()
+
+
+class TestLazyImports(unittest.TestCase):
+    """Import-time behaviour of jsktoolbox modules."""
+
+    def test_01_heavy_dependencies_deferred(self) -> None:
+        """Importing modules does not load their optional dependencies."""
+        loaded = _imported(
+            "import jsktoolbox.nettool, jsktoolbox.systemtool, "
+            "jsktoolbox.datetool, jsktoolbox.edmctool.math, "
+            "jsktoolbox.edmctool.edsm, jsktoolbox.logstool.engines, "
+            "jsktoolbox.logstool.queue",
+            [
+                "distutils",
+                "numpy",
+                "scipy",
+                "requests",
+                "multiprocessing",
+                "ssl",
+                "gzip",
+                "getopt",
+                "tempfile",
+                "calendar",
+                "venv",
+            ],
+        )
+        self.assertEqual(loaded, [])
+
+    def test_02_package_import_loads_no_submodules(self) -> None:
+        """Packages with lazy exports import nothing until accessed."""
+        loaded = _imported(
+            "import jsktoolbox.edmctool, jsktoolbox.libs.interfaces",
+            [
+                "jsktoolbox.edmctool.math",
+                "jsktoolbox.edmctool.edsm",
+                "jsktoolbox.libs.interfaces.comparators",
+                "jsktoolbox.libs.interfaces.logger_engine",
+            ],
+        )
+        self.assertEqual(loaded, [])
+
+    def test_03_exports_resolve(self) -> None:
+        """Every name listed in `__all__` resolves to an object."""
+        for package in ("jsktoolbox.edmctool", "jsktoolbox.libs.interfaces"):
+            with self.subTest(package=package):
+                loaded = _imported(
+                    f"import {package} as p\n"
+                    "bad = [n for n in p.__all__ if getattr(p, n).__name__ != n]\n"
+                    "assert not bad, bad",
+                    [package],
+                )
+                self.assertEqual(loaded, [package])
+
+
+# #[EOF]#######################################################################
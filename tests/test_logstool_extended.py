@@ -1,8 +1,15 @@
+import gzip
 import io
+import json
+import lzma
+import multiprocessing
+import os
+import socket
 import sys
 import threading
 import time
 from pathlib import Path
+from typing import List
 from unittest.mock import patch
 
 import pytest
@@ -16,17 +23,27 @@ from jsktoolbox.logstool.engines import (
     LoggerEngineStderr,
     LoggerEngineStdout,
     LoggerEngineSyslog,
+    LoggerEngineSyslogSocket,
+    ThLogArchiver,
 )
 from jsktoolbox.libs.interfaces.logger_engine import ILoggerEngine
 from jsktoolbox.logstool.formatters import (
     LogFormatterDateTime,
+    LogFormatterJson,
     LogFormatterNull,
     LogFormatterTime,
     LogFormatterTimestamp,
 )
-from jsktoolbox.logstool.keys import LogsLevelKeys, SysLogKeys
+from jsktoolbox.logstool.keys import (
+    LogsLevelKeys,
+    LogsQueuePolicyKeys,
+    LogsRotationKeys,
+    SysLogKeys,
+    SysLogSocketKeys,
+)
 from jsktoolbox.logstool.logs import LoggerClient, LoggerEngine, ThLoggerProcessor
-from jsktoolbox.logstool.queue import LoggerQueue
+from jsktoolbox.logstool.queue import LoggerProcessQueue, LoggerQueue
+from jsktoolbox.logstool.records import LogRecord
 
 
 class DummyEngine(ILoggerEngine, BLoggerEngine, BData):
@@ -63,6 +80,154 @@ def test_logger_queue_roundtrip() -> None:
     assert queue.get() is None
 
 
+def test_logger_queue_wait_wakes_on_put() -> None:
+    queue = LoggerQueue()
+    assert len(queue) == 0
+    assert queue.wait(0.01) is False
+
+    timer = threading.Timer(0.05, queue.put, args=("late", LogsLevelKeys.INFO))
+    start = time.monotonic()
+    timer.start()
+    try:
+        assert queue.wait(5.0) is True
+    finally:
+        timer.join()
+    assert time.monotonic() - start < 2.0
+    assert len(queue) == 1
+    assert queue.get() == (LogsLevelKeys.INFO, "late")
+
+
+def test_logger_queue_wakeup_releases_waiter() -> None:
+    queue = LoggerQueue()
+    queue.wakeup()
+    start = time.monotonic()
+    assert queue.wait(5.0) is False
+    assert time.monotonic() - start < 2.0
+
+
+def test_logger_queue_invalid_bounds_raise() -> None:
+    with pytest.raises(ValueError):
+        LoggerQueue(maxsize=0)
+    with pytest.raises(KeyError):
+        LoggerQueue(maxsize=1, policy="UNKNOWN")
+    with pytest.raises(KeyError):
+        LoggerQueue(maxsize=1, keep_levels=("UNKNOWN",))
+
+
+def test_logger_queue_drop_newest() -> None:
+    queue = LoggerQueue(maxsize=2, policy=LogsQueuePolicyKeys.DROP_NEWEST)
+    for text in ("a", "b", "c"):
+        queue.put(text, LogsLevelKeys.INFO)
+    assert len(queue) == 2
+    assert queue.get() == (LogsLevelKeys.INFO, "a")
+    assert queue.get() == (LogsLevelKeys.INFO, "b")
+    assert queue.dropped[LogsQueuePolicyKeys.DROP_NEWEST] == 1
+    assert queue.dropped_levels[LogsLevelKeys.INFO] == 1
+
+
+def test_logger_queue_drop_oldest() -> None:
+    queue = LoggerQueue(maxsize=2, policy=LogsQueuePolicyKeys.DROP_OLDEST)
+    for text in ("a", "b", "c"):
+        queue.put(text, LogsLevelKeys.INFO)
+    assert queue.get() == (LogsLevelKeys.INFO, "b")
+    assert queue.get() == (LogsLevelKeys.INFO, "c")
+    assert queue.dropped[LogsQueuePolicyKeys.DROP_OLDEST] == 1
+
+
+def test_logger_queue_drop_by_level() -> None:
+    queue = LoggerQueue(maxsize=2, policy=LogsQueuePolicyKeys.DROP_BY_LEVEL)
+    queue.put("debug", LogsLevelKeys.DEBUG)
+    queue.put("error1", LogsLevelKeys.ERROR)
+    # low severity entry is shed when full
+    queue.put("info", LogsLevelKeys.INFO)
+    # high severity entry evicts the oldest sheddable one
+    queue.put("error2", LogsLevelKeys.ERROR)
+    # only kept levels are queued, the oldest one is evicted
+    queue.put("critical", LogsLevelKeys.CRITICAL)
+    assert queue.get() == (LogsLevelKeys.ERROR, "error2")
+    assert queue.get() == (LogsLevelKeys.CRITICAL, "critical")
+    assert queue.dropped[LogsQueuePolicyKeys.DROP_BY_LEVEL] == 3
+    dropped = queue.dropped_levels
+    assert dropped[LogsLevelKeys.DEBUG] == 1
+    assert dropped[LogsLevelKeys.INFO] == 1
+    assert dropped[LogsLevelKeys.ERROR] == 1
+
+
+def test_logger_queue_block_policy_timeout() -> None:
+    queue = LoggerQueue(
+        maxsize=1, policy=LogsQueuePolicyKeys.BLOCK, block_timeout=0.05
+    )
+    queue.put("first", LogsLevelKeys.INFO)
+    # times out and drops the incoming entry
+    queue.put("second", LogsLevelKeys.INFO)
+    assert len(queue) == 1
+    assert queue.get() == (LogsLevelKeys.INFO, "first")
+    assert queue.dropped[LogsQueuePolicyKeys.BLOCK] == 1
+
+
+def test_logger_queue_block_policy_drops_on_consumer_thread() -> None:
+    queue = LoggerQueue(maxsize=1, policy=LogsQueuePolicyKeys.BLOCK)
+    queue.consumer = threading.get_ident()
+    queue.put("first", LogsLevelKeys.INFO)
+    # the consumer logging into its own full queue must not wait forever
+    queue.put("second", LogsLevelKeys.ERROR)
+    assert queue.get() == (LogsLevelKeys.INFO, "first")
+    assert queue.dropped[LogsQueuePolicyKeys.BLOCK] == 1
+    assert queue.dropped_levels[LogsLevelKeys.ERROR] == 1
+
+
+def test_logger_queue_block_policy_manual_drain_still_blocks() -> None:
+    queue = LoggerQueue(maxsize=1, policy=LogsQueuePolicyKeys.BLOCK)
+    # reading the queue by hand does not make this thread the consumer
+    assert queue.get() is None
+    queue.put("first", LogsLevelKeys.INFO)
+    timer = threading.Timer(0.05, queue.get)
+    timer.start()
+    queue.put("second", LogsLevelKeys.INFO)
+    timer.join()
+    assert queue.consumer is None
+    assert queue.get() == (LogsLevelKeys.INFO, "second")
+    assert queue.dropped[LogsQueuePolicyKeys.BLOCK] == 0
+
+
+def test_th_logger_processor_registers_consumer() -> None:
+    engine = LoggerEngine(maxsize=1, policy=LogsQueuePolicyKeys.BLOCK)
+    processor = ThLoggerProcessor(debug=False)
+    processor.logger_engine = engine
+    processor.logger_client = LoggerClient(engine.logs_queue, name="client")
+    processor.sleep_period = 0.05
+    processor.start()
+    try:
+        deadline = time.monotonic() + 2
+        while engine.logs_queue.consumer is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert engine.logs_queue.consumer == processor.ident
+    finally:
+        processor.stop()
+        processor.join(2)
+    assert engine.logs_queue.consumer is None
+
+
+def test_logger_queue_block_policy_waits_for_consumer() -> None:
+    queue = LoggerQueue(maxsize=1, policy=LogsQueuePolicyKeys.BLOCK)
+    queue.put("first", LogsLevelKeys.INFO)
+    timer = threading.Timer(0.05, queue.get)
+    timer.start()
+    try:
+        queue.put("second", LogsLevelKeys.INFO)
+    finally:
+        timer.join()
+    assert queue.get() == (LogsLevelKeys.INFO, "second")
+    assert queue.dropped[LogsQueuePolicyKeys.BLOCK] == 0
+
+
+def test_logger_engine_bounded_queue() -> None:
+    engine = LoggerEngine(maxsize=10, policy=LogsQueuePolicyKeys.DROP_OLDEST)
+    assert engine.logs_queue is not None
+    assert engine.logs_queue.maxsize == 10
+    assert engine.logs_queue.policy == LogsQueuePolicyKeys.DROP_OLDEST
+
+
 @pytest.mark.parametrize(
     "formatter_cls, expected",
     [
@@ -113,6 +278,54 @@ def test_log_formatter_timestamp(monkeypatch: pytest.MonkeyPatch) -> None:
     assert formatter.format("payload").startswith("1700000000")
 
 
+def test_log_formatter_timestamp_prefixes_int_timestamp(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Timestamp.now() returns an int; the prefix used to be dropped for it
+    monkeypatch.setattr(
+        "jsktoolbox.logstool.formatters.Timestamp.now", lambda: 1700000000
+    )
+    formatter = LogFormatterTimestamp()
+    assert formatter.format("payload") == "1700000000 payload"
+    assert formatter.format("payload", "app") == "1700000000 [app]: payload"
+
+
+def test_log_formatter_caches_time_per_second(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[int] = []
+
+    class FakeDatetime:
+        @staticmethod
+        def now():
+            calls.append(1)
+
+            class Fake:
+                def strftime(self, fmt: str) -> str:
+                    return f"T{len(calls)}"
+
+            return Fake()
+
+    clock = [1000.2]
+    monkeypatch.setattr("jsktoolbox.logstool.formatters.datetime", FakeDatetime)
+    monkeypatch.setattr("jsktoolbox.logstool.formatters.time.time", lambda: clock[0])
+    formatter = LogFormatterDateTime()
+    assert formatter.format("a") == "T1 a"
+    clock[0] = 1000.9
+    assert formatter.format("b") == "T1 b"
+    clock[0] = 1001.0
+    assert formatter.format("c", "app") == "T2 [app]: c"
+    assert len(calls) == 2
+
+
+def test_log_formatter_recompiles_replaced_form() -> None:
+    formatter = LogFormatterNull()
+    assert formatter.format("a", "app") == "[app]: a"
+    formatter._forms_[1] = "<{name}> {message!r:>5}"
+    assert formatter.format("a", "app") == "<app>   'a'"
+    assert formatter.format("a") == "a"
+
+
 def test_logger_engine_stdout_writes() -> None:
     engine = LoggerEngineStdout(name="app", buffered=False)
     buf = io.StringIO()
@@ -158,6 +371,179 @@ def test_logger_engine_file_rotation(tmp_path: Path) -> None:
     assert (tmp_path / "app.log.1").read_text().strip() == "[app]: first entry"
 
 
+def test_logger_engine_file_rotation_counts_bytes(tmp_path: Path) -> None:
+    engine = LoggerEngineFile(name="app", formatter=LogFormatterNull())
+    engine.logdir = str(tmp_path)
+    engine.logfile = "app.log"
+    engine.rotation_max_bytes = 50
+    engine.rotation_backup_count = 2
+    message = "\u0105" * 15  # 23 characters, 38 bytes per line
+
+    engine.send(message)
+    engine.send(message)
+    assert (tmp_path / "app.log.0").read_text(encoding="utf-8") == f"[app]: {message}\n"
+    assert (tmp_path / "app.log").stat().st_size == 38
+    engine.close()
+
+    reopened = LoggerEngineFile(name="app", formatter=LogFormatterNull())
+    reopened.logdir = str(tmp_path)
+    reopened.logfile = "app.log"
+    reopened.rotation_max_bytes = 50
+    reopened.rotation_backup_count = 2
+    reopened.send("ascii")
+    assert (tmp_path / "app.log").read_text(encoding="utf-8") == "[app]: ascii\n"
+    assert (tmp_path / "app.log.0").stat().st_size == 38
+    assert (tmp_path / "app.log.1").stat().st_size == 38
+    reopened.close()
+
+
+def test_logger_engine_file_keeps_handle_open(tmp_path: Path) -> None:
+    engine = LoggerEngineFile(name="app", formatter=LogFormatterNull())
+    engine.logdir = str(tmp_path)
+    engine.logfile = "app.log"
+    with patch("builtins.open", wraps=open) as opened:
+        engine.send("one")
+        engine.send("two")
+        engine.send_many(["three", "four"])
+    assert opened.call_count == 1
+    assert (tmp_path / "app.log").read_text().splitlines() == [
+        "[app]: one",
+        "[app]: two",
+        "[app]: three",
+        "[app]: four",
+    ]
+    engine.close()
+
+
+def test_logger_engine_file_buffered_flush_threshold(tmp_path: Path) -> None:
+    engine = LoggerEngineFile(name="app", formatter=LogFormatterNull(), buffered=True)
+    engine.logdir = str(tmp_path)
+    engine.logfile = "app.log"
+    engine.flush_interval = 3600
+    engine.flush_bytes = 20
+    engine.send("one")
+    assert (tmp_path / "app.log").read_text() == ""
+    engine.send("two")
+    assert (tmp_path / "app.log").read_text() == "[app]: one\n[app]: two\n"
+    engine.send("three")
+    engine.flush()
+    assert (tmp_path / "app.log").read_text().endswith("[app]: three\n")
+    with pytest.raises(ValueError):
+        engine.flush_bytes = 0
+    with pytest.raises(ValueError):
+        engine.flush_interval = -1
+    engine.close()
+
+
+def test_logger_engine_file_reopens_after_external_move(tmp_path: Path) -> None:
+    engine = LoggerEngineFile(name="app", formatter=LogFormatterNull())
+    engine.logdir = str(tmp_path)
+    engine.logfile = "app.log"
+    engine.flush_interval = 0
+    engine.send("before")
+    (tmp_path / "app.log").rename(tmp_path / "app.log.moved")
+    engine.send("after")
+    assert (tmp_path / "app.log.moved").read_text() == "[app]: before\n"
+    assert (tmp_path / "app.log").read_text() == "[app]: after\n"
+    engine.close()
+
+
+def test_logger_engine_file_send_many_rotation(tmp_path: Path) -> None:
+    engine = LoggerEngineFile(name="app", formatter=LogFormatterNull())
+    engine.logdir = str(tmp_path)
+    engine.logfile = "app.log"
+    engine.rotation_max_bytes = 30
+    engine.rotation_backup_count = 2
+
+    engine.send_many(["first entry", "second entry", "third entry"])
+    assert (tmp_path / "app.log").read_text().strip() == "[app]: third entry"
+    assert (tmp_path / "app.log.0").read_text().strip() == "[app]: second entry"
+    assert (tmp_path / "app.log.1").read_text().strip() == "[app]: first entry"
+
+
+def test_logger_engine_stdout_send_many_single_write() -> None:
+    engine = LoggerEngineStdout(name="app", formatter=LogFormatterNull())
+    buf = io.StringIO()
+    with patch.object(sys, "stdout", buf):
+        with patch.object(buf, "write", wraps=buf.write) as write:
+            engine.send_many(["one", "two\n"])
+    assert write.call_count == 1
+    assert buf.getvalue() == "[app]: one\n[app]: two\n"
+
+
+def test_logger_engine_file_time_rotation(tmp_path: Path) -> None:
+    log_path = tmp_path / "app.log"
+    log_path.write_text("[app]: old entry\n")
+    two_days_ago = time.time() - 2 * 86400
+    os.utime(log_path, (two_days_ago, two_days_ago))
+
+    engine = LoggerEngineFile(name="app", formatter=LogFormatterNull())
+    engine.logdir = str(tmp_path)
+    engine.logfile = "app.log"
+    engine.rotation_backup_count = 2
+    engine.rotation_when = LogsRotationKeys.MIDNIGHT
+
+    engine.send("new entry")
+    engine.send("next entry")
+    assert (tmp_path / "app.log.0").read_text() == "[app]: old entry\n"
+    assert log_path.read_text() == "[app]: new entry\n[app]: next entry\n"
+    with pytest.raises(KeyError):
+        engine.rotation_when = "WEEKLY"
+    engine.close()
+
+
+@pytest.mark.parametrize(
+    "compression, opener",
+    [(LogsRotationKeys.GZIP, gzip.open), (LogsRotationKeys.XZ, lzma.open)],
+)
+def test_logger_engine_file_compressed_rotation(
+    tmp_path: Path, compression, opener
+) -> None:
+    engine = LoggerEngineFile(name="app", formatter=LogFormatterNull())
+    engine.logdir = str(tmp_path)
+    engine.logfile = "app.log"
+    engine.rotation_max_bytes = 30
+    engine.rotation_backup_count = 2
+    engine.rotation_compression = compression
+
+    engine.send_many(["first entry", "second entry", "third entry"])
+    engine.wait_for_archives()
+
+    suffix = f".{compression}"
+    assert (tmp_path / "app.log").read_text() == "[app]: third entry\n"
+    with opener(tmp_path / f"app.log.0{suffix}", "rt") as archive:
+        assert archive.read() == "[app]: second entry\n"
+    with opener(tmp_path / f"app.log.1{suffix}", "rt") as archive:
+        assert archive.read() == "[app]: first entry\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "app.log",
+        f"app.log.0{suffix}",
+        f"app.log.1{suffix}",
+    ]
+    with pytest.raises(KeyError):
+        engine.rotation_compression = "zip"
+    engine.close()
+
+
+def test_log_archiver_records_failures(
+    tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    archiver = ThLogArchiver()
+    archiver.start()
+    archiver.archive(
+        str(tmp_path / "missing"),
+        str(tmp_path / "app.log"),
+        2,
+        LogsRotationKeys.GZIP,
+    )
+    archiver.join_jobs()
+    archiver.stop()
+    archiver.join(2)
+    assert archiver.failed == 1
+    assert isinstance(archiver.last_error, FileNotFoundError)
+    assert capsys.readouterr().err == ""
+
+
 def test_logger_engine_file_logfile_directory_conflict(tmp_path: Path) -> None:
     engine = LoggerEngineFile(name="app", formatter=LogFormatterNull())
     subdir = tmp_path / "existing"
@@ -222,6 +608,89 @@ def test_logger_engine_send_custom_engine() -> None:
     assert dummy.messages == ["hello"]
 
 
+def test_logger_engine_send_uses_send_many() -> None:
+    class BatchEngine(DummyEngine):
+        _BATCH_KEY = "__batches__"
+
+        def send_many(self, messages: list[str]) -> None:
+            batches = self._get_data(self._BATCH_KEY, default_value=[])
+            batches.append(list(messages))
+            self._set_data(self._BATCH_KEY, batches)
+            super().send_many(messages)
+
+    engine = LoggerEngine()
+    batch = BatchEngine()
+    dummy = DummyEngine()
+    engine.add_engine(LogsLevelKeys.INFO, batch)
+    engine.add_engine(LogsLevelKeys.ERROR, dummy)
+    assert engine.logs_queue is not None
+    engine.logs_queue.put("a", LogsLevelKeys.INFO)
+    engine.logs_queue.put("b", LogsLevelKeys.ERROR)
+    engine.logs_queue.put("c", LogsLevelKeys.INFO)
+    engine.logs_queue.put("d", LogsLevelKeys.DEBUG)
+    engine.send()
+    assert batch._get_data(BatchEngine._BATCH_KEY) == [["a", "c"]]
+    assert batch.messages == ["a", "c"]
+    assert dummy.messages == ["b"]
+    assert len(engine.logs_queue) == 0
+
+
+def test_logger_queue_get_many() -> None:
+    queue = LoggerQueue()
+    for text in ("a", "b", "c"):
+        queue.put(text, LogsLevelKeys.INFO)
+    assert queue.get_many(2) == [
+        (LogsLevelKeys.INFO, "a"),
+        (LogsLevelKeys.INFO, "b"),
+    ]
+    assert queue.get_many() == [(LogsLevelKeys.INFO, "c")]
+    assert queue.get_many() == []
+
+
+def test_logger_client_skips_disabled_levels() -> None:
+    engine = LoggerEngine()
+    dummy = DummyEngine()
+    engine.add_engine(LogsLevelKeys.INFO, dummy)
+    assert engine.enabled_levels == frozenset({LogsLevelKeys.INFO})
+    assert engine.logs_queue is not None
+    assert engine.logs_queue.enabled_levels == engine.enabled_levels
+    client = LoggerClient(engine.logs_queue, name="app")
+
+    calls: list[int] = []
+
+    def expensive() -> str:
+        calls.append(1)
+        return "computed"
+
+    client.message(expensive, LogsLevelKeys.DEBUG)
+    client.message("%s-%d", LogsLevelKeys.DEBUG, "skipped", 1)
+    client.message_debug = "skipped"
+    assert len(engine.logs_queue) == 0
+    assert calls == []
+    assert client.is_enabled(LogsLevelKeys.DEBUG) is False
+    assert client.is_enabled(LogsLevelKeys.INFO) is True
+
+    client.message(expensive, LogsLevelKeys.INFO)
+    client.message("%s-%d", LogsLevelKeys.INFO, "value", 2)
+    engine.send()
+    assert calls == [1]
+    assert dummy.messages == ["[app] computed", "[app] value-2"]
+
+    with pytest.raises(KeyError):
+        client.message("bad level", "UNKNOWN")
+    with pytest.raises(TypeError):
+        client.message("bad level", 1)  # type: ignore[arg-type]
+
+
+def test_logger_engine_publishes_levels_to_new_queue() -> None:
+    engine = LoggerEngine()
+    engine.add_engine(LogsLevelKeys.ERROR, DummyEngine())
+    queue = LoggerQueue()
+    assert queue.enabled_levels == frozenset(LogsLevelKeys.keys)
+    engine.logs_queue = queue
+    assert queue.enabled_levels == frozenset({LogsLevelKeys.ERROR})
+
+
 def test_th_logger_processor_lifecycle() -> None:
     engine = LoggerEngine()
     dummy = DummyEngine()
@@ -245,8 +714,382 @@ def test_th_logger_processor_lifecycle() -> None:
         processor.join(timeout=2)
 
 
+def test_th_logger_processor_stops_without_waiting_sleep_period() -> None:
+    engine = LoggerEngine()
+    dummy = DummyEngine()
+    engine.add_engine(LogsLevelKeys.INFO, dummy)
+    client = LoggerClient(engine.logs_queue, name="client")
+
+    processor = ThLoggerProcessor(debug=False)
+    processor.logger_engine = engine
+    processor.logger_client = client
+    processor.sleep_period = 30.0
+
+    processor.start()
+    client.message("ping")
+    timeout = time.time() + 2
+    while not dummy.messages and time.time() < timeout:
+        time.sleep(0.01)
+    assert dummy.messages == ["[client] ping"]
+
+    start = time.monotonic()
+    processor.stop()
+    processor.join(timeout=5)
+    assert not processor.is_alive()
+    assert time.monotonic() - start < 2.0
+
+
+def test_th_logger_processor_flushes_idle_file_engine(tmp_path: Path) -> None:
+    engine = LoggerEngine()
+    file_engine = LoggerEngineFile(
+        name="app", formatter=LogFormatterNull(), buffered=True
+    )
+    file_engine.logdir = str(tmp_path)
+    file_engine.logfile = "app.log"
+    file_engine.flush_interval = 0.1
+    file_engine.flush_bytes = 1 << 20
+    engine.add_engine(LogsLevelKeys.INFO, file_engine)
+    client = LoggerClient(engine.logs_queue, name="client")
+
+    processor = ThLoggerProcessor(debug=False)
+    processor.logger_engine = engine
+    processor.logger_client = client
+    processor.sleep_period = 0.05
+
+    processor.start()
+    try:
+        client.message("idle")
+        log = tmp_path / "app.log"
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline:
+            if log.exists() and log.read_text():
+                break
+            time.sleep(0.02)
+        assert log.read_text() == "[app]: [client] idle\n"
+        file_engine.flush_interval = 3600
+        client.message("last")
+    finally:
+        processor.stop()
+        processor.join(timeout=2)
+    assert log.read_text().endswith("[app]: [client] last\n")
+
+
+def _log_from_child(client: LoggerClient, index: int) -> None:
+    client.message(f"child {index}", LogsLevelKeys.WARNING)
+
+
+def test_logger_process_queue_collects_child_records() -> None:
+    ctx = multiprocessing.get_context("spawn")
+    engine = LoggerEngine()
+    dummy = DummyEngine()
+    engine.add_engine(LogsLevelKeys.WARNING, dummy)
+    engine.logs_queue = LoggerProcessQueue(ctx)
+    client = LoggerClient(engine.logs_queue, name="worker")
+
+    processes = [
+        ctx.Process(target=_log_from_child, args=(client, index)) for index in range(2)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=30)
+        assert process.exitcode == 0
+
+    timeout = time.time() + 10
+    while len(dummy.messages) < 2 and time.time() < timeout:
+        engine.logs_queue.wait(0.5)
+        engine.send()
+    assert sorted(dummy.messages) == ["[worker] child 0", "[worker] child 1"]
+
+
+def test_logger_process_queue_local_roundtrip() -> None:
+    queue = LoggerProcessQueue()
+    with pytest.raises(KeyError):
+        queue.put("message", log_level="UNKNOWN")
+    queue.put("a", LogsLevelKeys.INFO)
+    queue.put("b", LogsLevelKeys.ERROR)
+    assert queue.wait(5.0) is True
+    items = []
+    timeout = time.time() + 5
+    while len(items) < 2 and time.time() < timeout:
+        items.extend(queue.get_many())
+    assert items == [(LogsLevelKeys.INFO, "a"), (LogsLevelKeys.ERROR, "b")]
+    queue.wakeup()
+    assert queue.wait(5.0) is False
+    assert queue.get() is None
+
+
 def test_th_logger_processor_missing_engine() -> None:
     processor = ThLoggerProcessor()
     processor.logger_client = LoggerClient()
     with pytest.raises(ValueError):
         processor.run()
+
+
+def test_syslog_socket_udp_rfc5424() -> None:
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    server.settimeout(2)
+    try:
+        engine = LoggerEngineSyslogSocket(
+            name="app",
+            formatter=LogFormatterNull(),
+            transport=SysLogSocketKeys.UDP,
+            address=server.getsockname(),
+        )
+        engine.facility = "LOCAL0"
+        engine.level = "ERROR"
+        engine.send_many(["first", "second"])
+        records = [server.recv(4096).decode() for _ in range(2)]
+        engine.close()
+    finally:
+        server.close()
+    pri = SysLogKeys.facility.LOCAL0 | SysLogKeys.level.ERROR
+    assert records[0].startswith(f"<{pri}>1 ")
+    assert f" app {os.getpid()} - - " in records[0]
+    assert records[0].endswith("[app]: first")
+    assert records[1].endswith("[app]: second")
+    assert engine.dropped == 0
+
+
+def test_syslog_socket_tcp_octet_counting() -> None:
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    server.settimeout(2)
+    try:
+        engine = LoggerEngineSyslogSocket(
+            formatter=LogFormatterNull(),
+            transport=SysLogSocketKeys.TCP,
+            address=server.getsockname(),
+        )
+        engine.send_many(["alpha", "beta"])
+        conn, _ = server.accept()
+        conn.settimeout(2)
+        deadline = time.monotonic() + 2
+        while not engine.connected and time.monotonic() < deadline:
+            engine.flush()
+            time.sleep(0.01)
+        engine.send("gamma")
+        data = b""
+        while data.count(b" - - ") < 3 and time.monotonic() < deadline:
+            data += conn.recv(4096)
+        conn.close()
+        engine.close()
+    finally:
+        server.close()
+    frames = []
+    while data:
+        length, _, rest = data.partition(b" ")
+        frames.append(rest[: int(length)].decode())
+        data = rest[int(length) :]
+    assert [frame.rsplit(" ", 1)[-1] for frame in frames] == [
+        "alpha",
+        "beta",
+        "gamma",
+    ]
+
+
+def _read_tcp_frames(conn: socket.socket, count: int) -> List[str]:
+    data = b""
+    deadline = time.monotonic() + 2
+    while data.count(b" - - ") < count and time.monotonic() < deadline:
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+    frames = []
+    while data:
+        length, _, rest = data.partition(b" ")
+        frames.append(rest[: int(length)].decode().rsplit(" ", 1)[-1])
+        data = rest[int(length) :]
+    return frames
+
+
+def test_syslog_socket_tcp_close_drains_pending_frames() -> None:
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    server.settimeout(2)
+    try:
+        engine = LoggerEngineSyslogSocket(
+            formatter=LogFormatterNull(),
+            transport=SysLogSocketKeys.TCP,
+            address=server.getsockname(),
+        )
+        engine.send_many(["alpha", "beta"])
+        engine.close()
+        conn, _ = server.accept()
+        conn.settimeout(2)
+        frames = _read_tcp_frames(conn, 2)
+        conn.close()
+    finally:
+        server.close()
+    assert frames == ["alpha", "beta"]
+    assert engine.dropped == 0
+
+
+def test_syslog_socket_tcp_under_processor() -> None:
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    server.settimeout(2)
+    engine = LoggerEngine()
+    engine.add_engine(
+        LogsLevelKeys.INFO,
+        LoggerEngineSyslogSocket(
+            formatter=LogFormatterNull(),
+            transport=SysLogSocketKeys.TCP,
+            address=("localhost", server.getsockname()[1]),
+        ),
+    )
+    client = LoggerClient(engine.logs_queue)
+    processor = ThLoggerProcessor(debug=False)
+    processor.logger_engine = engine
+    processor.logger_client = client
+    processor.sleep_period = 0.05
+    processor.start()
+    try:
+        client.message("alpha")
+        client.message("beta")
+        conn, _ = server.accept()
+        conn.settimeout(2)
+        # delivered by idle flushes, without further messages
+        assert _read_tcp_frames(conn, 2) == ["alpha", "beta"]
+        client.message("gamma")
+        processor.stop()
+        processor.join(timeout=2)
+        assert _read_tcp_frames(conn, 1) == ["gamma"]
+        conn.close()
+    finally:
+        processor.stop()
+        server.close()
+
+
+def test_syslog_socket_resolves_host_off_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    real_getaddrinfo = socket.getaddrinfo
+    release = threading.Event()
+
+    def slow_getaddrinfo(host, port, *args, **kwargs):  # type: ignore
+        if host == "collector.test" and args[3:] != (socket.AI_NUMERICHOST,):
+            release.wait(2)
+            return real_getaddrinfo("127.0.0.1", port, *args[:2])
+        return real_getaddrinfo(host, port, *args, **kwargs)
+
+    monkeypatch.setattr(socket, "getaddrinfo", slow_getaddrinfo)
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(("127.0.0.1", 0))
+    server.settimeout(2)
+    try:
+        start = time.monotonic()
+        engine = LoggerEngineSyslogSocket(
+            formatter=LogFormatterNull(),
+            transport=SysLogSocketKeys.UDP,
+            address=("collector.test", server.getsockname()[1]),
+        )
+        engine.send("early")
+        assert time.monotonic() - start < 1.0
+        assert engine.dropped == 1
+        release.set()
+        deadline = time.monotonic() + 2
+        while not engine.connected and time.monotonic() < deadline:
+            engine.send("probe")
+            time.sleep(0.01)
+        engine.send("late")
+        records = []
+        while not records or not records[-1].endswith("late"):
+            records.append(server.recv(4096).decode())
+        engine.close()
+    finally:
+        server.close()
+    assert records[-1].endswith(" - - late")
+
+
+def test_syslog_socket_unix_rfc3164(tmp_path: Path) -> None:
+    path = str(tmp_path / "log.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    server.bind(path)
+    server.settimeout(2)
+    try:
+        engine = LoggerEngineSyslogSocket(
+            name="svc", formatter=LogFormatterNull(), address=path
+        )
+        engine.send("hello")
+        record = server.recv(4096).decode()
+        engine.close()
+    finally:
+        server.close()
+    assert record.startswith(f"<{SysLogKeys.facility.USER | SysLogKeys.level.INFO}>")
+    assert f" svc[{os.getpid()}]: [svc]: hello" in record
+
+
+def test_syslog_socket_unavailable_counts_drops(tmp_path: Path) -> None:
+    engine = LoggerEngineSyslogSocket(
+        formatter=LogFormatterNull(), address=str(tmp_path / "missing.sock")
+    )
+    engine.send_many(["a", "b"])
+    engine.send("c")
+    assert engine.dropped == 3
+    assert engine.connected is False
+
+
+def test_syslog_socket_invalid_configuration() -> None:
+    with pytest.raises(ValueError):
+        LoggerEngineSyslogSocket(transport="SCTP")
+    with pytest.raises(TypeError):
+        LoggerEngineSyslogSocket(transport=SysLogSocketKeys.UDP, address="/dev/log")
+    with pytest.raises(ValueError):
+        LoggerEngineSyslogSocket(rfc="RFC1")
+
+
+def test_log_record_renders_lazily_and_pickles() -> None:
+    import pickle
+
+    record = LogRecord("value=%d", LogsLevelKeys.DEBUG, "svc", (5,), {"k": 1})
+    assert record._message is None
+    assert str(record) == "[svc] value=5"
+    clone = pickle.loads(pickle.dumps(LogRecord("x=%s", args=(object(),))))
+    assert clone.message.startswith("x=<object object")
+    assert clone.args == ()
+    data = LogRecord("m", name="n", fields={"message": "shadow", "extra": 2}).to_dict()
+    assert data["message"] == "m"
+    assert data["extra"] == 2
+
+
+def test_logger_client_record_routes_to_json_and_text_engines(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    engine = LoggerEngine()
+    engine.add_engine(
+        LogsLevelKeys.INFO, LoggerEngineStdout(formatter=LogFormatterJson())
+    )
+    engine.add_engine(
+        LogsLevelKeys.INFO, LoggerEngineStderr(formatter=LogFormatterNull())
+    )
+    client = LoggerClient(queue=engine.logs_queue, name="api")
+    client.record("took %d ms", LogsLevelKeys.INFO, 12, path="/x", status=200)
+    client.message("plain", LogsLevelKeys.INFO)
+    engine.send()
+    out = capsys.readouterr()
+    lines = out.out.splitlines()
+    record = json.loads(lines[0])
+    assert record["level"] == LogsLevelKeys.INFO
+    assert record["name"] == "api"
+    assert record["message"] == "took 12 ms"
+    assert record["path"] == "/x"
+    assert record["status"] == 200
+    assert json.loads(lines[1])["message"] == "[api] plain"
+    assert out.err.splitlines() == ["[api] took 12 ms", "[api] plain"]
+
+
+def test_logger_client_record_skips_disabled_levels() -> None:
+    engine = LoggerEngine()
+    client = LoggerClient(queue=engine.logs_queue)
+    calls = []
+    client.record(lambda: calls.append(1), LogsLevelKeys.ALERT)
+    assert calls == []
+    assert len(engine.logs_queue) == 0
+    with pytest.raises(KeyError):
+        client.record("x", "NOPE")
@@ -141,6 +141,35 @@ class TestAddress(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.o.octets = {"a": 1}  # type: ignore
 
+    def test_19_hash_and_compact_storage(self) -> None:
+        """Test nr 19."""
+        ip = Address("10.0.0.5")
+        self.assertEqual(hash(ip), hash(Address([10, 0, 0, 5])))
+        self.assertEqual(len({ip, Address(167772165), Address("10.0.0.6")}), 2)
+        self.assertFalse(hasattr(ip, "__dict__"))
+        with self.assertRaises(AttributeError):
+            ip.extra = 1  # type: ignore
+
+    def test_20_non_canonical_string(self) -> None:
+        """Test nr 20."""
+        self.assertEqual(str(Address("010.001.0.1")), "10.1.0.1")
+        self.assertEqual([int(x) for x in Address("1.2.3.4").octets], [1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            Address("1.2.3.256")
+
+    def test_21_mixed_type_equality(self) -> None:
+        """Test nr 21."""
+        ip = Address("10.0.0.5")
+        self.assertFalse(ip == "10.0.0.5")
+        self.assertTrue(ip != "10.0.0.5")
+        self.assertEqual({ip: 1}.get(Address(167772165)), 1)
+        with self.assertRaises(TypeError):
+            ip < 5  # type: ignore
+        self.assertEqual(
+            sorted([Address("10.0.0.9"), ip, Address("1.2.3.4")]),
+            [Address("1.2.3.4"), ip, Address("10.0.0.9")],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
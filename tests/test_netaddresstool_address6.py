@@ -135,5 +135,11 @@ class TestAddress6(unittest.TestCase):
         original = Address6("abcd:ef12::1")
         self.assertEqual(Address6(int(original)).__str__(), str(original))
 
+    def test_20_hash_and_mixed_type_equality(self) -> None:
+        """Test nr 20."""
+        ip = Address6("abcd:ef12::1")
+        self.assertEqual(len({ip, Address6(int(ip)), Address6("::1")}), 2)
+        self.assertFalse(ip == "abcd:ef12::1")
+
 
 # #[EOF]#######################################################################
@@ -0,0 +1,70 @@
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: for testing bulk address conversion functions.
+"""
+
+import unittest
+from jsktoolbox.netaddresstool import (
+    Address,
+    Address6,
+    format_many,
+    format_many6,
+    parse_many,
+    parse_many6,
+)
+
+
+class TestBulk(unittest.TestCase):
+    """Testing bulk conversion functions."""
+
+    def test_01_parse_many(self) -> None:
+        """Test nr 1."""
+        result = parse_many(["10.0.0.1\n", " 192.168.1.254", "010.0.0.1"])
+        self.assertEqual(result.errors, [])
+        self.assertEqual(
+            list(result.values),
+            [int(Address("10.0.0.1")), int(Address("192.168.1.254")), 167772161],
+        )
+
+    def test_02_parse_many_errors(self) -> None:
+        """Test nr 2."""
+        result = parse_many(["1.2.3.4", "bad", "1.2.3.256", "4.3.2.1"])
+        self.assertEqual([row for row, _, _ in result.errors], [1, 2])
+        self.assertEqual(result.errors[0][1], "bad")
+        self.assertEqual(list(result.values), [16909060, 0, 0, 67305985])
+
+    def test_03_format_many(self) -> None:
+        """Test nr 3."""
+        lines = ["0.0.0.0", "10.20.30.40", "255.255.255.255"]
+        self.assertEqual(format_many(parse_many(lines).values), lines)
+        self.assertEqual(format_many([1, 256]), ["0.0.0.1", "0.0.1.0"])
+        with self.assertRaises(OverflowError):
+            format_many([-1])
+
+    def test_04_ipv6_roundtrip(self) -> None:
+        """Test nr 4."""
+        result = parse_many6(["fd00::1", "zz::", "2001:db8:0:0:0:0:0:1"])
+        self.assertEqual([row for row, _, _ in result.errors], [1])
+        self.assertEqual(len(result.values), 48)
+        self.assertEqual(
+            int.from_bytes(result.values[:16], "big"), int(Address6("fd00::1"))
+        )
+        self.assertEqual(format_many6(result.values), ["fd00::1", "::", "2001:db8::1"])
+        with self.assertRaises(ValueError):
+            format_many6(b"\x00" * 15)
+
+    def test_05_malformed_rows_reported(self) -> None:
+        """Test nr 5."""
+        rows = ["1.2.3.4\x00", None, b"10.0.0.1", 7, "10.0.0.1"]
+        result = parse_many(rows)  # type: ignore
+        self.assertEqual([row for row, _, _ in result.errors], [0, 1, 2, 3])
+        self.assertEqual(list(result.values), [0, 0, 0, 0, 0x0A000001])
+        result = parse_many6(["fd00::1\x00", None, "::1"])  # type: ignore
+        self.assertEqual([row for row, _, _ in result.errors], [0, 1])
+        self.assertEqual(format_many6(result.values), ["::", "::", "::1"])
+
+
+# #[EOF]#######################################################################
@@ -0,0 +1,148 @@
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: for testing IPSet and IPSet6 classes.
+"""
+
+import unittest
+from jsktoolbox.netaddresstool import (
+    Address,
+    Address6,
+    IPSet,
+    IPSet6,
+    Network,
+    Network6,
+)
+from jsktoolbox.netaddresstool.ipset import BIPSet
+
+
+class TestIPSet(unittest.TestCase):
+    """Testing IPSet class."""
+
+    def test_01_normalize(self) -> None:
+        """Test nr 1."""
+        o = IPSet(
+            [
+                "192.168.1.0/24",
+                Network("192.168.0.7/24"),
+                Address("10.0.0.1"),
+                "10.0.0.0",
+                ("10.0.0.2", 0x0A000003),
+            ]
+        )
+        self.assertEqual(
+            o.intervals, [(0x0A000000, 0x0A000003), (0xC0A80000, 0xC0A801FF)]
+        )
+        self.assertEqual(o.size, 516)
+        self.assertFalse(IPSet())
+        self.assertEqual(o, IPSet(o.collapse()))
+        self.assertEqual(hash(o), hash(IPSet(["10.0.0.0/30", "192.168.0.0/23"])))
+
+    def test_02_invalid_items(self) -> None:
+        """Test nr 2."""
+        with self.assertRaises(TypeError):
+            IPSet([1.5])
+        with self.assertRaises(ValueError):
+            IPSet([("10.0.0.9", "10.0.0.1")])
+        with self.assertRaises(ValueError):
+            IPSet([("10.0.0.0/8", "11.0.0.0")])
+        with self.assertRaises(ValueError):
+            IPSet([1 << 32])
+
+    def test_03_membership(self) -> None:
+        """Test nr 3."""
+        o = IPSet(["10.0.0.0/8", "172.16.0.0/12"])
+        self.assertIn("10.255.255.255", o)
+        self.assertIn(Address("172.31.0.1"), o)
+        self.assertIn(0x0A010203, o)
+        self.assertIn("10.1.0.0/16", o)
+        self.assertNotIn("11.0.0.0", o)
+        self.assertNotIn("172.0.0.0/8", o)
+        self.assertNotIn("not an address", o)
+        self.assertNotIn(Address6("::1"), o)
+
+    def test_04_algebra(self) -> None:
+        """Test nr 4."""
+        a = IPSet(["10.0.0.0/8"])
+        b = IPSet(["10.128.0.0/9", "11.0.0.0/8"])
+        self.assertEqual((a | b).collapse(), [Network("10.0.0.0/7")])
+        self.assertEqual((a & b).collapse(), [Network("10.128.0.0/9")])
+        self.assertEqual((a - b).collapse(), [Network("10.0.0.0/9")])
+        self.assertEqual(
+            (a ^ b).collapse(), [Network("10.0.0.0/9"), Network("11.0.0.0/8")]
+        )
+        self.assertTrue(a & b <= a)
+        self.assertTrue(a | b >= b)
+        self.assertFalse(a <= b)
+        self.assertEqual(a.union(b), a | b)
+        self.assertNotEqual(a, b)
+
+    def test_05_difference_holes(self) -> None:
+        """Test nr 5."""
+        o = IPSet(["10.0.0.0/24"]) - IPSet(["10.0.0.0", "10.0.0.128/26", "10.0.0.255"])
+        self.assertEqual(
+            [str(net) for net in o],
+            [
+                "10.0.0.1/32",
+                "10.0.0.2/31",
+                "10.0.0.4/30",
+                "10.0.0.8/29",
+                "10.0.0.16/28",
+                "10.0.0.32/27",
+                "10.0.0.64/26",
+                "10.0.0.192/27",
+                "10.0.0.224/28",
+                "10.0.0.240/29",
+                "10.0.0.248/30",
+                "10.0.0.252/31",
+                "10.0.0.254/32",
+            ],
+        )
+        self.assertEqual(o.size, 256 - 2 - 64)
+
+    def test_06_collapse_full_range(self) -> None:
+        """Test nr 6."""
+        self.assertEqual(
+            IPSet(["0.0.0.0/1", "128.0.0.0/1"]).collapse(), [Network("0.0.0.0/0")]
+        )
+        self.assertEqual(IPSet([(0, 0xFFFFFFFF)]).size, 1 << 32)
+
+    def test_07_mixed_families(self) -> None:
+        """Test nr 7."""
+        with self.assertRaises(TypeError):
+            IPSet(["10.0.0.0/8"]) | IPSet6(["::/0"])  # type: ignore
+
+    def test_08_base_class_is_abstract(self) -> None:
+        """Test nr 8."""
+        with self.assertRaises(TypeError):
+            BIPSet()  # type: ignore
+
+
+class TestIPSet6(unittest.TestCase):
+    """Testing IPSet6 class."""
+
+    def test_01_algebra(self) -> None:
+        """Test nr 1."""
+        a = IPSet6(["2001:db8::/32", "2001:db9::/32", Address6("::1")])
+        self.assertEqual(a.collapse(), [Network6("::1/128"), Network6("2001:db8::/31")])
+        b = a - IPSet6(["2001:db8::/33"])
+        self.assertEqual(
+            [str(net) for net in b],
+            ["::1/128", "2001:db8:8000::/33", "2001:db9::/32"],
+        )
+        self.assertEqual(a & IPSet6(["2001:db9:1::/48"]), IPSet6(["2001:db9:1::/48"]))
+        self.assertEqual(a.size, (1 << 97) + 1)
+
+    def test_02_membership(self) -> None:
+        """Test nr 2."""
+        o = IPSet6(["2001:db8::/32"])
+        self.assertIn("2001:db8:ffff::1", o)
+        self.assertIn("2001:db8:1::/48", o)
+        self.assertNotIn("2001:db9::", o)
+        self.assertNotIn("10.0.0.1", o)
+        self.assertEqual(IPSet6(["::/0"]).collapse(), [Network6("::/0")])
+
+
+# #[EOF]#######################################################################
@@ -112,5 +112,12 @@ class TestNetmask(unittest.TestCase):
         mask.cidr = "30"
         self.assertEqual(int(mask), 30)
 
+    def test_08_netmask_non_contiguous(self) -> None:
+        """Test nr 8."""
+        for cidr in range(33):
+            self.assertEqual(int(Netmask(str(Netmask(cidr)))), cidr)
+        with self.assertRaises(ValueError):
+            Netmask("255.0.255.0")
+
 
 # #[EOF]#######################################################################
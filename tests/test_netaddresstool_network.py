@@ -143,5 +143,22 @@ class TestNetwork(unittest.TestCase):
         first = next(iterator)
         self.assertEqual(str(first), "10.0.0.0/27")
 
+    def test_23_hash_and_ordering(self) -> None:
+        """Test nr 23."""
+        net = Network("10.0.0.7/24")
+        self.assertEqual(net, Network(["10.0.0.0", Netmask(24)]))
+        self.assertNotEqual(net, Network("10.0.0.0/25"))
+        self.assertEqual(len({net, Network("10.0.0.0/24"), Network("10.0.1.0/24")}), 2)
+        self.assertEqual(
+            [
+                str(n)
+                for n in sorted([Network("10.0.1.0/24"), Network("10.0.0.0/25"), net])
+            ],
+            ["10.0.0.0/24", "10.0.0.0/25", "10.0.1.0/24"],
+        )
+        self.assertEqual(len({Netmask(24), Netmask("255.255.255.0")}), 1)
+        self.assertTrue(Netmask(16) < Netmask(24))
+        self.assertFalse(net == "10.0.0.0/24")
+
 
 # #[EOF]#######################################################################
@@ -110,5 +110,14 @@ class TestNetwork6(unittest.TestCase):
         iterator = network.iter_hosts(limit=None)
         self.assertEqual(next(iterator), Address6("fd00::"))
 
+    def test_18_hash_and_ordering(self) -> None:
+        """Test nr 18."""
+        net = Network6("fd00::7/64")
+        self.assertEqual(net, Network6("fd00::/64"))
+        self.assertEqual(len({net, Network6("fd00::/64"), Network6("fd00::/48")}), 2)
+        self.assertTrue(Network6("fd00::/48") < net)
+        self.assertEqual(len({Prefix6(64), Prefix6("64")}), 1)
+        self.assertEqual(str(Network6("fd00::1:1234/112").min), "fd00::1:0")
+
 
 # #[EOF]#######################################################################
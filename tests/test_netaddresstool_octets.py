@@ -115,5 +115,12 @@ class TestOctet(unittest.TestCase):
         self.assertTrue(Octet(10) >= Octet(7))
         self.assertFalse(Octet(19) >= Octet(193))
 
+    def test_18_octets_hash_and_mixed_type(self) -> None:
+        """Test nr 18."""
+        self.assertEqual(len({Octet(7), Octet("7"), Octet(8)}), 2)
+        self.assertFalse(Octet(7) == 7)
+        with self.assertRaises(TypeError):
+            Octet(7) < 8  # type: ignore
+
 
 # #[EOF]#######################################################################
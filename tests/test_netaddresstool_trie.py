@@ -0,0 +1,72 @@
+# -*- coding: UTF-8 -*-
+"""
+Author:  Jacek 'Szumak' Kotlarski --<szumak@virthost.pl>
+Created: 2026-10-17
+
+Purpose: for testing PrefixTrie class.
+"""
+
+import unittest
+from jsktoolbox.netaddresstool import Address, Address6, Network, PrefixTrie
+
+
+class TestPrefixTrie(unittest.TestCase):
+    """Testing PrefixTrie class."""
+
+    def setUp(self) -> None:
+        """Set up."""
+        self.o = PrefixTrie()
+        for idx, net in enumerate(
+            ["0.0.0.0/0", "10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "10.2.0.0/16"]
+        ):
+            self.o[net] = idx
+        self.o["2001:db8::/32"] = "v6"
+
+    def test_01_exact_lookup(self) -> None:
+        """Test nr 1."""
+        self.assertEqual(len(self.o), 6)
+        self.assertEqual(self.o["10.1.0.0/16"], 2)
+        self.assertEqual(self.o[Network("10.1.7.7/16")], 2)
+        self.assertIn("10.2.0.0/16", self.o)
+        self.assertNotIn("10.3.0.0/16", self.o)
+        self.assertNotIn("10.1.0.0/17", self.o)
+        self.assertIsNone(self.o.get("10.1.0.0/17"))
+        with self.assertRaises(KeyError):
+            self.o["10.1.0.0/17"]
+
+    def test_02_longest_match(self) -> None:
+        """Test nr 2."""
+        net, value = self.o.longest_match(Address("10.1.2.3"))  # type: ignore
+        self.assertEqual((str(net), value), ("10.1.2.0/24", 3))
+        self.assertEqual(self.o.longest_match("10.1.3.1")[1], 2)  # type: ignore
+        self.assertEqual(self.o.longest_match("192.168.1.1")[1], 0)  # type: ignore
+        self.assertEqual(self.o.longest_match("10.1.0.0/20")[1], 2)  # type: ignore
+        self.assertEqual(self.o.longest_match(Address6("2001:db8::1"))[1], "v6")  # type: ignore
+        self.assertIsNone(self.o.longest_match("2001:db9::1"))
+
+    def test_03_covering_and_covered(self) -> None:
+        """Test nr 3."""
+        self.assertEqual(
+            [value for _, value in self.o.covering("10.1.2.200")], [0, 1, 2, 3]
+        )
+        self.assertEqual(
+            [str(net) for net, _ in self.o.covered("10.0.0.0/8")],
+            ["10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "10.2.0.0/16"],
+        )
+        self.assertEqual(self.o.covered("172.16.0.0/12"), [])
+
+    def test_04_delete(self) -> None:
+        """Test nr 4."""
+        del self.o["10.1.0.0/16"]
+        self.assertEqual(len(self.o), 5)
+        self.assertEqual(self.o.longest_match("10.1.3.1")[1], 1)  # type: ignore
+        self.assertEqual(self.o.longest_match("10.1.2.1")[1], 3)  # type: ignore
+        with self.assertRaises(KeyError):
+            self.o.delete("10.1.0.0/16")
+        for net in list(self.o):
+            self.o.delete(net)
+        self.assertEqual(len(self.o), 0)
+        self.assertEqual(list(self.o), [])
+
+
+# #[EOF]#######################################################################
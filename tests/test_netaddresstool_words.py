@@ -151,5 +151,10 @@ class TestWord16(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.o.value = "0xgg"
 
+    def test_23_hash_by_value(self) -> None:
+        """Test nr 23."""
+        self.assertEqual(len({Word16(1), Word16("1"), Word16(2)}), 2)
+        self.assertEqual({Word16("0xff"): 1}.get(Word16(255)), 1)
+
 
 # #[EOF]#######################################################################
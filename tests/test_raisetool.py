@@ -8,6 +8,7 @@ Purpose: Unit tests for the Raise class from the jsktoolbox.raisetool module.
 
 import unittest
 import inspect
+import pickle
 from typing import Any
 
 from jsktoolbox.raisetool import Raise
@@ -99,5 +100,28 @@ class TestRaise(unittest.TestCase):
                 with self.assertRaises(TypeError):
                     Raise.error("test message", arg)
 
+    def test_lazy_error(self) -> None:
+        """Test that Raise.lazy builds frame-free exceptions with final args."""
+        error = Raise.lazy("value %r out of %s", ValueError, "MyClass", "x", "range")
+        self.assertIs(type(error), ValueError)
+        message = "MyClass: [ValueError]: value 'x' out of range"
+        self.assertEqual(error.args, (message,))
+        self.assertEqual(repr(error), repr(ValueError(message)))
+        self.assertEqual(str(error), message)
+        self.assertEqual(
+            error.args,
+            Raise.error("value 'x' out of range", ValueError, "MyClass").args,
+        )
+        self.assertEqual(str(Raise.lazy("plain 100%")), "[Exception]: plain 100%")
+        with self.assertRaises(KeyError):
+            raise Raise.lazy("missing", KeyError)
+        restored = pickle.loads(pickle.dumps(Raise.lazy("x", TypeError, "C")))
+        self.assertIs(type(restored), TypeError)
+        self.assertEqual(str(restored), "C: [TypeError]: x")
+        for arg in ("not a type", object):
+            with self.subTest(argument=arg):
+                with self.assertRaises(TypeError):
+                    Raise.lazy("test message", arg)  # type: ignore
+
 
 # #[EOF]#######################################################################